@@ -2,22 +2,35 @@
 Chat and RAG query endpoints
 """
 import logging
+import time
 import uuid
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, Depends
+from functools import lru_cache
+
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Response
 from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from starlette.concurrency import iterate_in_threadpool
 from typing import AsyncGenerator, List
 
+try:
+    # Preferred SSE transport: handles framing, keep-alive pings, and the
+    # Cache-Control / X-Accel-Buffering headers reverse proxies need
+    from sse_starlette.sse import EventSourceResponse
+except ImportError:  # pragma: no cover - optional dependency
+    EventSourceResponse = None
+
 from app.models.chat import (
     RAGQueryRequest,
     RAGQueryResponse,
-    StreamingChunk,
     ConversationCreateRequest,
     ConversationResponse,
     ConversationHistoryResponse,
     ConversationSummary,
     ChatMessage,
 )
+from app.services.query_cache import query_cache
 from app.services.rag_service import RAGService
 from app.services.storage_service import StorageService
 
@@ -25,18 +38,48 @@ logger = logging.getLogger("document_rag_api")
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
+# Validates a whole page of conversation summaries in one pydantic-core call
+_SUMMARY_LIST_ADAPTER = TypeAdapter(List[ConversationSummary])
 
-# Dependency to get RAG service instance
-def get_rag_service() -> RAGService:
-    """Get RAG service instance"""
+# SSE flush policy: batch token deltas into one frame per N tokens or per
+# latency budget, whichever comes first, to cut per-token serializer calls
+# and socket writes during fast streams
+_SSE_BATCH_SIZE = 4
+_SSE_FLUSH_INTERVAL = 0.02
+
+# Shared headers for the StreamingResponse SSE fallback; one dict per
+# process instead of one per request
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+    "Connection": "keep-alive",
+}
+
+
+# Dependencies return process-wide singletons so each request reuses the
+# already-warm service graph (and its Azure SDK clients) instead of paying
+# construction cost per call. The dependencies themselves are async so FastAPI
+# resolves them on the event loop rather than the threadpool.
+@lru_cache(maxsize=1)
+def _rag_service_singleton() -> RAGService:
     return RAGService()
 
 
-def get_storage_service() -> StorageService:
-    """Get storage service instance"""
+@lru_cache(maxsize=1)
+def _storage_service_singleton() -> StorageService:
     return StorageService()
 
 
+async def get_rag_service() -> RAGService:
+    """Get RAG service instance"""
+    return _rag_service_singleton()
+
+
+async def get_storage_service() -> StorageService:
+    """Get storage service instance"""
+    return _storage_service_singleton()
+
+
 @router.post("/query", response_model=RAGQueryResponse)
 async def query(
     request: RAGQueryRequest,
@@ -48,9 +91,17 @@ async def query(
     Returns answer with citations and metadata
     """
     logger.info(f"Processing RAG query: question='{request.question[:50]}...' | top_k={request.top_k}")
-    
+
     try:
-        response = rag_service.query(request)
+        # Exact-match cache: identical stateless questions skip retrieval
+        # and generation entirely (single Redis GET vs. search + LLM call)
+        cached = await query_cache.get(request)
+        if cached is not None:
+            logger.info("Query cache hit: question='%s...'", request.question[:50])
+            return RAGQueryResponse.model_validate_json(cached)
+
+        response = await rag_service.aquery(request)
+        await query_cache.set(request, response.model_dump_json())
         logger.info(
             f"Query successful: answer_length={len(response.answer)} | "
             f"citations={len(response.citations)} | "
@@ -95,42 +146,57 @@ async def query_stream(
     if not request.stream:
         request.stream = True
     
-    async def generate_stream() -> AsyncGenerator[str, None]:
-        """Generate streaming response"""
+    async def generate_payloads() -> AsyncGenerator[bytes, None]:
+        """Generate SSE event payloads (JSON bytes, no framing)"""
         try:
-            # For now, return non-streaming response as single chunk
-            # In production, implement proper streaming
-            response = rag_service.query(request)
-            
-            # Send answer in chunks
-            chunk_size = 50
-            answer = response.answer
-            for i in range(0, len(answer), chunk_size):
-                chunk = answer[i:i + chunk_size]
-                chunk_data = StreamingChunk(
-                    chunk=chunk,
-                    done=False,
-                )
-                yield f"data: {chunk_data.model_dump_json()}\n\n"
-            
-            # Send final chunk with citations
-            final_chunk = StreamingChunk(
-                chunk="",
-                done=True,
-                citations=response.citations,
-            )
-            yield f"data: {final_chunk.model_dump_json()}\n\n"
-            
+            # Forward real token deltas from the LLM stream as they arrive;
+            # the blocking generator runs in the threadpool so the event loop
+            # stays free. Payloads are built with orjson directly (bytes in,
+            # bytes out) so the hot loop skips per-chunk Pydantic model
+            # construction and str->bytes encoding. Citations arrive in the
+            # final done=True event, serialized once. Token deltas are
+            # batched per the flush policy above so a fast stream does not
+            # pay one serializer call + socket write per token.
+            buffer: List[str] = []
+            last_flush = time.monotonic()
+            async for chunk in iterate_in_threadpool(
+                rag_service.query_stream(request)
+            ):
+                if chunk.get("done"):
+                    if buffer:
+                        yield orjson.dumps(
+                            {"chunk": "".join(buffer), "done": False}
+                        )
+                        buffer.clear()
+                    yield orjson.dumps(chunk)
+                    continue
+                buffer.append(chunk["chunk"])
+                now = time.monotonic()
+                if (
+                    len(buffer) >= _SSE_BATCH_SIZE
+                    or now - last_flush > _SSE_FLUSH_INTERVAL
+                ):
+                    yield orjson.dumps({"chunk": "".join(buffer), "done": False})
+                    buffer.clear()
+                    last_flush = now
+
         except Exception as e:
-            error_chunk = StreamingChunk(
-                chunk=f"Error: {str(e)}",
-                done=True,
-            )
-            yield f"data: {error_chunk.model_dump_json()}\n\n"
-    
+            yield orjson.dumps({"chunk": f"Error: {str(e)}", "done": True})
+
+    if EventSourceResponse is not None:
+        # sse-starlette frames each payload, sends periodic keep-alive pings
+        # so idle proxies don't drop the connection, and disables buffering
+        return EventSourceResponse(generate_payloads(), ping=15)
+
+    async def frame_payloads() -> AsyncGenerator[bytes, None]:
+        """Fallback: hand-rolled SSE framing over StreamingResponse"""
+        async for payload in generate_payloads():
+            yield b"data: " + payload + b"\n\n"
+
     return StreamingResponse(
-        generate_stream(),
+        frame_payloads(),
         media_type="text/event-stream",
+        headers=_SSE_HEADERS,
     )
 
 
@@ -140,25 +206,30 @@ async def create_conversation(
     storage_service: StorageService = Depends(get_storage_service),
 ):
     """Create a new conversation"""
-    conversation_id = str(uuid.uuid4())
+    # .hex skips the UUID's hyphen formatting; IDs are opaque to callers
+    conversation_id = uuid.uuid4().hex
+    # Read the clock once and reuse; the datetime object goes straight into
+    # the response (Pydantic serializes it) while storage gets the ISO string
+    now = datetime.utcnow()
+    now_iso = now.isoformat()
     conversation_data = {
         "conversation_id": conversation_id,
         "title": request.title or "New Conversation",
-        "created_at": datetime.utcnow().isoformat(),
-        "updated_at": datetime.utcnow().isoformat(),
+        "created_at": now_iso,
+        "updated_at": now_iso,
         "messages": [],
         "metadata": request.metadata,
     }
-    
+
     success = storage_service.save_conversation(conversation_id, conversation_data)
     if not success:
         raise HTTPException(status_code=500, detail="Failed to create conversation")
-    
+
     return ConversationResponse(
         conversation_id=conversation_id,
         title=conversation_data["title"],
-        created_at=datetime.fromisoformat(conversation_data["created_at"]),
-        updated_at=datetime.fromisoformat(conversation_data["updated_at"]),
+        created_at=now,
+        updated_at=now,
         message_count=0,
         metadata=request.metadata,
         messages=[],
@@ -174,31 +245,27 @@ async def get_conversation(
     conversation = storage_service.get_conversation(conversation_id)
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
-    
+
+    # Stored timestamps pass through as ISO strings; Pydantic's Rust
+    # validator parses them once instead of a Python fromisoformat
+    # round-trip followed by re-serialization
     messages = [
-        ChatMessage(
-            role=msg.get("role", "assistant"),
-            content=msg.get("content", ""),
-            timestamp=datetime.fromisoformat(msg.get("timestamp"))
-            if msg.get("timestamp")
-            else datetime.utcnow(),
-            metadata=msg.get("metadata"),
-        )
+        ChatMessage.model_validate(msg)
         for msg in conversation.get("messages", [])
     ]
 
     return ConversationResponse(
         conversation_id=conversation["conversation_id"],
         title=conversation.get("title"),
-        created_at=datetime.fromisoformat(conversation["created_at"]),
-        updated_at=datetime.fromisoformat(conversation["updated_at"]),
+        created_at=conversation["created_at"],
+        updated_at=conversation["updated_at"],
         message_count=len(messages),
         metadata=conversation.get("metadata", {}),
         messages=messages,
     )
 
 
-@router.get("/history/{conversation_id}", response_model=ConversationHistoryResponse)
+@router.get("/history/{conversation_id}")
 async def get_conversation_history(
     conversation_id: str,
     storage_service: StorageService = Depends(get_storage_service),
@@ -209,24 +276,22 @@ async def get_conversation_history(
         raise HTTPException(status_code=404, detail="Conversation not found")
 
     messages = [
-        ChatMessage(
-            role=msg.get("role", "assistant"),
-            content=msg.get("content", ""),
-            timestamp=datetime.fromisoformat(msg.get("timestamp"))
-            if msg.get("timestamp")
-            else datetime.utcnow(),
-            metadata=msg.get("metadata"),
-        )
+        ChatMessage.model_validate(msg)
         for msg in conversation.get("messages", [])
     ]
 
-    return ConversationHistoryResponse(
+    history = ConversationHistoryResponse(
         conversation_id=conversation_id,
         messages=messages,
     )
+    # Serialize once in Rust; FastAPI passes the bytes through untouched
+    return Response(
+        content=history.model_dump_json(),
+        media_type="application/json",
+    )
 
 
-@router.get("/conversations", response_model=List[ConversationSummary])
+@router.get("/conversations")
 async def list_conversations(
     limit: int = 50,
     offset: int = 0,
@@ -234,30 +299,13 @@ async def list_conversations(
 ):
     """List conversations with metadata"""
     conversations = storage_service.list_conversations(limit=limit, offset=offset)
-    summaries: List[ConversationSummary] = []
-
-    for conversation in conversations:
-        try:
-            created_at = datetime.fromisoformat(conversation["created_at"])
-        except (KeyError, ValueError):
-            created_at = datetime.utcnow()
-
-        try:
-            updated_at = datetime.fromisoformat(conversation["updated_at"])
-        except (KeyError, ValueError):
-            updated_at = created_at
-
-        metadata = conversation.get("metadata") or {}
-        summary = ConversationSummary(
-            conversation_id=conversation["conversation_id"],
-            title=conversation.get("title"),
-            created_at=created_at,
-            updated_at=updated_at,
-            message_count=conversation.get("message_count", 0),
-            metadata=metadata,
-            last_message_preview=conversation.get("last_message_preview"),
-        )
-        summaries.append(summary)
-
-    return summaries
+    # One Rust-side pass over the whole page instead of a Python loop of
+    # per-item model construction; missing timestamps are defaulted by the
+    # model's before-validator. The finished bytes go straight into the
+    # response so FastAPI does not re-encode through jsonable_encoder
+    summaries = _SUMMARY_LIST_ADAPTER.validate_python(conversations)
+    return Response(
+        content=_SUMMARY_LIST_ADAPTER.dump_json(summaries),
+        media_type="application/json",
+    )
 
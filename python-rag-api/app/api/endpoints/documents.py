@@ -1,20 +1,26 @@
 """
 Document management endpoints
 """
+import hashlib
 import logging
 import os
-import tempfile
+
+import aiofiles.tempfile
+import anyio.to_thread
+from functools import lru_cache
 from typing import List
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Response
 from fastapi.responses import FileResponse
 
 from app.models.document import (
     DocumentUploadResponse,
     DocumentListResponse,
+    DocumentSummaryListResponse,
     DocumentDeleteResponse,
     DocumentMetadata,
     DocumentStatus,
 )
+from app.services.query_cache import query_cache
 from app.services.rag_service import RAGService
 from app.services.storage_service import StorageService
 from app.utils.file_utils import (
@@ -28,18 +34,34 @@ logger = logging.getLogger("document_rag_api")
 
 router = APIRouter(prefix="/documents", tags=["documents"])
 
+# Read uploads in 1 MiB chunks to bound memory usage
+UPLOAD_CHUNK_SIZE = 1 << 20
 
-# Dependency to get RAG service instance
-def get_rag_service() -> RAGService:
-    """Get RAG service instance"""
+
+# Dependencies return process-wide singletons so each request reuses the
+# already-warm service graph (and its Azure SDK clients) instead of paying
+# construction cost per call. The dependencies themselves are async so FastAPI
+# resolves them on the event loop rather than the threadpool.
+@lru_cache(maxsize=1)
+def _rag_service_singleton() -> RAGService:
     return RAGService()
 
 
-def get_storage_service() -> StorageService:
-    """Get storage service instance"""
+@lru_cache(maxsize=1)
+def _storage_service_singleton() -> StorageService:
     return StorageService()
 
 
+async def get_rag_service() -> RAGService:
+    """Get RAG service instance"""
+    return _rag_service_singleton()
+
+
+async def get_storage_service() -> StorageService:
+    """Get storage service instance"""
+    return _storage_service_singleton()
+
+
 @router.post("/upload", response_model=DocumentUploadResponse)
 async def upload_document(
     file: UploadFile = File(...),
@@ -66,19 +88,27 @@ async def upload_document(
             }
         )
     
-    # Save uploaded file temporarily
+    # Save uploaded file temporarily, streaming in fixed-size chunks so large
+    # files never live in memory as one bytes object; the same chunks feed a
+    # rolling hasher for the document ID. Writes go through aiofiles so the
+    # event loop is never blocked on disk I/O
     tmp_file_path = None
     try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as tmp_file:
-            content = await file.read()
-            file_size = len(content)
-            tmp_file.write(content)
+        hasher = hashlib.blake2b(digest_size=16)
+        file_size = 0
+        async with aiofiles.tempfile.NamedTemporaryFile(
+            "wb", delete=False, suffix=os.path.splitext(file.filename)[1]
+        ) as tmp_file:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await tmp_file.write(chunk)
+                hasher.update(chunk)
+                file_size += len(chunk)
             tmp_file_path = tmp_file.name
-        
+
         logger.info(f"File saved temporarily: {tmp_file_path} | size={file_size} bytes")
-        
+
         # Generate document ID
-        document_id = generate_document_id(tmp_file_path, content)
+        document_id = generate_document_id(tmp_file_path, digest=hasher.hexdigest())
         logger.info(f"Generated document ID: {document_id}")
         
         # Index document
@@ -113,26 +143,48 @@ async def upload_document(
             }
         )
     finally:
-        # Clean up temporary file
+        # Clean up temporary file (unlink is a blocking syscall, so run it
+        # in the threadpool)
         if tmp_file_path and os.path.exists(tmp_file_path):
             try:
-                os.unlink(tmp_file_path)
+                await anyio.to_thread.run_sync(os.unlink, tmp_file_path)
                 logger.debug(f"Temporary file deleted: {tmp_file_path}")
             except Exception as e:
                 logger.warning(f"Failed to delete temporary file {tmp_file_path}: {e}")
 
 
-@router.get("", response_model=DocumentListResponse)
+@router.get("")
 async def list_documents(
     limit: int = 100,
     offset: int = 0,
+    full: bool = False,
     storage_service: StorageService = Depends(get_storage_service),
 ):
-    """List all indexed documents"""
-    documents = storage_service.list_documents(limit=limit, offset=offset)
-    return DocumentListResponse(
-        documents=documents,
-        total=len(documents),
+    """List all indexed documents
+
+    Returns lightweight summaries by default; pass full=true for the
+    complete metadata records.
+    """
+    if full:
+        documents = await storage_service.list_documents_async(
+            limit=limit, offset=offset
+        )
+        listing = DocumentListResponse(
+            documents=documents,
+            total=len(documents),
+        )
+    else:
+        summaries = storage_service.list_documents_summary(
+            limit=limit, offset=offset
+        )
+        listing = DocumentSummaryListResponse(
+            documents=summaries,
+            total=len(summaries),
+        )
+    # Serialize once in Rust; FastAPI passes the bytes through untouched
+    return Response(
+        content=listing.model_dump_json(),
+        media_type="application/json",
     )
 
 
@@ -158,7 +210,10 @@ async def delete_document(
     success = rag_service.delete_document(document_id)
     if not success:
         raise HTTPException(status_code=500, detail="Failed to delete document")
-    
+
+    # Cached answers may cite the deleted document; invalidate them
+    await query_cache.invalidate_all()
+
     return DocumentDeleteResponse(
         document_id=document_id,
         deleted=True,
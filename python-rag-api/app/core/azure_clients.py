@@ -1,92 +1,225 @@
 """
 Azure SDK client initialization and management
 """
+from functools import cached_property
 from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
 from azure.core.credentials import AzureKeyCredential
+from azure.core.pipeline.transport import RequestsTransport
 from azure.search.documents import SearchClient
+from azure.search.documents.indexes import SearchIndexClient
 from azure.storage.blob import BlobServiceClient
 from azure.cosmos import CosmosClient
 from azure.cosmos.database import DatabaseProxy
 from azure.cosmos.container import ContainerProxy
 
+try:
+    # Async SDK variants need an async HTTP transport (aiohttp); keep them
+    # optional so the sync-only deployment still imports cleanly
+    from azure.search.documents.aio import SearchClient as AsyncSearchClient
+    from azure.storage.blob.aio import BlobServiceClient as AsyncBlobServiceClient
+    from azure.cosmos.aio import CosmosClient as AsyncCosmosClient
+except ImportError:  # pragma: no cover - optional dependency
+    AsyncSearchClient = None
+    AsyncBlobServiceClient = None
+    AsyncCosmosClient = None
+
 from app.core.config import settings
 
 
+# Block-blob transfer tuning shared by the storage clients: files up to
+# 64 MiB go up in one PUT, larger ones are staged as 50 MiB blocks that
+# upload_blob(max_concurrency=N) pushes in parallel; downloads fetch
+# 16 MiB byte ranges so download_blob(max_concurrency=N) can issue
+# parallel ranged GETs
+_BLOB_TRANSFER_KWARGS = {
+    "max_block_size": 50 * 1024 * 1024,
+    "max_single_put_size": 64 * 1024 * 1024,
+    "max_chunk_get_size": 16 * 1024 * 1024,
+}
+
+
 class AzureClients:
-    """Manages Azure service clients"""
-    
-    def __init__(self):
-        self._search_client: Optional[SearchClient] = None
-        self._blob_client: Optional[BlobServiceClient] = None
-        self._cosmos_client: Optional[CosmosClient] = None
-        self._cosmos_database: Optional[DatabaseProxy] = None
-        self._documents_container: Optional[ContainerProxy] = None
-        self._conversations_container: Optional[ContainerProxy] = None
-    
-    @property
+    """Manages Azure service clients
+
+    Clients are created lazily on first access and memoized via
+    cached_property, so repeated accesses on the request path are plain
+    attribute lookups with no branch.
+    """
+
+    @cached_property
+    def transport(self) -> RequestsTransport:
+        """Shared sync HTTP transport for the Azure SDK clients
+
+        One requests.Session behind every sync client means the TCP/TLS
+        connection pool is shared process-wide: back-to-back calls to
+        Search, Blob, and Cosmos reuse warm connections instead of
+        re-handshaking. session_owner=False stops any one client's
+        close() from tearing the pool down for the others.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return RequestsTransport(session=session, session_owner=False)
+
+    @cached_property
     def search_client(self) -> Optional[SearchClient]:
         """Get Azure AI Search client"""
-        if self._search_client is None and settings.azure_search_endpoint and settings.azure_search_api_key:
-            self._search_client = SearchClient(
+        if settings.azure_search_endpoint and settings.azure_search_api_key:
+            return SearchClient(
                 endpoint=settings.azure_search_endpoint,
                 index_name=settings.azure_search_index_name,
-                credential=AzureKeyCredential(settings.azure_search_api_key)
+                credential=AzureKeyCredential(settings.azure_search_api_key),
+                transport=self.transport,
+            )
+        return None
+
+    @cached_property
+    def search_index_client(self) -> Optional[SearchIndexClient]:
+        """Get Azure AI Search index-management client"""
+        if settings.azure_search_endpoint and settings.azure_search_api_key:
+            return SearchIndexClient(
+                endpoint=settings.azure_search_endpoint,
+                credential=AzureKeyCredential(settings.azure_search_api_key),
+                transport=self.transport,
             )
-        return self._search_client
-    
-    @property
+        return None
+
+    @cached_property
     def blob_client(self) -> Optional[BlobServiceClient]:
         """Get Azure Blob Storage client"""
-        if self._blob_client is None:
-            if settings.azure_storage_connection_string:
-                self._blob_client = BlobServiceClient.from_connection_string(
-                    settings.azure_storage_connection_string
-                )
-            elif settings.azure_storage_account_name and settings.azure_storage_account_key:
-                account_url = f"https://{settings.azure_storage_account_name}.blob.core.windows.net"
-                self._blob_client = BlobServiceClient(
-                    account_url=account_url,
-                    credential=AzureKeyCredential(settings.azure_storage_account_key)
-                )
-        return self._blob_client
-    
-    @property
+        if settings.azure_storage_connection_string:
+            return BlobServiceClient.from_connection_string(
+                settings.azure_storage_connection_string,
+                transport=self.transport,
+                **_BLOB_TRANSFER_KWARGS,
+            )
+        if settings.azure_storage_account_name and settings.azure_storage_account_key:
+            account_url = f"https://{settings.azure_storage_account_name}.blob.core.windows.net"
+            return BlobServiceClient(
+                account_url=account_url,
+                credential=AzureKeyCredential(settings.azure_storage_account_key),
+                transport=self.transport,
+                **_BLOB_TRANSFER_KWARGS,
+            )
+        return None
+
+    @cached_property
     def cosmos_client(self) -> Optional[CosmosClient]:
         """Get Azure Cosmos DB client"""
-        if self._cosmos_client is None and settings.azure_cosmos_endpoint and settings.azure_cosmos_key:
-            self._cosmos_client = CosmosClient(
+        if settings.azure_cosmos_endpoint and settings.azure_cosmos_key:
+            return CosmosClient(
                 url=settings.azure_cosmos_endpoint,
-                credential=settings.azure_cosmos_key
+                credential=settings.azure_cosmos_key,
+                transport=self.transport,
             )
-        return self._cosmos_client
-    
-    @property
+        return None
+
+    @cached_property
     def cosmos_database(self) -> Optional[DatabaseProxy]:
         """Get Cosmos DB database"""
-        if self._cosmos_database is None and self.cosmos_client:
-            self._cosmos_database = self.cosmos_client.get_database_client(
+        if self.cosmos_client:
+            return self.cosmos_client.get_database_client(
                 settings.azure_cosmos_database_name
             )
-        return self._cosmos_database
-    
-    @property
+        return None
+
+    @cached_property
     def documents_container(self) -> Optional[ContainerProxy]:
         """Get Cosmos DB documents container"""
-        if self._documents_container is None and self.cosmos_database:
-            self._documents_container = self.cosmos_database.get_container_client(
+        if self.cosmos_database:
+            return self.cosmos_database.get_container_client(
                 settings.azure_cosmos_container_documents
             )
-        return self._documents_container
-    
-    @property
+        return None
+
+    @cached_property
     def conversations_container(self) -> Optional[ContainerProxy]:
         """Get Cosmos DB conversations container"""
-        if self._conversations_container is None and self.cosmos_database:
-            self._conversations_container = self.cosmos_database.get_container_client(
+        if self.cosmos_database:
+            return self.cosmos_database.get_container_client(
                 settings.azure_cosmos_container_conversations
             )
-        return self._conversations_container
-    
+        return None
+
+    @cached_property
+    def messages_container(self) -> Optional[ContainerProxy]:
+        """Get Cosmos DB per-message container (optional)"""
+        if self.cosmos_database and settings.azure_cosmos_container_messages:
+            return self.cosmos_database.get_container_client(
+                settings.azure_cosmos_container_messages
+            )
+        return None
+
+    @cached_property
+    def search_client_async(self):
+        """Get async Azure AI Search client (network waits become awaits)"""
+        if (
+            AsyncSearchClient is not None
+            and settings.azure_search_endpoint
+            and settings.azure_search_api_key
+        ):
+            return AsyncSearchClient(
+                endpoint=settings.azure_search_endpoint,
+                index_name=settings.azure_search_index_name,
+                credential=AzureKeyCredential(settings.azure_search_api_key)
+            )
+        return None
+
+    @cached_property
+    def blob_client_async(self):
+        """Get async Azure Blob Storage client"""
+        if AsyncBlobServiceClient is None:
+            return None
+        if settings.azure_storage_connection_string:
+            return AsyncBlobServiceClient.from_connection_string(
+                settings.azure_storage_connection_string,
+                **_BLOB_TRANSFER_KWARGS,
+            )
+        if settings.azure_storage_account_name and settings.azure_storage_account_key:
+            account_url = f"https://{settings.azure_storage_account_name}.blob.core.windows.net"
+            return AsyncBlobServiceClient(
+                account_url=account_url,
+                credential=AzureKeyCredential(settings.azure_storage_account_key),
+                **_BLOB_TRANSFER_KWARGS,
+            )
+        return None
+
+    @cached_property
+    def cosmos_client_async(self):
+        """Get async Azure Cosmos DB client"""
+        if (
+            AsyncCosmosClient is not None
+            and settings.azure_cosmos_endpoint
+            and settings.azure_cosmos_key
+        ):
+            return AsyncCosmosClient(
+                url=settings.azure_cosmos_endpoint,
+                credential=settings.azure_cosmos_key
+            )
+        return None
+
+    @cached_property
+    def documents_container_async(self):
+        """Get async Cosmos DB documents container"""
+        if self.cosmos_client_async:
+            return self.cosmos_client_async.get_database_client(
+                settings.azure_cosmos_database_name
+            ).get_container_client(settings.azure_cosmos_container_documents)
+        return None
+
+    @cached_property
+    def conversations_container_async(self):
+        """Get async Cosmos DB conversations container"""
+        if self.cosmos_client_async:
+            return self.cosmos_client_async.get_database_client(
+                settings.azure_cosmos_database_name
+            ).get_container_client(settings.azure_cosmos_container_conversations)
+        return None
+
     def is_azure_configured(self) -> bool:
         """Check if Azure services are configured"""
         return (
@@ -98,4 +231,3 @@ class AzureClients:
 
 # Global Azure clients instance
 azure_clients = AzureClients()
-
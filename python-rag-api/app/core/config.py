@@ -2,6 +2,7 @@
 Application configuration using Pydantic settings
 """
 import os
+from functools import cached_property, lru_cache
 from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -39,6 +40,8 @@ class Settings(BaseSettings):
     azure_storage_account_key: Optional[str] = None
     azure_storage_connection_string: Optional[str] = None
     azure_storage_container_name: str = "documents"
+    blob_upload_concurrency: int = 8  # parallel block stages per upload
+    blob_download_concurrency: int = 8  # parallel ranged GETs per download
     
     # Azure Cosmos DB Configuration
     azure_cosmos_endpoint: Optional[str] = None
@@ -46,6 +49,9 @@ class Settings(BaseSettings):
     azure_cosmos_database_name: str = "rag-db"
     azure_cosmos_container_documents: str = "documents"
     azure_cosmos_container_conversations: str = "conversations"
+    # Per-message container (partition key /conversation_id); empty
+    # string keeps messages embedded in the conversation document
+    azure_cosmos_container_messages: str = ""
     
     # RAG Configuration
     chunk_size: int = 1000
@@ -53,10 +59,42 @@ class Settings(BaseSettings):
     top_k_default: int = 5
     temperature_default: float = 0.3
     max_tokens: int = 2000
+
+    # Cost Estimation (USD per 1K tokens; update when pricing changes)
+    embedding_price_per_1k: float = 0.00013
+    llm_input_price_per_1k: float = 0.03
+    llm_output_price_per_1k: float = 0.06
+    est_tokens_per_chunk: int = 512
     
     # Vector Store Configuration
     vector_store_type: str = "chroma"  # Options: "chroma", "azure_search"
     chroma_persist_directory: str = "./chroma_db"
+    chroma_batch_size: int = 128  # Documents per Chroma insert batch
+    # Maintain a float16 sidecar matrix (emb.f16/emb.ids) next to the
+    # Chroma store so similarity_search_fast can brute-force exact
+    # top-k with one blocked matvec instead of HNSW
+    chroma_sidecar_enabled: bool = False
+    embedding_cache_path: str = "./embedding_cache.db"  # Empty disables
+    vector_quantization: Optional[str] = None  # Options: None, "int8"
+    # In-process hot tier for Azure Search: chunks whose exact cosine to
+    # the query clears the threshold are kept in memory and served
+    # without a search round-trip. 0 disables.
+    vector_hot_tier_size: int = 0
+    vector_hot_tier_threshold: float = 0.85
+    # Semantic query cache: a search whose embedding is within this
+    # cosine of a cached query reuses its result set, catching
+    # rephrasings that exact-key caches miss. 0 entries disables.
+    semantic_query_cache_size: int = 1024
+    semantic_query_cache_threshold: float = 0.97
+    # Centroid gate for Chroma: queries whose cosine to the collection's
+    # unit centroid falls below the threshold return no results without
+    # running HNSW at all. 0 disables.
+    centroid_gate_threshold: float = 0.0
+    azure_upload_concurrency: int = 4  # Parallel Azure Search upload batches
+
+    # Query Cache Configuration (disabled unless Redis is configured)
+    redis_url: Optional[str] = None
+    query_cache_ttl_seconds: int = 300
     
     # CORS Configuration
     cors_origins: list[str] = ["*"]
@@ -74,8 +112,9 @@ class Settings(BaseSettings):
         extra="ignore"
     )
     
-    def get_openai_config(self) -> dict:
-        """Get OpenAI configuration (Azure or standard)"""
+    @cached_property
+    def openai_config(self) -> dict:
+        """OpenAI configuration (Azure or standard), built once per instance"""
         if self.azure_openai_endpoint and self.azure_openai_api_key:
             chat_api_version = (
                 self.azure_openai_chat_api_version or self.azure_openai_api_version
@@ -98,8 +137,9 @@ class Settings(BaseSettings):
                 "Set AZURE_OPENAI_API_KEY or OPENAI_API_KEY environment variable."
             )
     
-    def get_embedding_config(self) -> dict:
-        """Get embedding configuration"""
+    @cached_property
+    def embedding_config(self) -> dict:
+        """Embedding configuration, built once per instance"""
         if self.azure_openai_endpoint and self.azure_openai_api_key:
             embedding_api_version = (
                 self.azure_openai_embedding_api_version
@@ -121,7 +161,55 @@ class Settings(BaseSettings):
                 "Either Azure OpenAI or OpenAI API key must be configured for embeddings."
             )
 
+    @classmethod
+    def load(cls, bypass: Optional[bool] = None) -> "Settings":
+        """
+        Build Settings, optionally skipping Pydantic validation
+
+        When SETTINGS_BYPASS_VALIDATORS=1 (or bypass=True), field values are
+        pulled straight from the environment and assembled with
+        model_construct, skipping the per-field validator dispatch. Only use
+        this on warm containers where the environment is already known-good:
+        values arrive uncoerced, so a malformed variable surfaces at use time
+        instead of start time.
+        """
+        if bypass is None:
+            bypass = os.getenv("SETTINGS_BYPASS_VALIDATORS") == "1"
+        if not bypass:
+            return cls()
+
+        values = {}
+        for name in cls.model_fields:
+            env_value = os.getenv(name) or os.getenv(name.upper())
+            if env_value is not None:
+                values[name] = env_value
+        return cls.model_construct(**values)
+
+    def get_openai_config(self) -> dict:
+        """Get OpenAI configuration (Azure or standard)"""
+        return self.openai_config
+
+    def get_embedding_config(self) -> dict:
+        """Get embedding configuration"""
+        return self.embedding_config
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance (parses .env exactly once)"""
+    return Settings.load()
+
+
+def __getattr__(name: str):
+    """Lazy module attribute (PEP 562): build Settings on first access
 
-# Global settings instance
-settings = Settings()
+    'from app.core.config import settings' keeps working everywhere, but
+    .env parsing and validation are deferred until something actually
+    touches the settings instead of running at import of this module.
+    """
+    if name == "settings":
+        value = get_settings()
+        globals()["settings"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
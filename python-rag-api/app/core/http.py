@@ -0,0 +1,34 @@
+"""
+Shared HTTP clients for outbound API calls
+
+One process-wide connection pool (with HTTP/2 when the h2 package is
+installed) means the embeddings and chat clients reuse TCP+TLS sessions
+instead of handshaking per call, and concurrent requests multiplex on
+one connection.
+"""
+from functools import lru_cache
+
+import httpx
+
+try:
+    import h2  # noqa: F401 - probe only; httpx needs it for http2=True
+
+    _HTTP2 = True
+except ImportError:  # pragma: no cover - optional dependency
+    _HTTP2 = False
+
+
+_LIMITS = httpx.Limits(max_keepalive_connections=64, max_connections=128)
+_TIMEOUT = 30.0
+
+
+@lru_cache(maxsize=1)
+def get_shared_http_client() -> httpx.Client:
+    """Return the process-wide sync HTTP client"""
+    return httpx.Client(http2=_HTTP2, timeout=_TIMEOUT, limits=_LIMITS)
+
+
+@lru_cache(maxsize=1)
+def get_shared_async_http_client() -> httpx.AsyncClient:
+    """Return the process-wide async HTTP client"""
+    return httpx.AsyncClient(http2=_HTTP2, timeout=_TIMEOUT, limits=_LIMITS)
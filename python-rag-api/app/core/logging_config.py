@@ -1,22 +1,38 @@
 """
 Logging configuration for the application
 """
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Callable
 from fastapi import Request, Response
 from fastapi.routing import APIRoute
 import time
 
-# Configure root logger
+# Configure root logger. Records go through an unbounded in-memory queue
+# and a QueueListener thread does the formatting and stream write, so a
+# logger call on the request path is just an enqueue — it never blocks on
+# stdout I/O.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+_stream_handler = logging.StreamHandler(sys.stdout)
+_stream_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+)
+
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     handlers=[
-        logging.StreamHandler(sys.stdout),
+        QueueHandler(_log_queue),
     ],
 )
 
+_listener = QueueListener(_log_queue, _stream_handler, respect_handler_level=True)
+_listener.start()
+atexit.register(_listener.stop)
+
 # Reduce noise from Azure SDK loggers
 for noisy_logger in [
     "azure",
@@ -30,6 +46,18 @@ for noisy_logger in [
 logger = logging.getLogger("document_rag_api")
 
 
+class _LazyQueryParams:
+    """Defers query-param stringification until a log handler consumes it"""
+
+    __slots__ = ("_params",)
+
+    def __init__(self, params):
+        self._params = params
+
+    def __str__(self) -> str:
+        return str(dict(self._params))
+
+
 class LoggingRouteHandler(APIRoute):
     """Custom route handler that logs requests and responses"""
     
@@ -37,38 +65,48 @@ class LoggingRouteHandler(APIRoute):
         original_route_handler = super().get_route_handler()
         
         async def custom_route_handler(request: Request) -> Response:
-            # Log request
-            start_time = time.time()
+            # Log request (perf_counter is monotonic, so elapsed time can't
+            # go negative on NTP clock adjustments)
+            start_time = time.perf_counter()
             client_ip = request.client.host if request.client else "unknown"
             
-            # Log request details (without consuming body to avoid issues)
+            # Log request details (without consuming body to avoid issues).
+            # %-style args + the lazy wrapper mean no strings or dict copies
+            # are built when the log level filters the record out
             logger.info(
-                f"Request: {request.method} {request.url.path} | "
-                f"Client: {client_ip} | "
-                f"Query params: {dict(request.query_params)}"
+                "Request: %s %s | Client: %s | Query params: %s",
+                request.method,
+                request.url.path,
+                client_ip,
+                _LazyQueryParams(request.query_params),
             )
-            
+
             # Process request
             try:
                 response = await original_route_handler(request)
-                
+
                 # Log successful response
-                process_time = time.time() - start_time
+                process_time = time.perf_counter() - start_time
                 logger.info(
-                    f"Response: {request.method} {request.url.path} | "
-                    f"Status: {response.status_code} | "
-                    f"Time: {process_time:.3f}s"
+                    "Response: %s %s | Status: %s | Time: %.3fs",
+                    request.method,
+                    request.url.path,
+                    response.status_code,
+                    process_time,
                 )
-                
+
                 return response
             except Exception as e:
                 # Log error with full details
-                process_time = time.time() - start_time
+                process_time = time.perf_counter() - start_time
                 logger.error(
-                    f"Error: {request.method} {request.url.path} | "
-                    f"Client: {client_ip} | "
-                    f"Error: {type(e).__name__}: {str(e)} | "
-                    f"Time: {process_time:.3f}s",
+                    "Error: %s %s | Client: %s | Error: %s: %s | Time: %.3fs",
+                    request.method,
+                    request.url.path,
+                    client_ip,
+                    type(e).__name__,
+                    e,
+                    process_time,
                     exc_info=True,  # Include full traceback
                 )
                 raise
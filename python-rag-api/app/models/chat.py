@@ -2,14 +2,18 @@
 Chat and RAG query models and schemas
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, model_validator
 
 
 class Citation(BaseModel):
     """Source citation with metadata"""
 
+    # Citations are built once and never mutated; frozen skips pydantic's
+    # assignment bookkeeping on the hot citation-assembly path
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     number: int = Field(..., description="Citation number")
     document_id: str = Field(..., description="Source document ID")
     document_name: str = Field(..., description="Source document filename")
@@ -19,13 +23,20 @@ class Citation(BaseModel):
     score: float = Field(..., description="Relevance score (0-1)")
 
 
+# Batch-validates citation dicts in one pydantic-core call instead of one
+# model construction per item
+CITATION_LIST_ADAPTER = TypeAdapter(List[Citation])
+
+
 class ChatMessage(BaseModel):
     """Chat message in conversation"""
 
     role: str = Field(..., description="Message role: user, assistant, or system")
     content: str = Field(..., description="Message content")
     timestamp: datetime = Field(
-        default_factory=datetime.now, description="Message timestamp"
+        # UTC now skips the local-tz lookup that datetime.now() does
+        default_factory=lambda: datetime.now(timezone.utc),
+        description="Message timestamp",
     )
     metadata: Optional[Dict[str, Any]] = Field(
         default=None, description="Optional metadata (citations, etc.)"
@@ -144,6 +155,19 @@ class ConversationSummary(BaseModel):
         None, description="Preview of the latest message"
     )
 
+    @model_validator(mode="before")
+    @classmethod
+    def _fill_missing_timestamps(cls, data: Any) -> Any:
+        """Default missing timestamps so stored rows validate in one pass"""
+        if isinstance(data, dict):
+            if not data.get("created_at"):
+                data = {**data, "created_at": datetime.utcnow()}
+            if not data.get("updated_at"):
+                data = {**data, "updated_at": data["created_at"]}
+            if data.get("metadata") is None:
+                data = {**data, "metadata": {}}
+        return data
+
 
 class ConversationHistoryResponse(BaseModel):
     """Conversation history payload"""
@@ -2,9 +2,10 @@
 Document models and schemas
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from pydantic.dataclasses import dataclass as pydantic_dataclass
 from enum import Enum
 
 
@@ -25,7 +26,9 @@ class DocumentMetadata(BaseModel):
     file_type: str = Field(..., description="File extension (pdf, docx, txt, md)")
     file_size: int = Field(..., description="File size in bytes")
     upload_time: datetime = Field(
-        default_factory=datetime.now, description="Upload timestamp"
+        # UTC now skips the local-tz lookup that datetime.now() does
+        default_factory=lambda: datetime.now(timezone.utc),
+        description="Upload timestamp",
     )
     indexed_at: Optional[datetime] = Field(None, description="Indexing completion time")
     status: DocumentStatus = Field(
@@ -41,21 +44,56 @@ class DocumentMetadata(BaseModel):
     )
 
 
-class DocumentChunk(BaseModel):
+# Reusable adapters for validating stored metadata records: built once at
+# import so per-call validation runs straight in pydantic-core instead of
+# rebuilding schemas, and the list adapter validates a whole result set in
+# a single Rust call
+DOCUMENT_METADATA_ADAPTER = TypeAdapter(DocumentMetadata)
+DOCUMENT_METADATA_LIST_ADAPTER = TypeAdapter(List[DocumentMetadata])
+
+
+# DocumentChunk is an internal between-services record, not an API
+# response model, so it can be a slotted frozen dataclass: no per-instance
+# __dict__ (~100 bytes saved per chunk, created in bulk during ingestion)
+# and no mutation tracking
+@pydantic_dataclass(frozen=True, slots=True, config=ConfigDict(extra="ignore"))
+class DocumentChunk:
     """Document chunk with metadata"""
 
     chunk_id: str = Field(..., description="Unique chunk identifier")
     document_id: str = Field(..., description="Parent document ID")
     content: str = Field(..., description="Chunk text content")
-    page_number: Optional[int] = Field(None, description="Page number if available")
     chunk_index: int = Field(..., description="Chunk index within document")
     chunk_size: int = Field(..., description="Character count")
+    page_number: Optional[int] = Field(None, description="Page number if available")
     embedding: Optional[List[float]] = Field(None, description="Embedding vector")
+    embedding_q: Optional[bytes] = Field(
+        None, description="int8-quantized embedding vector"
+    )
+    embedding_scale: Optional[float] = Field(
+        None, description="Dequantization scale for embedding_q"
+    )
     metadata: Dict[str, Any] = Field(
         default_factory=dict, description="Additional chunk metadata"
     )
 
 
+class DocumentSummary(BaseModel):
+    """Projection of DocumentMetadata for list views
+
+    Only the fields the listing UI shows; the stores can project these
+    server-side instead of shipping and validating full records.
+    """
+
+    document_id: str
+    filename: str
+    file_type: str
+    file_size: int
+    upload_time: datetime
+    status: DocumentStatus
+    chunk_count: int = 0
+
+
 class DocumentUploadResponse(BaseModel):
     """Response for document upload"""
 
@@ -73,6 +111,13 @@ class DocumentListResponse(BaseModel):
     total: int
 
 
+class DocumentSummaryListResponse(BaseModel):
+    """Response for the summary document listing"""
+
+    documents: List[DocumentSummary]
+    total: int
+
+
 class DocumentDeleteResponse(BaseModel):
     """Response for document deletion"""
 
@@ -2,12 +2,22 @@
 Embedding service - handles text embeddings using OpenAI/Azure OpenAI
 """
 
+import asyncio
+import hashlib
 import os
+import sqlite3
+import threading
 import warnings
-from typing import List, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+import numpy as np
 from langchain_openai import OpenAIEmbeddings, AzureOpenAIEmbeddings
+from openai import AsyncAzureOpenAI, AsyncOpenAI
 
 from app.core.config import settings
+from app.core.http import get_shared_http_client, get_shared_async_http_client
 
 
 # Disable telemetry
@@ -15,9 +25,167 @@ os.environ["ANONYMIZED_TELEMETRY"] = "False"
 warnings.filterwarnings("ignore", message=".*telemetry.*")
 
 
+# Output dimension is a static property of the embedding model; knowing
+# it up front saves callers a remote "probe" embedding round-trip
+_MODEL_DIMENSIONS = {
+    "text-embedding-ada-002": 1536,
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+}
+
+
+@lru_cache(maxsize=4)
+def _build_embeddings(
+    azure_endpoint: Optional[str],
+    azure_api_key: Optional[str],
+    api_version: Optional[str],
+    azure_deployment: Optional[str],
+    openai_api_key: Optional[str],
+    model: Optional[str],
+):
+    """
+    Build (once per config) the langchain embeddings client
+
+    Constructing the client sets up an HTTPX pool and validates config;
+    caching on the config tuple means every EmbeddingService instance
+    with the same settings shares one client and its keep-alive
+    connections.
+    """
+    if azure_endpoint:
+        return AzureOpenAIEmbeddings(
+            api_key=azure_api_key,
+            azure_endpoint=azure_endpoint,
+            azure_deployment=azure_deployment,
+            api_version=api_version,
+            http_client=get_shared_http_client(),
+        )
+    return OpenAIEmbeddings(
+        openai_api_key=openai_api_key,
+        model=model,
+        http_client=get_shared_http_client(),
+    )
+
+
+class _PersistentEmbeddingCache:
+    """SQLite-backed cache of document embeddings
+
+    Keyed on (content hash, provider, model), so re-indexing an unchanged
+    corpus skips the embedding API entirely — the dominant cost of
+    ingestion. Vectors are stored int8-quantized with a per-row scale,
+    4x smaller than float32 with <1% cosine drift (the vectors only feed
+    approximate nearest-neighbour search anyway).
+    """
+
+    def __init__(self, db_path: str):
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                hash TEXT NOT NULL,
+                provider TEXT NOT NULL,
+                model TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                scale REAL NOT NULL DEFAULT 0.0,
+                PRIMARY KEY (hash, provider, model)
+            )
+            """
+        )
+        # Migrate caches written before quantization: those rows are
+        # float32-encoded and unreadable under the int8 decode, so add
+        # the column and drop them (they repopulate on the next ingest)
+        columns = {
+            row[1]
+            for row in self._conn.execute("PRAGMA table_info(embedding_cache)")
+        }
+        if "scale" not in columns:
+            self._conn.execute(
+                "ALTER TABLE embedding_cache ADD COLUMN scale REAL NOT NULL DEFAULT 0.0"
+            )
+            self._conn.execute("DELETE FROM embedding_cache")
+        self._conn.commit()
+
+    def get_many(
+        self, hashes: List[str], provider: str, model: str
+    ) -> Dict[str, np.ndarray]:
+        """Fetch cached vectors for the given content hashes"""
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            # SQLite caps bound parameters per statement; chunk the IN list
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT hash, vector, scale FROM embedding_cache "
+                    f"WHERE provider = ? AND model = ? AND hash IN ({placeholders})",
+                    [provider, model, *chunk],
+                ).fetchall()
+                for content_hash, blob, scale in rows:
+                    found[content_hash] = (
+                        np.frombuffer(blob, dtype=np.int8).astype(np.float32)
+                        * scale
+                    )
+        return found
+
+    def put_many(
+        self, rows: List[tuple], provider: str, model: str
+    ) -> None:
+        """Store (hash, vector) pairs; vectors are float32 arrays"""
+        if not rows:
+            return
+        vectors = np.asarray([vector for _, vector in rows], dtype=np.float32)
+        quantized, scales = EmbeddingService.quantize_int8(vectors)
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache "
+                "(hash, provider, model, vector, scale) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        content_hash,
+                        provider,
+                        model,
+                        quantized[idx].tobytes(),
+                        float(scales[idx]),
+                    )
+                    for idx, (content_hash, _) in enumerate(rows)
+                ],
+            )
+            self._conn.commit()
+
+
+@lru_cache(maxsize=4)
+def _get_embedding_cache(db_path: str) -> _PersistentEmbeddingCache:
+    """Build (once per path) the shared persistent embedding cache"""
+    return _PersistentEmbeddingCache(db_path)
+
+
 class EmbeddingService:
     """Handles text embeddings"""
 
+    # Shared across instances so the HTTPX connection pool (and its
+    # keep-alive TLS sessions) is reused for all async embedding calls
+    _async_client = None
+    _async_model: Optional[str] = None
+
+    # Texts per embeddings request / concurrent in-flight requests
+    ASYNC_BATCH_SIZE = 256
+    ASYNC_MAX_CONCURRENCY = 8
+
+    # Query-embedding cache: repeated questions skip the API round-trip
+    # entirely (~50-150 ms each). Shared across instances, keyed by
+    # model + normalized-text hash, evicted LRU.
+    EMBED_CACHE_MAXSIZE = 4096
+    _embed_cache: "OrderedDict[bytes, List[float]]" = OrderedDict()
+    # Guards the get/move-to-end and insert/evict pairs: the cache is
+    # shared across threadpool workers, and an eviction landing between
+    # a hit and its LRU touch would raise KeyError
+    _embed_cache_lock = threading.Lock()
+
     def __init__(self, embedding_model: Optional[str] = None):
         """
         Initialize embedding service
@@ -30,45 +198,242 @@ class EmbeddingService:
         # Get configuration
         embedding_config = settings.get_embedding_config()
 
-        # Initialize embeddings
-        if embedding_config.get("azure_endpoint"):
-            # Azure OpenAI
-            self.embeddings = AzureOpenAIEmbeddings(
-                api_key=embedding_config["azure_api_key"],
-                azure_endpoint=embedding_config["azure_endpoint"],
-                azure_deployment=embedding_config["azure_deployment"],
-                api_version=embedding_config["api_version"],
-            )
-        else:
-            # Standard OpenAI
-            self.embeddings = OpenAIEmbeddings(
-                openai_api_key=embedding_config["openai_api_key"],
-                model=embedding_config.get("model", self.embedding_model),
-            )
+        # Initialize embeddings (shared per config tuple)
+        self.embeddings = _build_embeddings(
+            embedding_config.get("azure_endpoint"),
+            embedding_config.get("azure_api_key"),
+            embedding_config.get("api_version"),
+            embedding_config.get("azure_deployment"),
+            embedding_config.get("openai_api_key"),
+            embedding_config.get("model", self.embedding_model),
+        )
+
+        self._provider = (
+            "azure" if embedding_config.get("azure_endpoint") else "openai"
+        )
+        self._persistent_cache = (
+            _get_embedding_cache(settings.embedding_cache_path)
+            if settings.embedding_cache_path
+            else None
+        )
+
+    def _cache_key(self, text: str) -> bytes:
+        """Cache key: model name + hash of the normalized query text"""
+        normalized = " ".join(text.lower().split())
+        return hashlib.blake2b(
+            f"{self.embedding_model}\x00{normalized}".encode(),
+            digest_size=16,
+        ).digest()
 
     def embed_text(self, text: str) -> List[float]:
         """
         Generate embedding for a single text
 
+        Repeated queries (normalized for case and whitespace) are served
+        from an in-process LRU cache instead of hitting the API again.
+
         Args:
             text: Text to embed
 
         Returns:
             Embedding vector
         """
-        return self.embeddings.embed_query(text)
+        key = self._cache_key(text)
+        cache = EmbeddingService._embed_cache
+        with EmbeddingService._embed_cache_lock:
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+                return cached
+
+        vector = self.embeddings.embed_query(text)
+        with EmbeddingService._embed_cache_lock:
+            cache[key] = vector
+            if len(cache) > self.EMBED_CACHE_MAXSIZE:
+                cache.popitem(last=False)
+        return vector
 
-    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+    async def aembed_text(self, text: str) -> List[float]:
+        """
+        Generate embedding for a single text without blocking the event loop
+
+        Shares the query-embedding LRU cache with embed_text, so sync and
+        async callers warm each other's hits.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector
+        """
+        key = self._cache_key(text)
+        cache = EmbeddingService._embed_cache
+        with EmbeddingService._embed_cache_lock:
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+                return cached
+
+        client = self._get_async_client()
+        response = await client.embeddings.create(
+            model=self._async_model, input=[text]
+        )
+        vector = response.data[0].embedding
+        with EmbeddingService._embed_cache_lock:
+            cache[key] = vector
+            if len(cache) > self.EMBED_CACHE_MAXSIZE:
+                cache.popitem(last=False)
+        return vector
+
+    def _get_async_client(self):
+        """Build (once) and return the shared async OpenAI client"""
+        if EmbeddingService._async_client is None:
+            embedding_config = settings.get_embedding_config()
+            if embedding_config.get("azure_endpoint"):
+                EmbeddingService._async_client = AsyncAzureOpenAI(
+                    api_key=embedding_config["azure_api_key"],
+                    azure_endpoint=embedding_config["azure_endpoint"],
+                    api_version=embedding_config["api_version"],
+                    http_client=get_shared_async_http_client(),
+                )
+                EmbeddingService._async_model = embedding_config["azure_deployment"]
+            else:
+                EmbeddingService._async_client = AsyncOpenAI(
+                    api_key=embedding_config["openai_api_key"],
+                    http_client=get_shared_async_http_client(),
+                )
+                EmbeddingService._async_model = embedding_config.get(
+                    "model", self.embedding_model
+                )
+        return EmbeddingService._async_client
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for multiple texts with overlapped requests
+
+        Splits texts into batches and issues the embedding requests
+        concurrently (bounded by a semaphore) instead of sequentially.
+        Indexing is network-bound, so overlapping the round-trips is where
+        the time goes.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            List of embedding vectors, in input order
+        """
+        if not texts:
+            return []
+
+        client = self._get_async_client()
+        semaphore = asyncio.Semaphore(self.ASYNC_MAX_CONCURRENCY)
+
+        async def embed_batch(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                response = await client.embeddings.create(
+                    model=self._async_model, input=batch
+                )
+            return [item.embedding for item in response.data]
+
+        batches = [
+            texts[i : i + self.ASYNC_BATCH_SIZE]
+            for i in range(0, len(texts), self.ASYNC_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(*(embed_batch(batch) for batch in batches))
+        return [vector for batch_vectors in results for vector in batch_vectors]
+
+    def embed_documents(
+        self, texts: List[str], normalize: bool = False
+    ) -> np.ndarray:
         """
         Generate embeddings for multiple texts
 
         Args:
             texts: List of texts to embed
+            normalize: L2-normalize each vector so downstream cosine
+                similarity reduces to a plain dot product
+
+        Returns:
+            (len(texts), dim) float32 array of embedding vectors. float32
+            halves the footprint vs. nested Python float lists and keeps
+            the data contiguous for vectorized similarity math.
+        """
+        if self._persistent_cache is None or not texts:
+            vectors = np.asarray(
+                self.embeddings.embed_documents(texts), dtype=np.float32
+            )
+        else:
+            vectors = self._embed_documents_cached(texts)
+        if normalize and vectors.size:
+            vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors
+
+    def _embed_documents_cached(self, texts: List[str]) -> np.ndarray:
+        """Embed texts through the persistent cache, hitting the API only
+        for content hashes it hasn't seen for this provider + model"""
+        cache = self._persistent_cache
+        hashes = [
+            hashlib.sha256(text.encode()).hexdigest() for text in texts
+        ]
+        cached = cache.get_many(hashes, self._provider, self.embedding_model)
+
+        miss_indices = [
+            idx for idx, content_hash in enumerate(hashes)
+            if content_hash not in cached
+        ]
+        if miss_indices:
+            # Deduplicate misses so identical chunks embed once
+            miss_hashes = list(dict.fromkeys(hashes[idx] for idx in miss_indices))
+            hash_to_text = {hashes[idx]: texts[idx] for idx in miss_indices}
+            fresh = np.asarray(
+                self.embeddings.embed_documents(
+                    [hash_to_text[h] for h in miss_hashes]
+                ),
+                dtype=np.float32,
+            )
+            for content_hash, vector in zip(miss_hashes, fresh):
+                cached[content_hash] = vector
+            cache.put_many(
+                list(zip(miss_hashes, fresh)),
+                self._provider,
+                self.embedding_model,
+            )
+
+        return np.stack([cached[content_hash] for content_hash in hashes])
+
+    @staticmethod
+    def quantize_int8(vectors: np.ndarray) -> tuple:
+        """
+        Quantize float32 embeddings to int8 with per-vector scales
+
+        int8 storage is 4x smaller over the wire and in the vector store;
+        for OpenAI embeddings the int8 inner product stays within ~1%
+        recall of full precision.
+
+        Args:
+            vectors: (n, dim) float32 embedding array
 
         Returns:
-            List of embedding vectors
+            Tuple of (int8 array shaped like vectors, (n,) float32 scale
+            array). Dequantize with q * scale[:, None].
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        scales = np.max(np.abs(vectors), axis=-1) / 127.0
+        # Guard all-zero vectors so the division below can't produce NaN
+        safe_scales = np.where(scales == 0.0, 1.0, scales)
+        quantized = np.round(
+            vectors / safe_scales[..., None]
+        ).astype(np.int8)
+        return quantized, scales.astype(np.float32)
+
+    @property
+    def dimension(self) -> Optional[int]:
+        """Embedding dimension for the configured model, if known
+
+        None for models missing from the table; callers fall back to
+        embedding a probe text and counting.
         """
-        return self.embeddings.embed_documents(texts)
+        return _MODEL_DIMENSIONS.get(self.embedding_model)
 
     def get_embedding_model(self) -> str:
         """Get the embedding model name"""
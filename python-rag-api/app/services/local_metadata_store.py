@@ -2,32 +2,232 @@
 Local metadata storage using SQLite as fallback when Cosmos DB is not configured
 """
 
+import logging
 import os
+import queue
 import sqlite3
-import json
+import threading
+
+import orjson
+from contextlib import contextmanager
 from typing import Optional, List
 from datetime import datetime
 from pathlib import Path
 
 from app.core.config import settings
-from app.models.document import DocumentMetadata, DocumentStatus
+from app.models.document import DocumentMetadata, DocumentStatus, DocumentSummary
+
+
+logger = logging.getLogger("document_rag_api")
+
+
+# SQL literals as module constants: the same string object is passed to
+# sqlite3 on every call, so the connection's statement cache can reuse
+# the prepared statement instead of re-parsing the SQL text
+_SQL_INSERT_DOC = """
+    INSERT OR REPLACE INTO documents
+    (document_id, filename, file_type, file_size, upload_time,
+     indexed_at, status, chunk_count, blob_url, error_message,
+     metadata, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_SELECT_DOC = "SELECT * FROM documents WHERE document_id = ?"
+
+_SQL_LIST_DOCS = """
+    SELECT * FROM documents
+    ORDER BY upload_time DESC
+    LIMIT ? OFFSET ?
+"""
+
+_SQL_LIST_DOCS_BY_STATUS = """
+    SELECT * FROM documents
+    WHERE status = ?
+    ORDER BY upload_time DESC
+    LIMIT ? OFFSET ?
+"""
+
+_SQL_LIST_DOC_SUMMARIES = """
+    SELECT document_id, filename, file_type, file_size, upload_time,
+           status, chunk_count
+    FROM documents
+    ORDER BY upload_time DESC
+    LIMIT ? OFFSET ?
+"""
+
+_SQL_DELETE_DOC = "DELETE FROM documents WHERE document_id = ?"
+
+_SQL_UPSERT_CONVERSATION = """
+    INSERT OR REPLACE INTO conversations
+    (conversation_id, title, created_at, updated_at,
+     message_count, metadata, messages)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_SELECT_CONVERSATION = "SELECT * FROM conversations WHERE conversation_id = ?"
+
+_SQL_SELECT_CONVERSATION_BLOBS = (
+    "SELECT messages, metadata FROM conversations WHERE conversation_id = ?"
+)
+
+_SQL_UPDATE_CONVERSATION_META = """
+    UPDATE conversations
+    SET messages = NULL, message_count = ?, updated_at = ?, metadata = ?
+    WHERE conversation_id = ?
+"""
+
+_SQL_INSERT_MESSAGE = """
+    INSERT INTO conversation_messages
+    (conversation_id, seq, role, content, timestamp, metadata)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_SELECT_MESSAGES = """
+    SELECT role, content, timestamp, metadata
+    FROM conversation_messages
+    WHERE conversation_id = ?
+    ORDER BY seq
+"""
+
+_SQL_MAX_MESSAGE_SEQ = (
+    "SELECT COALESCE(MAX(seq), 0) FROM conversation_messages WHERE conversation_id = ?"
+)
+
+_SQL_DELETE_MESSAGES = "DELETE FROM conversation_messages WHERE conversation_id = ?"
+
+_SQL_LIST_CONVERSATIONS = """
+    SELECT conversation_id, title, created_at, updated_at, message_count,
+           metadata, messages,
+           (SELECT content FROM conversation_messages m
+            WHERE m.conversation_id = c.conversation_id
+              AND m.role = 'assistant' AND m.content IS NOT NULL
+            ORDER BY m.seq DESC LIMIT 1) AS last_assistant_content,
+           (SELECT content FROM conversation_messages m
+            WHERE m.conversation_id = c.conversation_id
+            ORDER BY m.seq DESC LIMIT 1) AS last_message_content
+    FROM conversations c
+    ORDER BY updated_at DESC
+    LIMIT ? OFFSET ?
+"""
+
+_SQL_SELECT_MESSAGES_PAGE = """
+    SELECT role, content, timestamp, metadata
+    FROM conversation_messages
+    WHERE conversation_id = ?
+    ORDER BY seq
+    LIMIT ? OFFSET ?
+"""
 
 
 class LocalMetadataStore:
     """Local SQLite-based metadata storage"""
 
+    # Per-connection tuning: WAL lets readers run during writes and turns
+    # every commit from two fsyncs into an occasional WAL sync
+    # (synchronous=NORMAL is durable-enough for metadata that can be
+    # re-derived from the source documents); 64 MB page cache, in-memory
+    # temp tables, 256 MB mmap window, and a 5 s busy timeout instead of
+    # immediate "database is locked" errors. journal_mode persists in the
+    # file but the rest is per-connection, so apply on every connect.
+    _PRAGMAS = """
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA mmap_size=268435456;
+        PRAGMA cache_size=-65536;
+        PRAGMA busy_timeout=5000;
+    """
+
     def __init__(self, db_path: str = "./metadata.db"):
         """Initialize local metadata store"""
         self.db_path = db_path
-        self._init_database()
 
-    def _init_database(self):
-        """Initialize SQLite database and create tables"""
         db_dir = os.path.dirname(self.db_path)
         if db_dir:
             os.makedirs(db_dir, exist_ok=True)
 
-        with sqlite3.connect(self.db_path) as conn:
+        # Dual-pool layout that WAL is built for: one long-lived writer
+        # connection serialized by the RLock, plus a small pool of reader
+        # connections so listings and lookups never queue behind a write.
+        # BEGIN IMMEDIATE on the writer takes the write lock up front,
+        # avoiding deferred-to-write upgrade SQLITE_BUSY errors.
+        self._lock = threading.RLock()
+        self._conn = self._connect(isolation_level="IMMEDIATE")
+        self._init_database()
+
+        self._readers: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        for _ in range(min(os.cpu_count() or 1, 4)):
+            self._readers.put(self._connect())
+
+        self._maintenance_timer: Optional[threading.Timer] = None
+        self._schedule_maintenance()
+
+    def _connect(self, isolation_level: str = "") -> sqlite3.Connection:
+        """Open a long-lived connection with the tuned PRAGMAs applied"""
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=256,
+            isolation_level=isolation_level,
+        )
+        conn.executescript(self._PRAGMAS)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextmanager
+    def _reader(self):
+        """Borrow a read connection from the pool for the with-block"""
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    # How often the background maintenance pass runs (seconds)
+    _MAINTENANCE_INTERVAL = 900
+
+    def _schedule_maintenance(self) -> None:
+        """Arm the timer for the next background maintenance pass"""
+        timer = threading.Timer(self._MAINTENANCE_INTERVAL, self._run_maintenance)
+        timer.daemon = True
+        timer.start()
+        self._maintenance_timer = timer
+
+    def _run_maintenance(self) -> None:
+        """Periodic upkeep for the long-lived database
+
+        PRAGMA optimize refreshes query-planner statistics that go stale
+        under sustained insert traffic; the TRUNCATE checkpoint folds the
+        WAL back into the main file so it can't grow unbounded between
+        restarts.
+        """
+        try:
+            with self._lock:
+                self._conn.execute("PRAGMA optimize")
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.DatabaseError:
+            logger.exception("Local metadata store maintenance failed")
+        finally:
+            self._schedule_maintenance()
+
+    def close(self) -> None:
+        """Run a final maintenance pass and release the connections"""
+        try:
+            if self._maintenance_timer is not None:
+                self._maintenance_timer.cancel()
+            while not self._readers.empty():
+                self._readers.get_nowait().close()
+            with self._lock:
+                self._conn.execute("PRAGMA optimize")
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                self._conn.close()
+        except sqlite3.DatabaseError:
+            logger.exception("Error closing local metadata store")
+
+    def _init_database(self):
+        """Initialize SQLite database and create tables"""
+        with self._lock:
+            conn = self._conn
             cursor = conn.cursor()
 
             # Create documents table
@@ -65,128 +265,266 @@ class LocalMetadataStore:
             """
             )
 
+            # Messages live in their own table so appending M messages
+            # costs O(M) inserts instead of rewriting the conversation's
+            # whole JSON blob every turn. The legacy conversations.messages
+            # column is kept for reads of pre-migration rows; writers
+            # migrate it on first touch.
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS conversation_messages (
+                    conversation_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    role TEXT,
+                    content TEXT,
+                    timestamp TEXT,
+                    metadata TEXT,
+                    PRIMARY KEY (conversation_id, seq)
+                )
+            """
+            )
+
             # Create indexes
             cursor.execute(
                 """
-                CREATE INDEX IF NOT EXISTS idx_documents_upload_time 
+                CREATE INDEX IF NOT EXISTS idx_documents_upload_time
                 ON documents(upload_time DESC)
             """
             )
 
+            # Covers status-filtered listings: the filter and the
+            # upload_time ordering both come from this index, so "list
+            # failed/processing documents" never scans-and-sorts the table
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_documents_status_upload
+                ON documents(status, upload_time DESC)
+            """
+            )
+
+            # updated_at is ISO-8601, so lexicographic order is
+            # chronological and a plain ORDER BY updated_at DESC can walk
+            # this index instead of scanning + sorting the table
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_conversations_updated_at
+                ON conversations(updated_at DESC)
+            """
+            )
+
             conn.commit()
 
+    @staticmethod
+    def _document_row(document_metadata: DocumentMetadata) -> tuple:
+        """Build the parameter tuple for _SQL_INSERT_DOC"""
+        return (
+            document_metadata.document_id,
+            document_metadata.filename,
+            document_metadata.file_type,
+            document_metadata.file_size,
+            (
+                document_metadata.upload_time.isoformat()
+                if isinstance(document_metadata.upload_time, datetime)
+                else str(document_metadata.upload_time)
+            ),
+            (
+                document_metadata.indexed_at.isoformat()
+                if document_metadata.indexed_at
+                and isinstance(document_metadata.indexed_at, datetime)
+                else (
+                    str(document_metadata.indexed_at)
+                    if document_metadata.indexed_at
+                    else None
+                )
+            ),
+            document_metadata.status.value,
+            document_metadata.chunk_count,
+            document_metadata.blob_url,
+            document_metadata.error_message,
+            # orjson emits bytes; binding them stores a BLOB, skipping the
+            # decode-on-write/encode-on-read round trip TEXT required.
+            # Column affinity doesn't constrain this, and orjson.loads
+            # reads bytes and legacy str rows alike.
+            orjson.dumps(document_metadata.metadata),
+            datetime.now().isoformat(),
+        )
+
     def save_document_metadata(self, document_metadata: DocumentMetadata) -> bool:
         """Save document metadata"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
+            with self._lock:
+                conn = self._conn
+                conn.execute(_SQL_INSERT_DOC, self._document_row(document_metadata))
+                conn.commit()
+                return True
+        except sqlite3.DatabaseError:
+            logger.exception("Error saving document metadata to local store")
+            return False
 
-                cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO documents 
-                    (document_id, filename, file_type, file_size, upload_time, 
-                     indexed_at, status, chunk_count, blob_url, error_message, 
-                     metadata, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        document_metadata.document_id,
-                        document_metadata.filename,
-                        document_metadata.file_type,
-                        document_metadata.file_size,
-                        (
-                            document_metadata.upload_time.isoformat()
-                            if isinstance(document_metadata.upload_time, datetime)
-                            else str(document_metadata.upload_time)
-                        ),
-                        (
-                            document_metadata.indexed_at.isoformat()
-                            if document_metadata.indexed_at
-                            and isinstance(document_metadata.indexed_at, datetime)
-                            else (
-                                str(document_metadata.indexed_at)
-                                if document_metadata.indexed_at
-                                else None
-                            )
-                        ),
-                        document_metadata.status.value,
-                        document_metadata.chunk_count,
-                        document_metadata.blob_url,
-                        document_metadata.error_message,
-                        json.dumps(document_metadata.metadata),
-                        datetime.now().isoformat(),
-                    ),
-                )
+    def save_document_metadata_many(
+        self, items: List[DocumentMetadata]
+    ) -> bool:
+        """Save many document metadata rows in one transaction
 
+        executemany reuses a single prepared statement, and one commit
+        amortizes the journal sync across the whole batch.
+        """
+        if not items:
+            return True
+        try:
+            with self._lock:
+                conn = self._conn
+                conn.executemany(
+                    _SQL_INSERT_DOC,
+                    [self._document_row(item) for item in items],
+                )
                 conn.commit()
                 return True
-        except Exception as e:
-            print(f"Error saving document metadata to local store: {e}")
+        except sqlite3.DatabaseError:
+            logger.exception("Error batch-saving document metadata to local store")
             return False
 
     def get_document_metadata(self, document_id: str) -> Optional[DocumentMetadata]:
         """Get document metadata by ID"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._reader() as conn:
                 cursor = conn.cursor()
 
-                cursor.execute(
-                    """
-                    SELECT * FROM documents WHERE document_id = ?
-                """,
-                    (document_id,),
-                )
+                cursor.execute(_SQL_SELECT_DOC, (document_id,))
 
                 row = cursor.fetchone()
                 if not row:
                     return None
 
                 return self._row_to_document_metadata(row)
-        except Exception as e:
-            print(f"Error getting document metadata from local store: {e}")
+        except sqlite3.DatabaseError:
+            logger.exception("Error getting document metadata from local store")
             return None
 
     def list_documents(
         self,
         limit: int = 100,
         offset: int = 0,
+        status: Optional[DocumentStatus] = None,
     ) -> List[DocumentMetadata]:
-        """List all documents"""
+        """List documents, optionally filtered by status"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._reader() as conn:
                 cursor = conn.cursor()
 
-                cursor.execute(
-                    """
-                    SELECT * FROM documents 
-                    ORDER BY upload_time DESC 
-                    LIMIT ? OFFSET ?
-                """,
-                    (limit, offset),
-                )
+                if status is not None:
+                    cursor.execute(
+                        _SQL_LIST_DOCS_BY_STATUS, (status.value, limit, offset)
+                    )
+                else:
+                    cursor.execute(_SQL_LIST_DOCS, (limit, offset))
 
                 rows = cursor.fetchall()
                 return [self._row_to_document_metadata(row) for row in rows]
-        except Exception as e:
-            print(f"Error listing documents from local store: {e}")
+        except sqlite3.DatabaseError:
+            logger.exception("Error listing documents from local store")
+            return []
+
+    def list_document_summaries(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[DocumentSummary]:
+        """List documents projected down to the summary columns"""
+        try:
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute(_SQL_LIST_DOC_SUMMARIES, (limit, offset))
+                return [
+                    DocumentSummary(
+                        document_id=row["document_id"],
+                        filename=row["filename"],
+                        file_type=row["file_type"],
+                        file_size=row["file_size"],
+                        upload_time=datetime.fromisoformat(row["upload_time"]),
+                        status=DocumentStatus(row["status"]),
+                        chunk_count=row["chunk_count"] or 0,
+                    )
+                    for row in cursor.fetchall()
+                ]
+        except sqlite3.DatabaseError:
+            logger.exception("Error listing document summaries from local store")
             return []
 
     def delete_document_metadata(self, document_id: str) -> bool:
         """Delete document metadata"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._lock:
+                conn = self._conn
                 cursor = conn.cursor()
-                cursor.execute(
-                    "DELETE FROM documents WHERE document_id = ?", (document_id,)
-                )
+                cursor.execute(_SQL_DELETE_DOC, (document_id,))
                 conn.commit()
                 return cursor.rowcount > 0
-        except Exception as e:
-            print(f"Error deleting document metadata from local store: {e}")
+        except sqlite3.DatabaseError:
+            logger.exception("Error deleting document metadata from local store")
             return False
 
+    @staticmethod
+    def _message_row(conversation_id: str, seq: int, message: dict) -> tuple:
+        """Build the parameter tuple for _SQL_INSERT_MESSAGE"""
+        timestamp = message.get("timestamp")
+        if isinstance(timestamp, datetime):
+            timestamp = timestamp.isoformat()
+        metadata = message.get("metadata")
+        return (
+            conversation_id,
+            seq,
+            message.get("role"),
+            message.get("content"),
+            timestamp,
+            orjson.dumps(metadata) if metadata is not None else None,
+        )
+
+    def _migrate_legacy_messages(self, cursor, conversation_id: str) -> int:
+        """Move a pre-migration JSON message blob into the messages table
+
+        Returns the current max seq for the conversation. No-op (beyond
+        the MAX lookup) for already-migrated rows.
+        """
+        cursor.execute(_SQL_MAX_MESSAGE_SEQ, (conversation_id,))
+        max_seq = cursor.fetchone()[0]
+        if max_seq:
+            return max_seq
+
+        cursor.execute(
+            "SELECT messages FROM conversations WHERE conversation_id = ?",
+            (conversation_id,),
+        )
+        row = cursor.fetchone()
+        legacy = orjson.loads(row["messages"]) if row and row["messages"] else []
+        if legacy:
+            cursor.executemany(
+                _SQL_INSERT_MESSAGE,
+                [
+                    self._message_row(conversation_id, seq, message)
+                    for seq, message in enumerate(legacy, start=1)
+                ],
+            )
+        return len(legacy)
+
+    def _load_messages(self, cursor, conversation_id: str, blob) -> List[dict]:
+        """Read messages from the table, falling back to a legacy blob"""
+        cursor.execute(_SQL_SELECT_MESSAGES, (conversation_id,))
+        rows = cursor.fetchall()
+        if rows:
+            return [
+                {
+                    "role": row["role"],
+                    "content": row["content"],
+                    "timestamp": row["timestamp"],
+                    "metadata": (
+                        orjson.loads(row["metadata"]) if row["metadata"] else None
+                    ),
+                }
+                for row in rows
+            ]
+        return orjson.loads(blob) if blob else []
+
     def save_conversation(
         self,
         conversation_id: str,
@@ -194,94 +532,99 @@ class LocalMetadataStore:
     ) -> bool:
         """Save conversation"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._lock:
+                conn = self._conn
                 cursor = conn.cursor()
 
+                messages = conversation_data.get("messages", [])
                 cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO conversations 
-                    (conversation_id, title, created_at, updated_at, 
-                     message_count, metadata, messages)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
+                    _SQL_UPSERT_CONVERSATION,
                     (
                         conversation_id,
                         conversation_data.get("title"),
                         conversation_data.get("created_at"),
                         conversation_data.get("updated_at"),
-                        conversation_data.get("message_count", 0),
-                        json.dumps(conversation_data.get("metadata", {})),
-                        json.dumps(conversation_data.get("messages", [])),
+                        conversation_data.get("message_count", len(messages)),
+                        orjson.dumps(conversation_data.get("metadata", {})),
+                        None,
                     ),
                 )
+                cursor.execute(_SQL_DELETE_MESSAGES, (conversation_id,))
+                if messages:
+                    cursor.executemany(
+                        _SQL_INSERT_MESSAGE,
+                        [
+                            self._message_row(conversation_id, seq, message)
+                            for seq, message in enumerate(messages, start=1)
+                        ],
+                    )
 
                 conn.commit()
                 return True
-        except Exception as e:
-            print(f"Error saving conversation to local store: {e}")
+        except sqlite3.DatabaseError:
+            logger.exception("Error saving conversation to local store")
             return False
 
     def append_conversation_messages(
-        self, conversation_id: str, messages: List[dict], metadata: Optional[dict] = None
+        self,
+        conversation_id: str,
+        messages: List[dict],
+        metadata: Optional[dict] = None,
+        updated_at: Optional[str] = None,
     ) -> bool:
-        """Append messages to an existing conversation"""
+        """Append messages to an existing conversation
+
+        Inserts the M new rows and updates the conversation header —
+        O(M) per turn, instead of rewriting the full message blob that
+        grows with conversation length.
+        """
         if not messages:
             return True
 
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
+            with self._lock:
+                cursor = self._conn.cursor()
 
-                cursor.execute(
-                    "SELECT messages FROM conversations WHERE conversation_id = ?",
-                    (conversation_id,),
-                )
+                cursor.execute(_SQL_SELECT_CONVERSATION_BLOBS, (conversation_id,))
                 row = cursor.fetchone()
                 if not row:
                     return False
 
-                existing_messages = json.loads(row["messages"] or "[]")
-                existing_messages.extend(messages)
+                max_seq = self._migrate_legacy_messages(cursor, conversation_id)
+                cursor.executemany(
+                    _SQL_INSERT_MESSAGE,
+                    [
+                        self._message_row(conversation_id, max_seq + i, message)
+                        for i, message in enumerate(messages, start=1)
+                    ],
+                )
 
-                updated_at = datetime.utcnow().isoformat()
-                merged_metadata = json.loads(row["metadata"] or "{}")
+                merged_metadata = orjson.loads(row["metadata"] or "{}")
                 if metadata:
                     merged_metadata.update(metadata)
                 cursor.execute(
-                    """
-                    UPDATE conversations
-                    SET messages = ?, message_count = ?, updated_at = ?, metadata = ?
-                    WHERE conversation_id = ?
-                    """,
+                    _SQL_UPDATE_CONVERSATION_META,
                     (
-                        json.dumps(existing_messages),
-                        len(existing_messages),
-                        updated_at,
-                        json.dumps(merged_metadata),
+                        max_seq + len(messages),
+                        updated_at or datetime.utcnow().isoformat(),
+                        orjson.dumps(merged_metadata),
                         conversation_id,
                     ),
                 )
 
-                conn.commit()
+                self._conn.commit()
                 return True
-        except Exception as e:
-            print(f"Error appending messages to conversation: {e}")
+        except sqlite3.DatabaseError:
+            logger.exception("Error appending messages to conversation")
             return False
 
     def get_conversation(self, conversation_id: str) -> Optional[dict]:
         """Get conversation by ID"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._reader() as conn:
                 cursor = conn.cursor()
 
-                cursor.execute(
-                    """
-                    SELECT * FROM conversations WHERE conversation_id = ?
-                """,
-                    (conversation_id,),
-                )
+                cursor.execute(_SQL_SELECT_CONVERSATION, (conversation_id,))
 
                 row = cursor.fetchone()
                 if not row:
@@ -293,36 +636,51 @@ class LocalMetadataStore:
                     "created_at": row["created_at"],
                     "updated_at": row["updated_at"],
                     "message_count": row["message_count"],
-                    "metadata": json.loads(row["metadata"] or "{}"),
-                    "messages": json.loads(row["messages"] or "[]"),
+                    "metadata": orjson.loads(row["metadata"] or "{}"),
+                    "messages": self._load_messages(
+                        cursor, row["conversation_id"], row["messages"]
+                    ),
                 }
-        except Exception as e:
-            print(f"Error getting conversation from local store: {e}")
+        except sqlite3.DatabaseError:
+            logger.exception("Error getting conversation from local store")
             return None
 
+    @staticmethod
+    def _legacy_blob_preview(blob) -> Optional[str]:
+        """Derive a preview from a pre-migration JSON message blob"""
+        messages = orjson.loads(blob) if blob else []
+        for message in reversed(messages):
+            if message.get("role") == "assistant" and message.get("content"):
+                return message["content"]
+        if messages:
+            return messages[-1].get("content")
+        return None
+
     def list_conversations(
         self,
         limit: int = 50,
         offset: int = 0,
     ) -> List[dict]:
-        """List conversations with metadata"""
+        """List conversations with metadata and message previews
+
+        Listings never load full message histories: the preview comes
+        from two correlated subqueries on the indexed messages table
+        (last assistant message, last message overall), so the cost no
+        longer scales with total message volume.
+        """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._reader() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT *
-                    FROM conversations
-                    ORDER BY datetime(updated_at) DESC
-                    LIMIT ? OFFSET ?
-                """,
-                    (limit, offset),
-                )
+                cursor.execute(_SQL_LIST_CONVERSATIONS, (limit, offset))
 
                 rows = cursor.fetchall()
                 conversations: List[dict] = []
                 for row in rows:
+                    preview = (
+                        row["last_assistant_content"]
+                        or row["last_message_content"]
+                        or self._legacy_blob_preview(row["messages"])
+                    )
                     conversations.append(
                         {
                             "conversation_id": row["conversation_id"],
@@ -330,13 +688,54 @@ class LocalMetadataStore:
                             "created_at": row["created_at"],
                             "updated_at": row["updated_at"],
                             "message_count": row["message_count"],
-                            "metadata": json.loads(row["metadata"] or "{}"),
-                            "messages": json.loads(row["messages"] or "[]"),
+                            "metadata": orjson.loads(row["metadata"] or "{}"),
+                            "messages": [],
+                            "last_message_preview": (
+                                preview[:240] if preview else None
+                            ),
                         }
                     )
                 return conversations
-        except Exception as e:
-            print(f"Error listing conversations from local store: {e}")
+        except sqlite3.DatabaseError:
+            logger.exception("Error listing conversations from local store")
+            return []
+
+    def get_conversation_messages(
+        self,
+        conversation_id: str,
+        limit: int = 200,
+        offset: int = 0,
+    ) -> List[dict]:
+        """Get a page of messages for a conversation"""
+        try:
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    _SQL_SELECT_MESSAGES_PAGE, (conversation_id, limit, offset)
+                )
+                rows = cursor.fetchall()
+                if not rows and offset == 0:
+                    # Pre-migration conversation: fall back to the blob
+                    cursor.execute(
+                        "SELECT messages FROM conversations WHERE conversation_id = ?",
+                        (conversation_id,),
+                    )
+                    row = cursor.fetchone()
+                    blob = row["messages"] if row else None
+                    return orjson.loads(blob)[:limit] if blob else []
+                return [
+                    {
+                        "role": row["role"],
+                        "content": row["content"],
+                        "timestamp": row["timestamp"],
+                        "metadata": (
+                            orjson.loads(row["metadata"]) if row["metadata"] else None
+                        ),
+                    }
+                    for row in rows
+                ]
+        except sqlite3.DatabaseError:
+            logger.exception("Error getting conversation messages from local store")
             return []
 
     def _row_to_document_metadata(self, row: sqlite3.Row) -> DocumentMetadata:
@@ -354,5 +753,5 @@ class LocalMetadataStore:
             chunk_count=row["chunk_count"],
             blob_url=row["blob_url"],
             error_message=row["error_message"],
-            metadata=json.loads(row["metadata"] or "{}"),
+            metadata=orjson.loads(row["metadata"] or "{}"),
         )
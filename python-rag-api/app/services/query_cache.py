@@ -0,0 +1,104 @@
+"""
+Exact-match query cache backed by Redis
+
+Caches serialized RAGQueryResponse payloads keyed on the query parameters so
+repeated identical questions skip retrieval and generation entirely. Entries
+carry a TTL and live under a namespace epoch; deleting a document bumps the
+epoch, which invalidates every cached answer without enumerating keys.
+Disabled transparently when Redis is not configured or installed.
+"""
+
+import hashlib
+import logging
+from typing import Optional
+
+import orjson
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover - optional dependency
+    aioredis = None
+
+from app.core.config import settings
+from app.models.chat import RAGQueryRequest
+
+logger = logging.getLogger("document_rag_api")
+
+EPOCH_KEY = "rag:epoch"
+
+
+class QueryCache:
+    """Exact-match Redis cache for RAG query responses"""
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        ttl_seconds: Optional[int] = None,
+    ):
+        self.ttl_seconds = ttl_seconds or settings.query_cache_ttl_seconds
+        url = redis_url or settings.redis_url
+        self._redis = None
+        if url and aioredis is not None:
+            self._redis = aioredis.from_url(url)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a Redis backend is available"""
+        return self._redis is not None
+
+    def _cacheable(self, request: RAGQueryRequest) -> bool:
+        """Only cache stateless queries; conversational requests carry history"""
+        return not request.conversation_id and not request.conversation_history
+
+    def _request_key(self, request: RAGQueryRequest, epoch: str) -> str:
+        payload = orjson.dumps(
+            {
+                "question": request.question,
+                "top_k": request.top_k,
+                "document_id": request.document_id,
+                "filters": request.filters,
+            }
+        )
+        return f"rag:{epoch}:{hashlib.sha256(payload).hexdigest()}"
+
+    async def _epoch(self) -> str:
+        value = await self._redis.get(EPOCH_KEY)
+        return value.decode() if value else "0"
+
+    async def get(self, request: RAGQueryRequest) -> Optional[bytes]:
+        """Return the cached response JSON for an identical query, if any"""
+        if not self.enabled or not self._cacheable(request):
+            return None
+        try:
+            epoch = await self._epoch()
+            return await self._redis.get(self._request_key(request, epoch))
+        except Exception as exc:
+            logger.warning("Query cache read failed: %s", exc)
+            return None
+
+    async def set(self, request: RAGQueryRequest, response_json: str) -> None:
+        """Store a response JSON payload with TTL"""
+        if not self.enabled or not self._cacheable(request):
+            return
+        try:
+            epoch = await self._epoch()
+            await self._redis.set(
+                self._request_key(request, epoch),
+                response_json,
+                ex=self.ttl_seconds,
+            )
+        except Exception as exc:
+            logger.warning("Query cache write failed: %s", exc)
+
+    async def invalidate_all(self) -> None:
+        """Bump the namespace epoch so existing entries can no longer match"""
+        if not self.enabled:
+            return
+        try:
+            await self._redis.incr(EPOCH_KEY)
+        except Exception as exc:
+            logger.warning("Query cache invalidation failed: %s", exc)
+
+
+# Global query cache instance
+query_cache = QueryCache()
@@ -7,20 +7,31 @@ import os
 import re
 import time
 import uuid
+
+import anyio.to_thread
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, NamedTuple, Optional, Dict, Any
 from langchain_openai import ChatOpenAI, AzureChatOpenAI
 from langchain_core.prompts import PromptTemplate
 from langchain_core.callbacks.streaming_stdout import StreamingStdOutCallbackHandler
 from openai import BadRequestError
 
 from app.core.config import settings
-from app.services.document_processor import DocumentProcessor
+from app.core.http import get_shared_http_client
+from app.services.document_processor import get_document_processor
 from app.services.embedding_service import EmbeddingService
 from app.services.vector_store import VectorStore
 from app.services.storage_service import StorageService
 from app.utils.confidence_calculator import ImprovedConfidenceCalculator
-from app.models.chat import RAGQueryRequest, RAGQueryResponse, Citation, ChatMessage
+from app.models.chat import (
+    CITATION_LIST_ADAPTER,
+    RAGQueryRequest,
+    RAGQueryResponse,
+    Citation,
+    ChatMessage,
+)
 from app.models.document import DocumentMetadata, DocumentStatus
 from app.utils.file_utils import generate_document_id, generate_chunk_id
 
@@ -28,6 +39,33 @@ from app.utils.file_utils import generate_document_id, generate_chunk_id
 logger = logging.getLogger("document_rag_api")
 
 
+_ANSWER_TEMPLATE = """You are a helpful AI assistant. Answer the question based ONLY on the following context. Always cite your sources using [1], [2], etc.
+
+Context:
+{context}
+
+Question: {question}
+
+Answer:"""
+
+
+class _DocView(NamedTuple):
+    """Per-document fields needed after retrieval, extracted in one pass
+
+    Citations, the retrieved-docs summary, and conversation metadata all
+    read the same handful of metadata keys; materializing them once
+    avoids re-walking scored_docs (and its dict lookups) per consumer.
+    """
+
+    number: int
+    document_id: Optional[str]
+    document_name: Optional[str]
+    chunk_id: Optional[str]
+    page: Optional[int]
+    score: float
+    content: str
+
+
 class RAGService:
     """Main RAG orchestration service"""
 
@@ -46,7 +84,7 @@ class RAGService:
             embedding_model: Embedding model name
         """
         # Initialize services
-        self.document_processor = DocumentProcessor(
+        self.document_processor = get_document_processor(
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
         )
@@ -57,6 +95,18 @@ class RAGService:
             self.embedding_service.embeddings
         )
 
+        # Rolling-context embeddings for multi-turn retrieval (see
+        # _embed_enhanced_query)
+        self._context_embed_cache: Dict[int, Any] = {}
+
+        # Cost-estimate coefficients, collapsed once from the configured
+        # per-1K prices so _estimate_cost is a single linear expression
+        per_chunk_k_tokens = settings.est_tokens_per_chunk / 1000
+        self._cost_per_chunk = per_chunk_k_tokens * (
+            settings.embedding_price_per_1k + settings.llm_input_price_per_1k
+        )
+        self._cost_per_answer_char = settings.llm_output_price_per_1k / 1000
+
         # Initialize LLM
         self._init_llm()
 
@@ -73,6 +123,7 @@ class RAGService:
                 api_version=openai_config["api_version"],
                 temperature=settings.temperature_default,
                 max_tokens=settings.max_tokens,
+                http_client=get_shared_http_client(),
             )
         else:
             # Standard OpenAI
@@ -81,13 +132,24 @@ class RAGService:
                 model=openai_config.get("model", settings.openai_model),
                 temperature=settings.temperature_default,
                 max_tokens=settings.max_tokens,
+                http_client=get_shared_http_client(),
             )
 
+        # Prompt and composed chain are immutable; build them once here
+        # instead of per query
+        self._answer_prompt = PromptTemplate(
+            input_variables=["context", "question"],
+            template=_ANSWER_TEMPLATE,
+        )
+        self._answer_chain = self._answer_prompt | self.llm
+
     def index_document(
         self,
         file_path: str,
         document_id: Optional[str] = None,
         original_filename: Optional[str] = None,
+        save_metadata: bool = True,
+        chunks: Optional[List] = None,
     ) -> DocumentMetadata:
         """
         Index a document: Load → Chunk → Embed → Store
@@ -95,6 +157,12 @@ class RAGService:
         Args:
             file_path: Path to document file
             document_id: Optional document ID (generated if not provided)
+            save_metadata: Persist metadata on success; index_documents
+                passes False and batch-saves the whole run in one
+                transaction instead (failures are always saved)
+            chunks: Pre-parsed chunks for this file; index_documents
+                passes the output of its parallel parse so the file is
+                not loaded twice
 
         Returns:
             DocumentMetadata object
@@ -123,8 +191,10 @@ class RAGService:
             document_metadata.metadata["original_filename"] = original_filename
 
         try:
-            # Step 1: Process document (load and chunk)
-            chunks = self.document_processor.process_document(file_path)
+            # Step 1: Process document (load and chunk), unless the
+            # caller already parsed it
+            if chunks is None:
+                chunks = self.document_processor.process_document(file_path)
 
             # Step 2: Generate chunk IDs and add document_id to metadata
             chunk_ids = [generate_chunk_id(document_id, i) for i in range(len(chunks))]
@@ -133,16 +203,22 @@ class RAGService:
             for chunk in chunks:
                 chunk.metadata["document_id"] = document_id
 
-            # Step 3: Add to vector store
-            self.vector_store.add_documents(chunks, document_ids=chunk_ids)
-
-            # Step 4: Upload to blob storage (if configured)
-            blob_url = self.storage_service.upload_document_to_blob(
-                file_path=file_path,
-                document_id=document_id,
-                metadata={"filename": display_filename, "file_type": file_type},
-                preferred_filename=display_filename,
-            )
+            # Steps 3+4: Vector indexing and the blob upload don't depend
+            # on each other, so run them concurrently — wall clock becomes
+            # max(embed+index, upload) instead of their sum
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                index_future = executor.submit(
+                    self.vector_store.add_documents, chunks, document_ids=chunk_ids
+                )
+                upload_future = executor.submit(
+                    self.storage_service.upload_document_to_blob,
+                    file_path=file_path,
+                    document_id=document_id,
+                    metadata={"filename": display_filename, "file_type": file_type},
+                    preferred_filename=display_filename,
+                )
+                index_future.result()
+                blob_url = upload_future.result()
 
             # Step 5: Update metadata
             document_metadata.status = DocumentStatus.INDEXED
@@ -151,7 +227,8 @@ class RAGService:
             document_metadata.blob_url = blob_url
 
             # Step 6: Save metadata to Cosmos DB (if configured)
-            self.storage_service.save_document_metadata(document_metadata)
+            if save_metadata:
+                self.storage_service.save_document_metadata(document_metadata)
 
             return document_metadata
 
@@ -161,6 +238,47 @@ class RAGService:
             self.storage_service.save_document_metadata(document_metadata)
             raise
 
+    def index_documents(self, file_paths: List[str]) -> List[DocumentMetadata]:
+        """
+        Index many documents: parallel parse, single writer
+
+        All files are parsed up front across the document processor's
+        process pool (PDF parsing is the CPU-bound part of ingest), then
+        indexed one at a time so only this thread ever writes to the
+        vector store. Successful documents defer their metadata save and
+        the whole batch is written in one transaction at the end —
+        per-row commits are the dominant cost of bulk SQLite writes.
+        Failed documents record their FAILED metadata immediately inside
+        index_document and are skipped here.
+
+        Args:
+            file_paths: Paths to document files
+
+        Returns:
+            DocumentMetadata for each successfully indexed file
+        """
+        parsed = self.document_processor.process_documents_grouped(file_paths)
+
+        indexed: List[DocumentMetadata] = []
+        for file_path, chunks in zip(file_paths, parsed):
+            try:
+                if isinstance(chunks, Exception):
+                    # Re-run the file through the normal path so the
+                    # parse failure is recorded as FAILED metadata the
+                    # same way a single-file ingest would record it
+                    chunks = None
+                indexed.append(
+                    self.index_document(
+                        file_path, save_metadata=False, chunks=chunks
+                    )
+                )
+            except Exception as e:
+                logger.error("Failed to index %s: %s", file_path, e)
+
+        if indexed:
+            self.storage_service.save_document_metadata_many(indexed)
+        return indexed
+
     def query(
         self,
         request: RAGQueryRequest,
@@ -179,61 +297,40 @@ class RAGService:
         if not self.vector_store.is_initialized():
             raise ValueError("No documents indexed yet. Index documents first.")
 
-        document_name: Optional[str] = None
-        if request.document_id:
-            try:
-                document_record = self.storage_service.get_document_metadata(
-                    request.document_id
-                )
-                if document_record:
-                    document_name = document_record.filename
-            except Exception as exc:  # pragma: no cover - defensive
-                logger.warning(
-                    "Unable to fetch document metadata for document_id=%s: %s",
-                    request.document_id,
-                    exc,
-                )
+        document_name = self._resolve_document_name(request)
 
-        # Step 1: Enhance query with conversation context
-        enhanced_query = self._enhance_query(
-            request.question, request.conversation_history
-        )
+        # Steps 1-3: Enhance query, retrieve, rerank
+        relevant_docs, scored_docs = self._retrieve_documents(request)
 
-        # Step 2: Retrieve relevant chunks
-        # Build search kwargs with optional document_id filter
-        search_kwargs = {
-            "k": request.top_k * 2,
-            "fetch_k": 20,
-        }
-        
-        # Add document_id filter if provided
-        if request.document_id:
-            search_kwargs["filter"] = {"document_id": request.document_id}
-        elif request.filters:
-            # Use custom filters if provided
-            search_kwargs["filter"] = request.filters
-        
-        retriever = self.vector_store.get_retriever(
-            search_type="mmr",
-            search_kwargs=search_kwargs,
-        )
+        # One pass over the reranked docs; everything downstream (citations,
+        # summary, response metadata) reads these views. Built before answer
+        # generation, which rewrites page_content during sanitization.
+        doc_views = self._build_doc_views(scored_docs)
 
-        relevant_docs = retriever.invoke(enhanced_query)
+        # Steps 4, 6, 7: citations and related questions depend only on the
+        # retrieved docs, so run them while the LLM generates the answer --
+        # their cost hides entirely under the LLM's token latency
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            citations_future = (
+                executor.submit(self._generate_citations, doc_views)
+                if request.include_sources
+                else None
+            )
+            related_future = executor.submit(
+                self._generate_related_questions, request.question, scored_docs
+            )
 
-        # Step 3: Rerank and select top chunks
-        scored_docs = self._rerank_documents(relevant_docs, enhanced_query)[
-            : request.top_k
-        ]
+            answer, prompt_inputs = self._generate_answer(
+                question=request.question,
+                context_docs=scored_docs,
+                temperature=request.temperature,
+            )
 
-        # Step 4: Generate response
-        answer, prompt_inputs = self._generate_answer(
-            question=request.question,
-            context_docs=scored_docs,
-            temperature=request.temperature,
-            stream=request.stream,
-        )
+            citations = citations_future.result() if citations_future else []
+            related_questions = related_future.result()
 
-        # Step 5: Calculate confidence
+        # Step 5: Calculate confidence (needs the answer text, so it stays
+        # on the critical path after generation)
         confidence_score = self.confidence_calculator.calculate_confidence(
             query=request.question,
             answer=answer,
@@ -241,32 +338,12 @@ class RAGService:
             used_docs=scored_docs,
         )
 
-        # Step 6: Generate citations
-        citations = (
-            self._generate_citations(scored_docs) if request.include_sources else []
-        )
-
-        # Step 7: Generate related questions
-        related_questions = self._generate_related_questions(
-            request.question, scored_docs
-        )
-
         # Calculate metrics
         total_time_ms = (time.time() - start_time) * 1000
         estimated_cost = self._estimate_cost(len(scored_docs), len(answer))
 
         # Summaries for logging / metadata
-        retrieved_summary = [
-            {
-                "document_id": doc.metadata.get("document_id"),
-                "source": doc.metadata.get(
-                    "document_name", doc.metadata.get("source_file")
-                ),
-                "score": doc.metadata.get("score"),
-                "preview": doc.page_content[:200],
-            }
-            for doc in scored_docs
-        ]
+        retrieved_summary = self._summarize_retrieved(doc_views)
 
         logger.info(
             "Query processed | top_k=%s | retrieved=%s",
@@ -284,6 +361,206 @@ class RAGService:
             },
         }
 
+        conversation_id = self._persist_conversation(
+            request, answer, response_metadata, document_name
+        )
+
+        return RAGQueryResponse(
+            answer=answer,
+            conversation_id=conversation_id,
+            citations=citations,
+            related_questions=related_questions,
+            confidence_score=confidence_score,
+            chunks_retrieved=len(relevant_docs),
+            chunks_used=len(scored_docs),
+            total_time_ms=total_time_ms,
+            estimated_cost=estimated_cost,
+            metadata=response_metadata,
+        )
+
+    async def aquery(self, request: RAGQueryRequest) -> RAGQueryResponse:
+        """
+        Async wrapper around query() for use from async handlers
+
+        Offloads the blocking retrieval + generation pipeline to the anyio
+        threadpool so the event loop stays free to serve other requests.
+        The sync query() remains for non-FastAPI callers.
+        """
+        return await anyio.to_thread.run_sync(self.query, request)
+
+    def query_stream(self, request: RAGQueryRequest) -> Iterator[Dict[str, Any]]:
+        """
+        Execute RAG query, streaming answer deltas as the LLM produces them
+
+        Retrieval runs up front, then tokens are forwarded from the LLM
+        stream as they arrive so callers see output at time-to-first-token
+        instead of waiting for the full generation.
+
+        Yields:
+            StreamingChunk-shaped dicts: token deltas with done=False,
+            then a final done=True entry carrying citations.
+        """
+        if not self.vector_store.is_initialized():
+            raise ValueError("No documents indexed yet. Index documents first.")
+
+        document_name = self._resolve_document_name(request)
+
+        relevant_docs, scored_docs = self._retrieve_documents(request)
+        doc_views = self._build_doc_views(scored_docs)
+
+        chain, prompt_inputs = self._build_answer_chain(request.question, scored_docs)
+
+        answer_parts: List[str] = []
+        for chunk in chain.stream(prompt_inputs):
+            content = getattr(chunk, "content", "")
+            if content:
+                answer_parts.append(content)
+                yield {"chunk": content, "done": False}
+        answer = "".join(answer_parts)
+
+        citations = (
+            self._generate_citations(doc_views) if request.include_sources else []
+        )
+
+        response_metadata = {
+            "retrieved_documents": self._summarize_retrieved(doc_views),
+            "prompt": {
+                "question": prompt_inputs["question"],
+                "context_preview": prompt_inputs["context"][:500],
+            },
+        }
+
+        conversation_id = self._persist_conversation(
+            request, answer, response_metadata, document_name
+        )
+
+        yield {
+            "chunk": "",
+            "done": True,
+            "conversation_id": conversation_id,
+            "citations": [citation.model_dump(mode="json") for citation in citations],
+        }
+
+    def _resolve_document_name(self, request: RAGQueryRequest) -> Optional[str]:
+        """Look up the filename for the requested document, if any"""
+        if not request.document_id:
+            return None
+        try:
+            document_record = self.storage_service.get_document_metadata(
+                request.document_id
+            )
+            if document_record:
+                return document_record.filename
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning(
+                "Unable to fetch document metadata for document_id=%s: %s",
+                request.document_id,
+                exc,
+            )
+        return None
+
+    def _retrieve_documents(self, request: RAGQueryRequest) -> tuple[List, List]:
+        """
+        Enhance the query, retrieve relevant chunks, and rerank them
+
+        Returns:
+            Tuple of (all retrieved docs, reranked top-k docs)
+        """
+        enhanced_query = self._enhance_query(
+            request.question, request.conversation_history
+        )
+
+        # Build search kwargs with optional document_id filter
+        search_kwargs = {
+            "k": request.top_k * 2,
+            "fetch_k": 20,
+        }
+
+        # Add document_id filter if provided
+        if request.document_id:
+            search_kwargs["filter"] = {"document_id": request.document_id}
+        elif request.filters:
+            # Use custom filters if provided
+            search_kwargs["filter"] = request.filters
+
+        relevant_docs = None
+        if self._has_usable_history(request.conversation_history):
+            # Multi-turn: combine a cached context embedding with the
+            # fresh question embedding instead of re-embedding the whole
+            # enhanced-query string every turn
+            query_vector = self._embed_enhanced_query(
+                request.question, request.conversation_history
+            )
+            if query_vector is not None:
+                try:
+                    relevant_docs = self.vector_store.similarity_search_by_vector(
+                        query_vector,
+                        k=search_kwargs["k"],
+                        filter=search_kwargs.get("filter"),
+                    )
+                except Exception as e:
+                    logger.warning(
+                        "Vector-based retrieval failed, falling back to query text: %s",
+                        e,
+                    )
+
+        if relevant_docs is None:
+            retriever = self.vector_store.get_retriever(
+                search_type="mmr",
+                search_kwargs=search_kwargs,
+            )
+            relevant_docs = retriever.invoke(enhanced_query)
+
+        # Rerank and select top chunks
+        scored_docs = self._rerank_documents(
+            relevant_docs, enhanced_query, top_k=request.top_k
+        )
+        return relevant_docs, scored_docs
+
+    def _build_doc_views(self, docs: List) -> List[_DocView]:
+        """Extract the post-retrieval fields from each doc in a single pass"""
+        views = []
+        for i, doc in enumerate(docs):
+            metadata = doc.metadata
+            views.append(
+                _DocView(
+                    number=i + 1,
+                    document_id=metadata.get("document_id"),
+                    document_name=metadata.get(
+                        "document_name", metadata.get("source_file")
+                    ),
+                    chunk_id=metadata.get("chunk_id", str(i)),
+                    page=metadata.get("page", metadata.get("page_number")),
+                    score=metadata.get("score", 0.0),
+                    content=doc.page_content,
+                )
+            )
+        return views
+
+    def _summarize_retrieved(self, doc_views: List[_DocView]) -> List[Dict[str, Any]]:
+        """Build compact summaries of retrieved docs for logging / metadata"""
+        return [
+            {
+                "document_id": view.document_id,
+                "source": view.document_name,
+                "score": view.score,
+                "preview": view.content[:200],
+            }
+            for view in doc_views
+        ]
+
+    def _persist_conversation(
+        self,
+        request: RAGQueryRequest,
+        answer: str,
+        response_metadata: Dict[str, Any],
+        document_name: Optional[str] = None,
+    ) -> str:
+        """Create/update the conversation record for a completed answer"""
+        # One clock read per persist: both messages and the conversation's
+        # updated_at share it, so a turn's timestamps can't drift apart
+        now_iso = datetime.utcnow().isoformat()
+
         conversation_metadata: Dict[str, Any] = {}
         if request.document_id:
             conversation_metadata["document_id"] = request.document_id
@@ -298,8 +575,8 @@ class RAGService:
                 {
                     "conversation_id": conversation_id,
                     "title": request.question[:60] + "..." if len(request.question) > 60 else request.question,
-                    "created_at": datetime.utcnow().isoformat(),
-                    "updated_at": datetime.utcnow().isoformat(),
+                    "created_at": now_iso,
+                    "updated_at": now_iso,
                     "message_count": 0,
                     "messages": [],
                     "metadata": conversation_metadata,
@@ -320,8 +597,8 @@ class RAGService:
                         "title": request.question[:60] + "..."
                         if len(request.question) > 60
                         else request.question,
-                        "created_at": datetime.utcnow().isoformat(),
-                        "updated_at": datetime.utcnow().isoformat(),
+                        "created_at": now_iso,
+                        "updated_at": now_iso,
                         "message_count": 0,
                         "messages": [],
                         "metadata": conversation_metadata,
@@ -329,17 +606,16 @@ class RAGService:
                 )
 
         if conversation_id:
-            message_timestamp = datetime.utcnow().isoformat()
             conversation_messages = [
                 {
                     "role": "user",
                     "content": request.question,
-                    "timestamp": message_timestamp,
+                    "timestamp": now_iso,
                 },
                 {
                     "role": "assistant",
                     "content": answer,
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": now_iso,
                     "metadata": response_metadata,
                 },
             ]
@@ -347,23 +623,28 @@ class RAGService:
                 conversation_id,
                 conversation_messages,
                 metadata=conversation_metadata if conversation_metadata else None,
+                updated_at=now_iso,
             )
             if not appended:
                 logger.warning(
                     "Failed to append messages to conversation_id=%s", conversation_id
                 )
 
-        return RAGQueryResponse(
-            answer=answer,
-            conversation_id=conversation_id,
-            citations=citations,
-            related_questions=related_questions,
-            confidence_score=confidence_score,
-            chunks_retrieved=len(relevant_docs),
-            chunks_used=len(scored_docs),
-            total_time_ms=total_time_ms,
-            estimated_cost=estimated_cost,
-            metadata=response_metadata,
+        return conversation_id
+
+    # A single prior message (typically just the user's first question
+    # echoed back) adds no retrieval signal, so context enhancement only
+    # kicks in from the second turn onwards
+    _MIN_HISTORY_FOR_CONTEXT = 2
+
+    @classmethod
+    def _has_usable_history(
+        cls, conversation_history: Optional[List[ChatMessage]]
+    ) -> bool:
+        """True when the history is long enough to be worth embedding"""
+        return (
+            conversation_history is not None
+            and len(conversation_history) >= cls._MIN_HISTORY_FOR_CONTEXT
         )
 
     def _enhance_query(
@@ -371,8 +652,13 @@ class RAGService:
         question: str,
         conversation_history: Optional[List[ChatMessage]] = None,
     ) -> str:
-        """Enhance query with conversation context"""
-        if not conversation_history:
+        """Enhance query with conversation context
+
+        First-turn and single-message histories return the question
+        verbatim: no context string is built or embedded, which keeps the
+        embedding input (and its token cost) to just the question.
+        """
+        if not self._has_usable_history(conversation_history):
             return question
 
         # Build context from recent messages
@@ -382,28 +668,89 @@ class RAGService:
 
         return f"Context from conversation:\n{context}\n\nQuestion: {question}"
 
+    # Weight of the fresh question vs. the rolling conversation context
+    # when combining embeddings for retrieval
+    _QUESTION_WEIGHT = 0.7
+    _CONTEXT_EMBED_CACHE_MAXSIZE = 128
+
+    def _embed_enhanced_query(
+        self,
+        question: str,
+        conversation_history: List[ChatMessage],
+    ):
+        """Embed question + conversation context, caching the context part
+
+        Consecutive turns share most of their recent history, so the
+        context embedding is memoized on the last five (role, content)
+        pairs; only the question itself is embedded fresh each turn.
+        Returns a unit-norm combined vector, or None if embedding fails.
+        """
+        recent = conversation_history[-5:]
+        context = "\n".join(f"{msg.role}: {msg.content}" for msg in recent)
+
+        try:
+            cache_key = hash(tuple((msg.role, msg.content) for msg in recent))
+            context_vector = self._context_embed_cache.get(cache_key)
+            if context_vector is None:
+                context_vector = np.asarray(
+                    self.embedding_service.embed_text(context), dtype=np.float32
+                )
+                self._context_embed_cache[cache_key] = context_vector
+                if len(self._context_embed_cache) > self._CONTEXT_EMBED_CACHE_MAXSIZE:
+                    self._context_embed_cache.pop(
+                        next(iter(self._context_embed_cache))
+                    )
+
+            question_vector = np.asarray(
+                self.embedding_service.embed_text(question), dtype=np.float32
+            )
+            combined = (
+                self._QUESTION_WEIGHT * question_vector
+                + (1.0 - self._QUESTION_WEIGHT) * context_vector
+            )
+            norm = np.linalg.norm(combined)
+            if norm:
+                combined /= norm
+            return combined.tolist()
+        except Exception as e:
+            logger.warning("Failed to build combined query embedding: %s", e)
+            return None
+
     def _rerank_documents(
         self,
         documents: List,
         query: str,
+        top_k: Optional[int] = None,
     ) -> List:
         """Rerank documents by relevance"""
-        # Simple reranking: sort by similarity score if available
+        # Simple reranking: order by similarity score if available
         # In production, use a dedicated reranking model
-        if hasattr(documents[0], "metadata") and "score" in documents[0].metadata:
-            return sorted(
-                documents, key=lambda d: d.metadata.get("score", 0), reverse=True
-            )
-        return documents
+        if not documents:
+            return documents
+        if not (hasattr(documents[0], "metadata") and "score" in documents[0].metadata):
+            return documents
+
+        scores = np.fromiter(
+            (d.metadata.get("score", 0.0) for d in documents),
+            dtype=np.float32,
+            count=len(documents),
+        )
+        if top_k is not None and top_k < len(documents):
+            # argpartition selects the top_k in O(N); only that slice is
+            # then sorted — cheaper than sorting every candidate once
+            # fetch sizes grow beyond a handful
+            idx = np.argpartition(-scores, top_k)[:top_k]
+            idx = idx[np.argsort(-scores[idx])]
+        else:
+            idx = np.argsort(-scores)
+        return [documents[i] for i in idx]
 
-    def _generate_answer(
+    def _build_answer_chain(
         self,
         question: str,
         context_docs: List,
-        temperature: float = 0.3,
-        stream: bool = False,
-    ) -> tuple[str, Dict[str, str]]:
-        """Generate answer using LLM and return prompt inputs for tracking"""
+    ) -> tuple[Any, Dict[str, str]]:
+        """Build the LLM chain and prompt inputs shared by both answer paths"""
         sanitized_docs = self._sanitize_context_docs(context_docs)
         context = self._build_context_from_docs(sanitized_docs)
 
@@ -412,40 +759,28 @@ class RAGService:
             "question": question,
         }
 
-        # Create prompt
-        prompt_template = PromptTemplate(
-            input_variables=["context", "question"],
-            template="""You are a helpful AI assistant. Answer the question based ONLY on the following context. Always cite your sources using [1], [2], etc.
-
-Context:
-{context}
-
-Question: {question}
+        return self._answer_chain, prompt_inputs
 
-Answer:""",
-        )
+    def _generate_answer(
+        self,
+        question: str,
+        context_docs: List,
+        temperature: float = 0.3,
+    ) -> tuple[str, Dict[str, str]]:
+        """Generate answer using LLM and return prompt inputs for tracking
 
-        # Generate response
-        chain = prompt_template | self.llm
+        Callers that want token-level streaming should use query_stream(),
+        which forwards deltas as the LLM produces them; this path always
+        returns the complete answer.
+        """
+        chain, prompt_inputs = self._build_answer_chain(question, context_docs)
 
         try:
-            if stream:
-                # Streaming response
-                response = chain.stream(prompt_inputs)
-                # For streaming, we'd need to handle this differently
-                # For now, collect all chunks
-                answer_parts = []
-                for chunk in response:
-                    if hasattr(chunk, "content"):
-                        answer_parts.append(chunk.content)
-                return "".join(answer_parts), prompt_inputs
-            else:
-                # Non-streaming response
-                response = chain.invoke(prompt_inputs)
-                answer_text = (
-                    response.content if hasattr(response, "content") else str(response)
-                )
-                return answer_text, prompt_inputs
+            response = chain.invoke(prompt_inputs)
+            answer_text = (
+                response.content if hasattr(response, "content") else str(response)
+            )
+            return answer_text, prompt_inputs
         except BadRequestError as exc:
             error_text = str(exc)
             if "content management policy" in error_text or "content_filter" in error_text:
@@ -553,29 +888,27 @@ Answer:""",
             summary_parts.append(sentences[0][:max_chars])
         return " ".join(summary_parts)
 
-    def _generate_citations(self, documents: List) -> List[Citation]:
+    def _generate_citations(self, doc_views: List[_DocView]) -> List[Citation]:
         """Generate citations from retrieved documents"""
-        citations = []
-        for i, doc in enumerate(documents):
-            metadata = doc.metadata
-            citations.append(
-                Citation(
-                    number=i + 1,
-                    document_id=metadata.get("document_id", "unknown"),
-                    document_name=metadata.get(
-                        "document_name", metadata.get("source_file", "unknown")
-                    ),
-                    chunk_id=metadata.get("chunk_id", str(i)),
-                    page=metadata.get("page", metadata.get("page_number")),
-                    content=(
-                        doc.page_content[:200] + "..."
-                        if len(doc.page_content) > 200
-                        else doc.page_content
-                    ),
-                    score=metadata.get("score", 0.0),
-                )
-            )
-        return citations
+        # Build plain dicts and validate the whole list in one
+        # pydantic-core call instead of constructing models one by one
+        raw_citations = [
+            {
+                "number": view.number,
+                "document_id": view.document_id or "unknown",
+                "document_name": view.document_name or "unknown",
+                "chunk_id": view.chunk_id,
+                "page": view.page,
+                "content": (
+                    view.content[:200] + "..."
+                    if len(view.content) > 200
+                    else view.content
+                ),
+                "score": view.score,
+            }
+            for view in doc_views
+        ]
+        return CITATION_LIST_ADAPTER.validate_python(raw_citations)
 
     def _generate_related_questions(
         self,
@@ -588,14 +921,11 @@ Answer:""",
         return []
 
     def _estimate_cost(self, num_chunks: int, answer_length: int) -> float:
-        """Estimate API cost"""
-        # Rough estimation
-        # Embedding cost: ~$0.00013 per 1K tokens
-        # GPT-4 cost: ~$0.03 per 1K input tokens, $0.06 per 1K output tokens
-        embedding_cost = (num_chunks * 512 / 1000) * 0.00013
-        input_cost = (num_chunks * 512 / 1000) * 0.03
-        output_cost = (answer_length / 1000) * 0.06
-        return embedding_cost + input_cost + output_cost
+        """Estimate API cost (rough; prices configured in settings)"""
+        return (
+            num_chunks * self._cost_per_chunk
+            + answer_length * self._cost_per_answer_char
+        )
 
     def delete_document(self, document_id: str) -> bool:
         """
@@ -3,19 +3,55 @@ Storage service - handles Azure Blob Storage and Cosmos DB operations
 Falls back to local SQLite storage when Azure is not configured
 """
 
+import asyncio
+import logging
 import os
+import threading
 from typing import Optional, Dict, Any, List
 from datetime import datetime
+
+import anyio.to_thread
+from cachetools import TTLCache
 from azure.storage.blob import BlobServiceClient, BlobClient
-from azure.core.exceptions import AzureError
+from azure.core.exceptions import AzureError, ResourceExistsError
+
+try:
+    # Async file reads for the async upload path; optional like the
+    # async SDK clients themselves
+    import aiofiles
+except ImportError:  # pragma: no cover - optional dependency
+    aiofiles = None
 
 from app.core.config import settings
 from app.core.azure_clients import azure_clients
-from app.models.document import DocumentMetadata, DocumentStatus
+from app.models.document import (
+    DOCUMENT_METADATA_ADAPTER,
+    DOCUMENT_METADATA_LIST_ADAPTER,
+    DocumentMetadata,
+    DocumentStatus,
+    DocumentSummary,
+)
 from app.utils.file_utils import sanitize_filename
 from app.services.local_metadata_store import LocalMetadataStore
 
 
+logger = logging.getLogger("document_rag_api")
+
+
+# Cosmos DB bookkeeping fields stripped from items before they leave the
+# storage layer
+# _partitionKey is not written anymore (the partition key is derived from
+# the id path), but items saved by older builds still carry it
+_COSMOS_META = frozenset(
+    {"_rid", "_self", "_etag", "_attachments", "_ts", "_partitionKey"}
+)
+
+
+def _strip_cosmos(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop Cosmos internal fields in one pass over the item"""
+    return {k: v for k, v in item.items() if k not in _COSMOS_META}
+
+
 class StorageService:
     """Handles document storage in Azure Blob and Cosmos DB with local fallback"""
 
@@ -23,6 +59,27 @@ class StorageService:
         self.blob_client = azure_clients.blob_client
         self.documents_container = azure_clients.documents_container
         self.conversations_container = azure_clients.conversations_container
+        self.messages_container = azure_clients.messages_container
+
+        # One ContainerClient for the process; existence is verified at
+        # most once instead of an exists() HEAD per upload
+        self._container_client = (
+            self.blob_client.get_container_client(
+                settings.azure_storage_container_name
+            )
+            if self.blob_client
+            else None
+        )
+        self._container_ready = False
+
+        # Read-through caches for hot metadata lookups: a hit skips the
+        # Cosmos read_item (or SQLite read) entirely. Entries age out
+        # after 60 s and writers invalidate their key eagerly. TTLCache
+        # is not thread-safe and these are hit from threadpool workers,
+        # so every access holds the lock.
+        self._cache_lock = threading.Lock()
+        self._doc_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+        self._conv_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
 
         # Use local storage as fallback if Cosmos DB is not configured
         self.use_local_storage = self.documents_container is None
@@ -31,6 +88,20 @@ class StorageService:
         else:
             self.local_store = None
 
+    def _ensure_container(self) -> None:
+        """Create the blob container once; later calls are a flag check
+
+        create_container is idempotent via ResourceExistsError, so this
+        replaces the per-upload exists() HEAD round-trip.
+        """
+        if self._container_ready or self._container_client is None:
+            return
+        try:
+            self._container_client.create_container()
+        except ResourceExistsError:
+            pass
+        self._container_ready = True
+
     def upload_document_to_blob(
         self,
         file_path: str,
@@ -53,37 +124,111 @@ class StorageService:
             return None
 
         try:
-            # Get container client
-            container_client = self.blob_client.get_container_client(
-                settings.azure_storage_container_name
-            )
-
-            # Create container if it doesn't exist
-            if not container_client.exists():
-                container_client.create_container()
+            container_client = self._container_client
+            self._ensure_container()
 
             base_name = preferred_filename or os.path.basename(file_path)
             filename = sanitize_filename(base_name)
             blob_name = f"{document_id}/{filename}"
 
-            # Upload file
+            # Upload file. Passing the exact length skips the SDK's
+            # stream size probing, and max_concurrency lets it stage
+            # blocks in parallel for files over max_single_put_size.
+            size = os.stat(file_path).st_size
             blob_client = container_client.get_blob_client(blob_name)
             with open(file_path, "rb") as data:
                 blob_client.upload_blob(
                     data,
                     overwrite=True,
                     metadata=metadata or {},
+                    length=size,
+                    max_concurrency=settings.blob_upload_concurrency,
                 )
 
             return blob_client.url
-        except AzureError as e:
-            print(f"Error uploading to blob storage: {e}")
+        except AzureError:
+            logger.exception("Error uploading to blob storage")
+            return None
+
+    async def upload_document_to_blob_async(
+        self,
+        file_path: str,
+        document_id: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        preferred_filename: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Upload document to Azure Blob Storage without blocking the event loop
+
+        Uses the async SDK client, which stages large files as 50 MiB
+        blocks and uploads blob_upload_concurrency of them in parallel —
+        multi-MB PDFs stop being bound to a single TCP stream. Falls back
+        to the sync upload on a worker thread when the async client is
+        unavailable.
+
+        Args:
+            file_path: Local file path
+            document_id: Unique document identifier
+            metadata: Optional blob metadata
+            preferred_filename: Filename to use instead of the local one
+
+        Returns:
+            Blob URL if successful, None otherwise
+        """
+        blob_service = azure_clients.blob_client_async
+        if blob_service is None:
+            return await anyio.to_thread.run_sync(
+                lambda: self.upload_document_to_blob(
+                    file_path, document_id, metadata, preferred_filename
+                )
+            )
+
+        try:
+            container_client = blob_service.get_container_client(
+                settings.azure_storage_container_name
+            )
+            if not self._container_ready:
+                try:
+                    await container_client.create_container()
+                except ResourceExistsError:
+                    pass
+                self._container_ready = True
+
+            base_name = preferred_filename or os.path.basename(file_path)
+            filename = sanitize_filename(base_name)
+            blob_name = f"{document_id}/{filename}"
+
+            size = os.stat(file_path).st_size
+            blob_client = container_client.get_blob_client(blob_name)
+            if aiofiles is not None:
+                async with aiofiles.open(file_path, "rb") as data:
+                    await blob_client.upload_blob(
+                        data,
+                        overwrite=True,
+                        metadata=metadata or {},
+                        length=size,
+                        max_concurrency=settings.blob_upload_concurrency,
+                    )
+            else:
+                with open(file_path, "rb") as data:
+                    await blob_client.upload_blob(
+                        data,
+                        overwrite=True,
+                        metadata=metadata or {},
+                        length=size,
+                        max_concurrency=settings.blob_upload_concurrency,
+                    )
+
+            return blob_client.url
+        except AzureError:
+            logger.exception("Error uploading to blob storage")
             return None
 
     def download_document_from_blob(
         self,
         document_id: str,
         local_path: str,
+        filename: Optional[str] = None,
     ) -> bool:
         """
         Download document from Azure Blob Storage
@@ -91,6 +236,8 @@ class StorageService:
         Args:
             document_id: Document identifier
             local_path: Local path to save file
+            filename: Blob filename if the caller already knows it (from
+                DocumentMetadata); skips the listing round-trip
 
         Returns:
             True if successful
@@ -99,25 +246,135 @@ class StorageService:
             return False
 
         try:
-            container_client = self.blob_client.get_container_client(
+            container_client = self._container_client
+
+            # Blob names are deterministic ({document_id}/{filename}), so
+            # a known filename means one GET with no LIST; otherwise ask
+            # the listing for a single entry instead of materializing the
+            # whole prefix.
+            if filename:
+                blob_name = f"{document_id}/{sanitize_filename(filename)}"
+            else:
+                first_blob = next(
+                    iter(
+                        container_client.list_blobs(
+                            name_starts_with=document_id, results_per_page=1
+                        )
+                    ),
+                    None,
+                )
+                if first_blob is None:
+                    return False
+                blob_name = first_blob.name
+
+            # Parallel ranged GETs, streamed straight into the file via
+            # readinto() so memory stays flat regardless of blob size.
+            blob_client = container_client.get_blob_client(blob_name)
+            stream = blob_client.download_blob(
+                max_concurrency=settings.blob_download_concurrency
+            )
+            with open(local_path, "wb") as download_file:
+                stream.readinto(download_file)
+
+            return True
+        except AzureError:
+            logger.exception("Error downloading from blob storage")
+            return False
+
+    async def download_document_from_blob_async(
+        self,
+        document_id: str,
+        local_path: str,
+        filename: Optional[str] = None,
+    ) -> bool:
+        """
+        Download document from Azure Blob Storage without blocking the event loop
+
+        The async client issues the parallel ranged GETs as awaits while
+        aiofiles keeps the disk writes off the loop, so network and file
+        I/O overlap instead of pinning a worker thread. Falls back to the
+        sync download on a worker thread when either async dependency is
+        unavailable.
+
+        Args:
+            document_id: Document identifier
+            local_path: Local path to save file
+            filename: Blob filename if the caller already knows it (from
+                DocumentMetadata); skips the listing round-trip
+
+        Returns:
+            True if successful
+        """
+        blob_service = azure_clients.blob_client_async
+        if blob_service is None or aiofiles is None:
+            return await anyio.to_thread.run_sync(
+                lambda: self.download_document_from_blob(
+                    document_id, local_path, filename
+                )
+            )
+
+        try:
+            container_client = blob_service.get_container_client(
                 settings.azure_storage_container_name
             )
 
-            # List blobs with prefix
-            blobs = container_client.list_blobs(name_starts_with=document_id)
-            blob_list = list(blobs)
+            if filename:
+                blob_name = f"{document_id}/{sanitize_filename(filename)}"
+            else:
+                first_blob = None
+                async for blob in container_client.list_blobs(
+                    name_starts_with=document_id, results_per_page=1
+                ):
+                    first_blob = blob
+                    break
+                if first_blob is None:
+                    return False
+                blob_name = first_blob.name
 
-            if not blob_list:
-                return False
+            blob_client = container_client.get_blob_client(blob_name)
+            stream = await blob_client.download_blob(
+                max_concurrency=settings.blob_download_concurrency
+            )
+            async with aiofiles.open(local_path, "wb") as download_file:
+                async for chunk in stream.chunks():
+                    await download_file.write(chunk)
 
-            # Download first blob (assuming one file per document)
-            blob_client = container_client.get_blob_client(blob_list[0].name)
-            with open(local_path, "wb") as download_file:
-                download_file.write(blob_client.download_blob().readall())
+            return True
+        except AzureError:
+            logger.exception("Error downloading from blob storage")
+            return False
 
+    def update_blob_metadata(
+        self,
+        document_id: str,
+        filename: str,
+        metadata: Dict[str, str],
+    ) -> bool:
+        """
+        Update a blob's metadata headers without re-uploading the body
+
+        set_blob_metadata is a header-only PUT, so status flips and other
+        metadata-only changes cost nothing in body bytes.
+
+        Args:
+            document_id: Document identifier
+            filename: Blob filename (as stored in DocumentMetadata)
+            metadata: Replacement metadata headers
+
+        Returns:
+            True if successful
+        """
+        if not self.blob_client:
+            return False
+
+        try:
+            blob_name = f"{document_id}/{sanitize_filename(filename)}"
+            self._container_client.get_blob_client(blob_name).set_blob_metadata(
+                metadata
+            )
             return True
-        except AzureError as e:
-            print(f"Error downloading from blob storage: {e}")
+        except AzureError:
+            logger.exception("Error updating blob metadata")
             return False
 
     def delete_document_from_blob(self, document_id: str) -> bool:
@@ -134,19 +391,23 @@ class StorageService:
             return False
 
         try:
-            container_client = self.blob_client.get_container_client(
-                settings.azure_storage_container_name
-            )
-
-            # List and delete all blobs with prefix
-            blobs = container_client.list_blobs(name_starts_with=document_id)
-            for blob in blobs:
-                blob_client = container_client.get_blob_client(blob.name)
-                blob_client.delete_blob()
+            container_client = self._container_client
+
+            # Batched multi-delete: one request covers up to 256 blobs
+            # instead of a full HTTPS round-trip per blob. A failed
+            # sub-response raises and is reported like any other error.
+            names = [
+                blob.name
+                for blob in container_client.list_blobs(
+                    name_starts_with=document_id
+                )
+            ]
+            for start in range(0, len(names), 256):
+                container_client.delete_blobs(*names[start : start + 256])
 
             return True
-        except AzureError as e:
-            print(f"Error deleting from blob storage: {e}")
+        except AzureError:
+            logger.exception("Error deleting from blob storage")
             return False
 
     def save_document_metadata(
@@ -162,6 +423,9 @@ class StorageService:
         Returns:
             True if successful
         """
+        with self._cache_lock:
+            self._doc_cache.pop(document_metadata.document_id, None)
+
         if self.use_local_storage:
             return self.local_store.save_document_metadata(document_metadata)
 
@@ -169,16 +433,91 @@ class StorageService:
             return False
 
         try:
-            # Convert to dict
-            doc_dict = document_metadata.model_dump(mode="json")
-            doc_dict["id"] = document_metadata.document_id
-            doc_dict["_partitionKey"] = document_metadata.document_id
+            self.documents_container.upsert_item(
+                self._document_item(document_metadata)
+            )
+            return True
+        except Exception:
+            logger.exception("Error saving document metadata")
+            return False
+
+    def save_document_metadata_many(
+        self,
+        items: List[DocumentMetadata],
+    ) -> bool:
+        """
+        Save many document metadata records at once
+
+        The local SQLite store writes the whole batch in one transaction;
+        Cosmos DB has no batch upsert across partition keys, so it falls
+        back to per-item saves.
+
+        Args:
+            items: Document metadata objects
+
+        Returns:
+            True if every record was saved
+        """
+        for item in items:
+            with self._cache_lock:
+                self._doc_cache.pop(item.document_id, None)
+
+        if self.use_local_storage:
+            return self.local_store.save_document_metadata_many(items)
 
-            # Upsert document
-            self.documents_container.upsert_item(doc_dict)
+        return all(self.save_document_metadata(item) for item in items)
+
+    @staticmethod
+    def _document_item(document_metadata: DocumentMetadata) -> Dict[str, Any]:
+        """Build the Cosmos item dict for a document metadata record"""
+        doc_dict = document_metadata.model_dump(mode="json")
+        doc_dict["id"] = document_metadata.document_id
+        return doc_dict
+
+    async def save_document_metadata_many_async(
+        self,
+        items: List[DocumentMetadata],
+    ) -> bool:
+        """
+        Save many document metadata records with overlapped Cosmos upserts
+
+        Each document is its own partition key, so a transactional batch
+        (single-partition only) can't cover the set; instead the upserts
+        are issued concurrently on the async container, overlapping the
+        per-item round-trips. Falls back to the sync batch path on a
+        worker thread when Cosmos or its async client is unavailable.
+
+        Args:
+            items: Document metadata objects
+
+        Returns:
+            True if every record was saved
+        """
+        if not items:
             return True
-        except Exception as e:
-            print(f"Error saving document metadata: {e}")
+
+        for item in items:
+            with self._cache_lock:
+                self._doc_cache.pop(item.document_id, None)
+
+        container = (
+            None if self.use_local_storage else azure_clients.documents_container_async
+        )
+        if container is None:
+            return await anyio.to_thread.run_sync(
+                lambda: self.save_document_metadata_many(items)
+            )
+
+        try:
+            await asyncio.gather(
+                *(
+                    container.upsert_item(self._document_item(item))
+                    for item in items
+                )
+            )
+            return True
+        except Exception:
+            logger.exception("Error batch-saving document metadata")
             return False
 
     def get_document_metadata(self, document_id: str) -> Optional[DocumentMetadata]:
@@ -191,8 +530,17 @@ class StorageService:
         Returns:
             DocumentMetadata if found, None otherwise
         """
+        with self._cache_lock:
+            cached = self._doc_cache.get(document_id)
+        if cached is not None:
+            return cached
+
         if self.use_local_storage:
-            return self.local_store.get_document_metadata(document_id)
+            document = self.local_store.get_document_metadata(document_id)
+            if document is not None:
+                with self._cache_lock:
+                    self._doc_cache[document_id] = document
+            return document
 
         if not self.documents_container:
             return None
@@ -203,46 +551,53 @@ class StorageService:
                 partition_key=document_id,
             )
 
-            # Remove Cosmos DB internal fields
-            item.pop("_rid", None)
-            item.pop("_self", None)
-            item.pop("_etag", None)
-            item.pop("_attachments", None)
-            item.pop("_ts", None)
-            item.pop("_partitionKey", None)
-
-            return DocumentMetadata(**item)
-        except Exception as e:
-            print(f"Error getting document metadata: {e}")
+            document = DOCUMENT_METADATA_ADAPTER.validate_python(
+                _strip_cosmos(item)
+            )
+            with self._cache_lock:
+                self._doc_cache[document_id] = document
+            return document
+        except Exception:
+            logger.exception("Error getting document metadata")
             return None
 
     def list_documents(
         self,
         limit: int = 100,
         offset: int = 0,
+        status: Optional[DocumentStatus] = None,
     ) -> List[DocumentMetadata]:
         """
-        List all documents from Cosmos DB or local storage
+        List documents from Cosmos DB or local storage
 
         Args:
             limit: Maximum number of documents to return
             offset: Number of documents to skip
+            status: Only return documents in this status
 
         Returns:
             List of DocumentMetadata objects
         """
         if self.use_local_storage:
-            return self.local_store.list_documents(limit=limit, offset=offset)
+            return self.local_store.list_documents(
+                limit=limit, offset=offset, status=status
+            )
 
         if not self.documents_container:
             return []
 
         try:
-            query = "SELECT * FROM c ORDER BY c.upload_time DESC OFFSET @offset LIMIT @limit"
+            where = "WHERE c.status = @status " if status is not None else ""
+            query = (
+                f"SELECT * FROM c {where}"
+                "ORDER BY c.upload_time DESC OFFSET @offset LIMIT @limit"
+            )
             parameters = [
                 {"name": "@offset", "value": offset},
                 {"name": "@limit", "value": limit},
             ]
+            if status is not None:
+                parameters.append({"name": "@status", "value": status.value})
 
             items = self.documents_container.query_items(
                 query=query,
@@ -250,21 +605,113 @@ class StorageService:
                 enable_cross_partition_query=True,
             )
 
-            documents = []
-            for item in items:
-                # Remove Cosmos DB internal fields
-                item.pop("_rid", None)
-                item.pop("_self", None)
-                item.pop("_etag", None)
-                item.pop("_attachments", None)
-                item.pop("_ts", None)
-                item.pop("_partitionKey", None)
-
-                documents.append(DocumentMetadata(**item))
-
-            return documents
-        except Exception as e:
-            print(f"Error listing documents: {e}")
+            return DOCUMENT_METADATA_LIST_ADAPTER.validate_python(
+                [_strip_cosmos(item) for item in items]
+            )
+        except Exception:
+            logger.exception("Error listing documents")
+            return []
+
+    async def list_documents_async(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        status: Optional[DocumentStatus] = None,
+    ) -> List[DocumentMetadata]:
+        """
+        List documents without blocking the event loop
+
+        Runs the paged query on the async Cosmos container and consumes
+        the result pages as they arrive, so the network waits become
+        awaits instead of tying up a threadpool worker. Falls back to the
+        sync listing on a worker thread when Cosmos or its async client
+        is unavailable.
+
+        Args:
+            limit: Maximum number of documents to return
+            offset: Number of documents to skip
+            status: Only return documents in this status
+
+        Returns:
+            List of DocumentMetadata objects
+        """
+        container = (
+            None if self.use_local_storage else azure_clients.documents_container_async
+        )
+        if container is None:
+            return await anyio.to_thread.run_sync(
+                lambda: self.list_documents(limit=limit, offset=offset, status=status)
+            )
+
+        try:
+            where = "WHERE c.status = @status " if status is not None else ""
+            query = (
+                f"SELECT * FROM c {where}"
+                "ORDER BY c.upload_time DESC OFFSET @offset LIMIT @limit"
+            )
+            parameters = [
+                {"name": "@offset", "value": offset},
+                {"name": "@limit", "value": limit},
+            ]
+            if status is not None:
+                parameters.append({"name": "@status", "value": status.value})
+
+            rows = [
+                _strip_cosmos(item)
+                async for item in container.query_items(
+                    query=query,
+                    parameters=parameters,
+                )
+            ]
+            return DOCUMENT_METADATA_LIST_ADAPTER.validate_python(rows)
+        except Exception:
+            logger.exception("Error listing documents")
+            return []
+
+    def list_documents_summary(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[DocumentSummary]:
+        """
+        List documents projected down to the list-view fields
+
+        Cosmos only reads (and charges for) the projected columns, and
+        Pydantic validates a handful of fields per row instead of the
+        full record.
+
+        Args:
+            limit: Maximum number of documents to return
+            offset: Number of documents to skip
+
+        Returns:
+            List of DocumentSummary objects
+        """
+        if self.use_local_storage:
+            return self.local_store.list_document_summaries(
+                limit=limit, offset=offset
+            )
+
+        if not self.documents_container:
+            return []
+
+        try:
+            query = (
+                "SELECT c.document_id, c.filename, c.file_type, c.file_size, "
+                "c.upload_time, c.status, c.chunk_count "
+                "FROM c ORDER BY c.upload_time DESC OFFSET @offset LIMIT @limit"
+            )
+            items = self.documents_container.query_items(
+                query=query,
+                parameters=[
+                    {"name": "@offset", "value": offset},
+                    {"name": "@limit", "value": limit},
+                ],
+                enable_cross_partition_query=True,
+            )
+            return [DocumentSummary(**item) for item in items]
+        except Exception:
+            logger.exception("Error listing document summaries")
             return []
 
     def delete_document_metadata(self, document_id: str) -> bool:
@@ -277,6 +724,9 @@ class StorageService:
         Returns:
             True if successful
         """
+        with self._cache_lock:
+            self._doc_cache.pop(document_id, None)
+
         if self.use_local_storage:
             return self.local_store.delete_document_metadata(document_id)
 
@@ -289,8 +739,8 @@ class StorageService:
                 partition_key=document_id,
             )
             return True
-        except Exception as e:
-            print(f"Error deleting document metadata: {e}")
+        except Exception:
+            logger.exception("Error deleting document metadata")
             return False
 
     def save_conversation(
@@ -308,6 +758,9 @@ class StorageService:
         Returns:
             True if successful
         """
+        with self._cache_lock:
+            self._conv_cache.pop(conversation_id, None)
+
         if self.use_local_storage:
             return self.local_store.save_conversation(
                 conversation_id, conversation_data
@@ -318,11 +771,10 @@ class StorageService:
 
         try:
             conversation_data["id"] = conversation_id
-            conversation_data["_partitionKey"] = conversation_id
             self.conversations_container.upsert_item(conversation_data)
             return True
-        except Exception as e:
-            print(f"Error saving conversation: {e}")
+        except Exception:
+            logger.exception("Error saving conversation")
             return False
 
     def get_conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
@@ -335,8 +787,17 @@ class StorageService:
         Returns:
             Conversation data if found, None otherwise
         """
+        with self._cache_lock:
+            cached = self._conv_cache.get(conversation_id)
+        if cached is not None:
+            return cached
+
         if self.use_local_storage:
-            return self.local_store.get_conversation(conversation_id)
+            conversation = self.local_store.get_conversation(conversation_id)
+            if conversation is not None:
+                with self._cache_lock:
+                    self._conv_cache[conversation_id] = conversation
+            return conversation
 
         if not self.conversations_container:
             return None
@@ -347,17 +808,29 @@ class StorageService:
                 partition_key=conversation_id,
             )
 
-            # Remove Cosmos DB internal fields
-            item.pop("_rid", None)
-            item.pop("_self", None)
-            item.pop("_etag", None)
-            item.pop("_attachments", None)
-            item.pop("_ts", None)
-            item.pop("_partitionKey", None)
+            item = _strip_cosmos(item)
+
+            # Messages may live in the dedicated container; prefer those
+            # rows over the (possibly stale) embedded blob
+            if self.messages_container is not None:
+                rows = list(
+                    self.messages_container.query_items(
+                        query=(
+                            "SELECT * FROM c WHERE c.conversation_id = @cid "
+                            "ORDER BY c.seq"
+                        ),
+                        parameters=[{"name": "@cid", "value": conversation_id}],
+                        partition_key=conversation_id,
+                    )
+                )
+                if rows:
+                    item["messages"] = [_strip_cosmos(row) for row in rows]
 
+            with self._cache_lock:
+                self._conv_cache[conversation_id] = item
             return item
-        except Exception as e:
-            print(f"Error getting conversation: {e}")
+        except Exception:
+            logger.exception("Error getting conversation")
             return None
 
     def append_conversation_messages(
@@ -365,16 +838,132 @@ class StorageService:
         conversation_id: str,
         messages: List[Dict[str, Any]],
         metadata: Optional[Dict[str, Any]] = None,
+        updated_at: Optional[str] = None,
     ) -> bool:
-        """Append messages to an existing conversation"""
+        """Append messages to an existing conversation
+
+        Args:
+            conversation_id: Conversation identifier
+            messages: Message dicts to append
+            metadata: Optional metadata merged into the conversation's
+            updated_at: ISO timestamp for the conversation header; lets
+                callers stamp messages and header from one clock read
+        """
+        with self._cache_lock:
+            self._conv_cache.pop(conversation_id, None)
+
         if self.use_local_storage:
             return self.local_store.append_conversation_messages(
-                conversation_id, messages, metadata
+                conversation_id, messages, metadata, updated_at=updated_at
             )
 
         if not self.conversations_container:
             return False
 
+        # When a dedicated messages container is configured, each turn is
+        # its own item and append cost stays O(M) regardless of history
+        # length; the conversation document only carries the header.
+        if self.messages_container is not None:
+            return self._append_messages_items(
+                conversation_id, messages, metadata, updated_at
+            )
+
+        # Server-side patch: one round-trip that appends the new messages
+        # in place, instead of reading and rewriting the entire document.
+        # Cosmos caps a patch at 10 operations, so oversized appends (and
+        # patch failures, e.g. old SDKs) fall back to read-modify-write.
+        patch_operations = [
+            {"op": "add", "path": "/messages/-", "value": message}
+            for message in messages
+        ]
+        patch_operations.append(
+            {
+                "op": "set",
+                "path": "/updated_at",
+                "value": updated_at or datetime.utcnow().isoformat(),
+            }
+        )
+        patch_operations.append(
+            {"op": "incr", "path": "/message_count", "value": len(messages)}
+        )
+        if metadata:
+            for key, value in metadata.items():
+                patch_operations.append(
+                    {"op": "set", "path": f"/metadata/{key}", "value": value}
+                )
+
+        if len(patch_operations) <= 10:
+            try:
+                self.conversations_container.patch_item(
+                    item=conversation_id,
+                    partition_key=conversation_id,
+                    patch_operations=patch_operations,
+                )
+                return True
+            except Exception as e:
+                logger.warning(
+                    "Patch append failed, falling back to full rewrite: %s", e
+                )
+
+        return self._append_messages_rmw(
+            conversation_id, messages, metadata, updated_at
+        )
+
+    def _append_messages_items(
+        self,
+        conversation_id: str,
+        messages: List[Dict[str, Any]],
+        metadata: Optional[Dict[str, Any]] = None,
+        updated_at: Optional[str] = None,
+    ) -> bool:
+        """Append messages as individual items in the messages container
+
+        Patches the conversation header first (incr message_count gives
+        back the new total, which assigns the sequence numbers), then
+        upserts one item per message keyed by (conversation_id, seq).
+        """
+        try:
+            patch_operations: List[Dict[str, Any]] = [
+                {"op": "incr", "path": "/message_count", "value": len(messages)},
+                {
+                    "op": "set",
+                    "path": "/updated_at",
+                    "value": updated_at or datetime.utcnow().isoformat(),
+                },
+            ]
+            if metadata:
+                for key, value in metadata.items():
+                    patch_operations.append(
+                        {"op": "set", "path": f"/metadata/{key}", "value": value}
+                    )
+
+            patched = self.conversations_container.patch_item(
+                item=conversation_id,
+                partition_key=conversation_id,
+                patch_operations=patch_operations,
+            )
+            next_seq = patched["message_count"] - len(messages) + 1
+
+            for offset, message in enumerate(messages):
+                seq = next_seq + offset
+                item = dict(message)
+                item["id"] = f"{conversation_id}:{seq:08d}"
+                item["conversation_id"] = conversation_id
+                item["seq"] = seq
+                self.messages_container.upsert_item(item)
+            return True
+        except Exception:
+            logger.exception("Error appending conversation messages")
+            return False
+
+    def _append_messages_rmw(
+        self,
+        conversation_id: str,
+        messages: List[Dict[str, Any]],
+        metadata: Optional[Dict[str, Any]] = None,
+        updated_at: Optional[str] = None,
+    ) -> bool:
+        """Read-modify-write append used when patch_item is unavailable"""
         try:
             conversation = self.get_conversation(conversation_id)
             if not conversation:
@@ -385,18 +974,17 @@ class StorageService:
 
             conversation["messages"] = existing_messages
             conversation["message_count"] = len(existing_messages)
-            conversation["updated_at"] = datetime.utcnow().isoformat()
+            conversation["updated_at"] = updated_at or datetime.utcnow().isoformat()
             if metadata:
                 merged_metadata = conversation.get("metadata", {}) or {}
                 merged_metadata.update(metadata)
                 conversation["metadata"] = merged_metadata
 
             conversation["id"] = conversation_id
-            conversation["_partitionKey"] = conversation_id
             self.conversations_container.upsert_item(conversation)
             return True
-        except Exception as e:
-            print(f"Error appending conversation messages: {e}")
+        except Exception:
+            logger.exception("Error appending conversation messages")
             return False
 
     def list_conversations(
@@ -409,6 +997,14 @@ class StorageService:
         """
 
         def build_preview(conversation: Dict[str, Any]) -> Dict[str, Any]:
+            # The local store computes the preview in SQL and returns no
+            # messages; only derive one here when it's absent (Cosmos path)
+            if "last_message_preview" in conversation:
+                if conversation.get("metadata") is None:
+                    conversation["metadata"] = {}
+                conversation.pop("messages", None)
+                return conversation
+
             messages = conversation.get("messages", [])
             preview_text = None
             if messages:
@@ -452,12 +1048,7 @@ class StorageService:
                 )
             )
 
-            conversations: List[Dict[str, Any]] = []
-            for item in items:
-                for field in ["_rid", "_self", "_etag", "_attachments", "_ts", "_partitionKey"]:
-                    item.pop(field, None)
-                conversations.append(build_preview(item))
-            return conversations
-        except Exception as e:
-            print(f"Error listing conversations: {e}")
+            return [build_preview(_strip_cosmos(item)) for item in items]
+        except Exception:
+            logger.exception("Error listing conversations")
             return []
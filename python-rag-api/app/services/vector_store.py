@@ -2,20 +2,23 @@
 Vector store service - handles vector storage and retrieval
 Supports ChromaDB (local) and Azure AI Search
 """
-import json
+import asyncio
 import logging
+import sqlite3
 import os
-import sys
+import threading
 import uuid
 import warnings
-from typing import List, Optional, Dict, Any
-from contextlib import redirect_stderr
-from io import StringIO
+from typing import Any, Dict, Iterator, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
 
-from azure.core.credentials import AzureKeyCredential
+import anyio.to_thread
+import numpy as np
+import orjson
 from azure.core.exceptions import ResourceNotFoundError
 from azure.search.documents import SearchClient
-from azure.search.documents.indexes import SearchIndexClient
 from azure.search.documents.indexes.models import (
     HnswAlgorithmConfiguration,
     HnswParameters,
@@ -32,12 +35,44 @@ from langchain_core.documents import Document
 from langchain_community.vectorstores import Chroma
 
 from app.core.config import settings
+from app.core.azure_clients import azure_clients
 from app.services.embedding_service import EmbeddingService
 
 
 # Module logger
 logger = logging.getLogger("document_rag_api")
 
+
+try:
+    # Optional JIT kernel for the sidecar brute-force path; the repo
+    # runs fine on the BLAS fallback when numba isn't installed
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _numba_ip_scores(matrix, query):  # pragma: no cover - compiled
+        n_rows = matrix.shape[0]
+        scores = np.empty(n_rows, dtype=np.float32)
+        for i in prange(n_rows):
+            acc = np.float32(0.0)
+            for j in range(matrix.shape[1]):
+                acc += matrix[i, j] * query[j]
+            scores[i] = acc
+        return scores
+else:
+    _numba_ip_scores = None
+
+
+# Chroma collection settings: vectors are stored pre-normalized, so
+# inner product equals cosine and hnswlib's distance loop is a plain
+# dot product with no per-comparison normalization. Only consulted when
+# a collection is first created; existing collections keep their space
+# (L2 over unit vectors ranks identically to cosine, so mixed stores
+# stay correct).
+_CHROMA_COLLECTION_METADATA = {"hnsw:space": "ip"}
+
 # Disable telemetry
 os.environ["ANONYMIZED_TELEMETRY"] = "False"
 os.environ["CHROMA_TELEMETRY"] = "False"
@@ -46,23 +81,134 @@ warnings.filterwarnings("ignore", message=".*Failed to send telemetry.*")
 warnings.filterwarnings("ignore", category=DeprecationWarning, message=".*persist.*")
 
 
-class TelemetrySuppressor:
-    """Context manager to suppress ChromaDB telemetry errors"""
-    
-    def __enter__(self):
-        self._stderr_buffer = StringIO()
-        self._original_stderr = sys.stderr
-        sys.stderr = self._stderr_buffer
-        return self
-    
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        sys.stderr = self._original_stderr
-        return False
+# Required index fields; startup recreates the index if any are missing
+_REQUIRED_INDEX_FIELDS = frozenset(
+    {
+        "id",
+        "document_id",
+        "content",
+        "chunk_index",
+        "contentVector",
+        "source",
+        "page",
+        "metadata_json",
+    }
+)
+
+
+@lru_cache(maxsize=4)
+def _build_index_schema(name: str, dims: int) -> SearchIndex:
+    """Build the Azure Search index schema (once per name/dimension)"""
+    vector_search = VectorSearch(
+        algorithms=[
+            HnswAlgorithmConfiguration(
+                name="default",
+                parameters=HnswParameters(metric="cosine"),
+            )
+        ],
+        profiles=[
+            VectorSearchProfile(
+                name="default",
+                algorithm_configuration_name="default",
+            )
+        ],
+    )
+    return SearchIndex(
+        name=name,
+        fields=[
+            SimpleField(name="id", type=SearchFieldDataType.String, key=True),
+            SimpleField(
+                name="document_id",
+                type=SearchFieldDataType.String,
+                filterable=True,
+                sortable=False,
+                facetable=False,
+            ),
+            SearchableField(
+                name="content",
+            ),
+            SimpleField(
+                name="chunk_index",
+                type=SearchFieldDataType.Int32,
+                filterable=True,
+                sortable=True,
+            ),
+            SearchField(
+                name="contentVector",
+                type=SearchFieldDataType.Collection(SearchFieldDataType.Single),
+                vector_search_profile_name="default",
+                vector_search_dimensions=dims,
+            ),
+            SimpleField(
+                name="source",
+                type=SearchFieldDataType.String,
+                filterable=True,
+                sortable=False,
+                facetable=False,
+            ),
+            SimpleField(
+                name="page",
+                type=SearchFieldDataType.Int32,
+                filterable=True,
+                sortable=True,
+            ),
+            SimpleField(
+                name="metadata_json",
+                type=SearchFieldDataType.String,
+                filterable=False,
+                sortable=False,
+                facetable=False,
+            ),
+        ],
+        vector_search=vector_search,
+    )
+
+
+def _cosine_topk(mat: "np.ndarray", query: "np.ndarray", k: int) -> "np.ndarray":
+    """Exact cosine top-k over an (N, D) float32 matrix
+
+    One BLAS matvec plus vectorized norms — the SIMD-friendly shape of
+    this computation, with no Python-level inner loop.
+
+    Returns the row indices of the k best matches, best first.
+    """
+    scores = mat @ query
+    norms = np.linalg.norm(mat, axis=1) * np.linalg.norm(query)
+    scores = scores / np.where(norms == 0.0, 1.0, norms)
+    k = min(k, scores.shape[0])
+    top = np.argpartition(scores, -k)[-k:]
+    return top[np.argsort(scores[top])[::-1]]
+
+
+# ChromaDB's posthog telemetry prints failure tracebacks to stderr.
+# The old TelemetrySuppressor swapped sys.stderr around every Chroma
+# call, which is process-wide state: concurrent threads lost their
+# stderr output for the duration. No-op the capture method once instead.
+try:  # pragma: no cover - reaches into chromadb internals
+    from chromadb.telemetry.product.posthog import Posthog
+
+    Posthog.capture = lambda self, *args, **kwargs: None
+except ImportError:
+    pass
 
 
 class VectorStore:
     """Vector store abstraction layer"""
-    
+
+    # Azure Search allows up to 1000 documents / 16 MB per indexing
+    # request; 500 leaves headroom for embedding-heavy payloads
+    _SEARCH_UPLOAD_BATCH = 500
+
+    # Fields projected out of Azure Search results
+    _SEARCH_SELECT_FIELDS = [
+        "id", "document_id", "content", "chunk_index", "source", "page",
+        "metadata_json",
+    ]
+
+    # Embedding dimension discovered by the probe call, shared across
+    # instances so each process embeds "dimension probe" at most once
+    _probed_dimensions: Optional[int] = None
+
     def __init__(
         self,
         embedding_service: EmbeddingService,
@@ -80,14 +226,58 @@ class VectorStore:
         self.vectorstore: Optional[Chroma] = None
         self.search_client: Optional[SearchClient] = None
         self._azure_dimensions: Optional[int] = None
-        
+        # Hot tier: chunk id -> (vector, scale, Document), LRU-bounded.
+        # Vectors are float32 (scale None) or, with
+        # vector_quantization="int8", int8 with a per-vector dequant
+        # scale at a quarter of the RAM. Queries probe it with exact
+        # cosine before going to the service.
+        self._hot: "OrderedDict[str, tuple]" = OrderedDict()
+        # Semantic query cache: normalized query -> (embedding, k,
+        # results). Near-duplicate queries (cosine above the threshold)
+        # reuse the cached result set.
+        self._semantic_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        # Plain OrderedDicts aren't safe to iterate while threadpool
+        # workers insert/evict, so every hot-tier and semantic-cache
+        # access holds this lock (same discipline as the StorageService
+        # TTL caches).
+        self._cache_lock = threading.Lock()
+        # chunk id -> row number in the sidecar matrix, loaded lazily
+        # from emb.ids on first append so re-indexed chunks overwrite
+        # their row instead of appending a stale duplicate.
+        self._sidecar_index: Optional[Dict[str, int]] = None
+        # Running centroid of inserted unit vectors: one dot product
+        # against it gates clearly off-topic queries before HNSW runs.
+        self._centroid: Optional[np.ndarray] = None
+        self._centroid_sum: Optional[np.ndarray] = None
+        self._centroid_count = 0
+
         if self.vector_store_type == "chroma":
             self._init_chroma()
+            if _numba_ip_scores is not None and settings.chroma_sidecar_enabled:
+                # Pay the JIT compile at init, not on the first query
+                _numba_ip_scores(
+                    np.zeros((1, 4), dtype=np.float32),
+                    np.zeros(4, dtype=np.float32),
+                )
         elif self.vector_store_type == "azure_search":
             self._init_azure_search()
         else:
             raise ValueError(f"Unsupported vector store type: {self.vector_store_type}")
     
+    def _probe_dimensions(self) -> int:
+        """Embedding dimension, resolved without a network call when possible
+
+        Known models report their dimension statically; only unknown
+        models pay the probe embedding, and then at most once per process
+        (the probe text also lands in EmbeddingService's query cache).
+        """
+        if VectorStore._probed_dimensions is None:
+            known = self.embedding_service.dimension
+            VectorStore._probed_dimensions = known or len(
+                self.embedding_service.embed_text("dimension probe")
+            )
+        return VectorStore._probed_dimensions
+
     def _init_chroma(self):
         """Initialize ChromaDB vector store"""
         persist_dir = settings.chroma_persist_directory
@@ -96,98 +286,59 @@ class VectorStore:
         sqlite_path = os.path.join(persist_dir, "chroma.sqlite3")
         try:
             if os.path.exists(sqlite_path):
-                with TelemetrySuppressor():
-                    self.vectorstore = Chroma(
-                        embedding_function=self.embedding_service.embeddings,
-                        persist_directory=persist_dir,
-                    )
+                self._tune_chroma_sqlite(sqlite_path)
+                self.vectorstore = Chroma(
+                    embedding_function=self.embedding_service.embeddings,
+                    persist_directory=persist_dir,
+                    collection_metadata=_CHROMA_COLLECTION_METADATA,
+                )
         except Exception as exc:
             warnings.warn(
                 f"Failed to load existing ChromaDB at {persist_dir}: {exc}. "
                 "A new vector store will be created when documents are added.",
                 RuntimeWarning,
             )
+
+    @staticmethod
+    def _tune_chroma_sqlite(sqlite_path: str) -> None:
+        """Best-effort write tuning for Chroma's backing SQLite file
+
+        journal_mode=WAL is a durable database property, so setting it
+        here moves every later Chroma connection off rollback-journal
+        fsync-per-commit behaviour. Per-connection pragmas (synchronous,
+        cache_size) can't be applied from outside Chroma's own
+        connections, so they are left alone rather than reaching into
+        chromadb private internals.
+        """
+        try:
+            conn = sqlite3.connect(sqlite_path)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.DatabaseError:
+            logger.debug("Chroma SQLite tuning skipped", exc_info=True)
     
     def _init_azure_search(self):
         """Initialise Azure AI Search index and client"""
         if not settings.azure_search_endpoint or not settings.azure_search_api_key:
             raise ValueError("Azure Search endpoint and api key must be configured.")
-        
-        credential = AzureKeyCredential(settings.azure_search_api_key)
+
+        # Process-wide singletons on the shared pooled transport: every
+        # VectorStore reuses the same warm TLS connections instead of
+        # paying a handshake per instance
         index_name = settings.azure_search_index_name
-        self.search_client = SearchClient(
-            endpoint=settings.azure_search_endpoint,
-            index_name=index_name,
-            credential=credential,
-        )
-        index_client = SearchIndexClient(
-            endpoint=settings.azure_search_endpoint,
-            credential=credential,
-        )
-        
+        self.search_client = azure_clients.search_client
+        index_client = azure_clients.search_index_client
+
         try:
             index_client.get_index(index_name)
         except ResourceNotFoundError:
-            # Determine embedding dimension
-            sample_embedding = self.embedding_service.embed_text("dimension probe")
-            self._azure_dimensions = len(sample_embedding)
-            
-            vector_search = VectorSearch(
-                algorithms=[
-                    HnswAlgorithmConfiguration(
-                        name="default",
-                        parameters=HnswParameters(metric="cosine"),
-                    )
-                ],
-                profiles=[
-                    VectorSearchProfile(
-                        name="default",
-                        algorithm_configuration_name="default",
-                    )
-                ],
+            self._azure_dimensions = self._probe_dimensions()
+            index_client.create_index(
+                _build_index_schema(index_name, self._azure_dimensions)
             )
-            
-            index = SearchIndex(
-                name=index_name,
-                fields=[
-                    SimpleField(name="id", type=SearchFieldDataType.String, key=True),
-                    SimpleField(
-                        name="document_id",
-                        type=SearchFieldDataType.String,
-                        filterable=True,
-                        facetable=False,
-                    ),
-                    SearchableField(
-                        name="content",
-                    ),
-                    SimpleField(
-                        name="chunk_index",
-                        type=SearchFieldDataType.Int32,
-                        filterable=True,
-                        sortable=True,
-                    ),
-                    SearchField(
-                        name="contentVector",
-                        type=SearchFieldDataType.Collection(SearchFieldDataType.Single),
-                        vector_search_profile_name="default",
-                        vector_search_dimensions=self._azure_dimensions,
-                    ),
-                    SimpleField(
-                        name="source",
-                        type=SearchFieldDataType.String,
-                        filterable=True,
-                    ),
-                    SimpleField(
-                        name="metadata_json",
-                        type=SearchFieldDataType.String,
-                        filterable=False,
-                        sortable=False,
-                        facetable=False,
-                    ),
-                ],
-                vector_search=vector_search,
-            )
-            index_client.create_index(index)
         else:
             # Retrieve dimension from existing index
             index = index_client.get_index(index_name)
@@ -201,84 +352,28 @@ class VectorStore:
             )
             if vector_field:
                 self._azure_dimensions = vector_field.vector_search_dimensions
+                VectorStore._probed_dimensions = self._azure_dimensions
             # Ensure schema contains required fields; if not, recreate index
-            required_field_names = {
-                "id",
-                "document_id",
-                "content",
-                "chunk_index",
-                "contentVector",
-                "source",
-                "metadata_json",
-            }
             existing_field_names = {field.name for field in index.fields}
-            if not required_field_names.issubset(existing_field_names):
+            if not _REQUIRED_INDEX_FIELDS.issubset(existing_field_names):
                 logger.warning(
                     "Azure Search index '%s' missing required fields (%s). Recreating index.",
                     index_name,
-                    required_field_names - existing_field_names,
+                    _REQUIRED_INDEX_FIELDS - existing_field_names,
                 )
                 index_client.delete_index(index_name)
-                self._azure_dimensions = len(self.embedding_service.embed_text("dimension probe"))
-                vector_search = VectorSearch(
-                    algorithms=[
-                HnswAlgorithmConfiguration(
-                            name="default",
-                            parameters=HnswParameters(metric="cosine"),
-                        )
-                    ],
-                    profiles=[
-                        VectorSearchProfile(
-                            name="default",
-                            algorithm_configuration_name="default",
-                        )
-                    ],
-                )
-                index = SearchIndex(
-                    name=index_name,
-                    fields=[
-                        SimpleField(name="id", type=SearchFieldDataType.String, key=True),
-                        SimpleField(
-                            name="document_id",
-                            type=SearchFieldDataType.String,
-                            filterable=True,
-                            sortable=False,
-                            facetable=False,
-                        ),
-                        SearchableField(
-                            name="content",
-                        ),
-                        SimpleField(
-                            name="chunk_index",
-                            type=SearchFieldDataType.Int32,
-                            filterable=True,
-                            sortable=True,
-                        ),
-                        SearchField(
-                            name="contentVector",
-                            type=SearchFieldDataType.Collection(SearchFieldDataType.Single),
-                            vector_search_profile_name="default",
-                            vector_search_dimensions=self._azure_dimensions,
-                        ),
-                        SimpleField(
-                            name="source",
-                            type=SearchFieldDataType.String,
-                            filterable=True,
-                            sortable=False,
-                            facetable=False,
-                        ),
-                        SimpleField(
-                            name="metadata_json",
-                            type=SearchFieldDataType.String,
-                            filterable=False,
-                            sortable=False,
-                            facetable=False,
-                        ),
-                    ],
-                    vector_search=vector_search,
+                self._azure_dimensions = self._probe_dimensions()
+                index_client.create_index(
+                    _build_index_schema(index_name, self._azure_dimensions)
                 )
-                index_client.create_index(index)
-    
+
+        # Pre-warm the query client's pooled connection so the first real
+        # search doesn't pay the TCP+TLS handshake
+        try:
+            self.search_client.get_document_count()
+        except Exception:
+            logger.debug("Search client warmup call failed", exc_info=True)
+
     def add_documents(
         self,
         documents: List[Document],
@@ -294,6 +389,9 @@ class VectorStore:
         Returns:
             List of document IDs
         """
+        with self._cache_lock:
+            self._semantic_cache.clear()
+            self._hot.clear()
         if self.vector_store_type == "chroma":
             return self._add_to_chroma(documents, document_ids)
         elif self.vector_store_type == "azure_search":
@@ -306,30 +404,261 @@ class VectorStore:
         documents: List[Document],
         document_ids: Optional[List[str]] = None,
     ) -> List[str]:
-        """Add documents to ChromaDB"""
-        with TelemetrySuppressor():
-            if self.vectorstore is None:
-                # Create new vector store
-                self.vectorstore = Chroma.from_documents(
-                    documents=documents,
-                    embedding=self.embedding_service.embeddings,
-                    persist_directory=settings.chroma_persist_directory,
-                    ids=document_ids,
-                )
-            else:
-                # Add to existing vector store
-                self.vectorstore.add_documents(
-                    documents=documents,
-                    ids=document_ids,
+        """Add documents to ChromaDB in bounded batches
+
+        Embeddings are precomputed through EmbeddingService.embed_documents
+        before the insert loop, so they go through the batched, cache-aware
+        path instead of Chroma's internal per-insert embed call, and each
+        SQLite transaction only has to write vectors it already holds.
+        Slicing into chroma_batch_size batches bounds peak memory and keeps
+        ingest throughput linear in document count.
+        """
+        # Generate real IDs up front instead of letting Chroma auto-assign
+        # ones we can't retrieve: the returned list must be usable by
+        # delete_documents, and the placeholder doc_{i} values weren't.
+        if not document_ids:
+            document_ids = [str(uuid.uuid4()) for _ in documents]
+
+        # Duplicate-content dedup happens at the embedding layer:
+        # embed_documents keys its persistent cache on the content hash,
+        # so re-ingested chunks skip the API call but every row is still
+        # upserted under its own ID and metadata — each document keeps
+        # its own retrievable, deletable copy of shared boilerplate.
+        texts = [doc.page_content for doc in documents]
+        embeddings = self.embedding_service.embed_documents(texts)
+        # Unit-normalize so the collection's ip space scores exact cosines
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        np.divide(embeddings, norms, out=embeddings, where=norms > 0)
+        self._update_centroid(embeddings)
+        if settings.chroma_sidecar_enabled:
+            self._append_sidecar(document_ids, embeddings)
+        embeddings = embeddings.tolist()
+
+        batch_size = settings.chroma_batch_size
+        if self.vectorstore is None:
+            # Create the store empty; batches below populate it
+            self.vectorstore = Chroma(
+                embedding_function=self.embedding_service.embeddings,
+                persist_directory=settings.chroma_persist_directory,
+                collection_metadata=_CHROMA_COLLECTION_METADATA,
+            )
+            self._tune_chroma_sqlite(
+                os.path.join(
+                    settings.chroma_persist_directory, "chroma.sqlite3"
                 )
-        
-        # Return IDs (ChromaDB generates them if not provided)
-        if document_ids:
-            return document_ids
-        # ChromaDB auto-generates IDs, but we can't easily retrieve them
-        # Return a placeholder list
-        return [f"doc_{i}" for i in range(len(documents))]
-    
+            )
+        for start in range(0, len(documents), batch_size):
+            end = start + batch_size
+            # langchain's add_documents has no precomputed-embeddings
+            # parameter, so hand the vectors to the collection directly
+            self.vectorstore._collection.upsert(
+                ids=document_ids[start:end],
+                embeddings=embeddings[start:end],
+                documents=texts[start:end],
+                metadatas=[doc.metadata for doc in documents[start:end]],
+            )
+
+        return document_ids
+
+    @staticmethod
+    def _sidecar_paths() -> tuple:
+        """Paths of the float16 matrix and row-id sidecar files"""
+        persist_dir = settings.chroma_persist_directory
+        return (
+            os.path.join(persist_dir, "emb.f16"),
+            os.path.join(persist_dir, "emb.ids"),
+        )
+
+    def _append_sidecar(self, ids: List[str], embeddings: np.ndarray) -> None:
+        """Write normalized rows to the brute-force search sidecar
+
+        The matrix file is plain row-major float16, so growing it is a
+        byte append and readers can memmap it at any size; ids live one
+        per line in a parallel file. An id seen before overwrites its
+        existing row in place, so re-indexing changed content can't
+        leave a superseded vector behind to keep scoring.
+        """
+        vec_path, ids_path = self._sidecar_paths()
+        if self._sidecar_index is None:
+            self._sidecar_index = {}
+            if os.path.exists(ids_path):
+                with open(ids_path) as ids_file:
+                    for row, chunk_id in enumerate(ids_file.read().splitlines()):
+                        self._sidecar_index[chunk_id] = row
+        index = self._sidecar_index
+
+        rows = np.ascontiguousarray(embeddings, dtype=np.float16)
+        row_bytes = rows.shape[1] * rows.dtype.itemsize
+        new_ids: List[str] = []
+        mode = "r+b" if os.path.exists(vec_path) else "w+b"
+        with open(vec_path, mode) as matrix_file:
+            matrix_file.seek(0, os.SEEK_END)
+            next_row = matrix_file.tell() // row_bytes
+            for chunk_id, row in zip(ids, rows):
+                existing = index.get(chunk_id)
+                if existing is None:
+                    matrix_file.seek(0, os.SEEK_END)
+                    matrix_file.write(row.tobytes())
+                    index[chunk_id] = next_row
+                    next_row += 1
+                    new_ids.append(chunk_id)
+                else:
+                    matrix_file.seek(existing * row_bytes)
+                    matrix_file.write(row.tobytes())
+        if new_ids:
+            with open(ids_path, "a") as ids_file:
+                ids_file.writelines(chunk_id + "\n" for chunk_id in new_ids)
+
+    def similarity_search_fast(self, query: str, k: int = 5) -> List[Document]:
+        """Exact top-k over the memmapped float16 sidecar matrix
+
+        One blocked BLAS matvec over the whole collection: for stores up
+        to a few million rows this beats HNSW's per-vector dispatch and
+        is exact rather than approximate, while the memmap keeps resident
+        memory at one float32 block regardless of matrix size. Requires
+        ingests with chroma_sidecar_enabled; rows whose chunks were
+        deleted from Chroma are dropped from the results.
+
+        Args:
+            query: Search query
+            k: Number of results to return
+
+        Returns:
+            List of relevant documents, best first
+        """
+        matrix, all_ids = self._open_sidecar()
+        if matrix is None:
+            return []
+        query_vec = self._embed_query_unit(query)
+
+        # float16 matmul has no BLAS kernel, so convert one block at a
+        # time and let SGEMV do the work in float32
+        n_rows = matrix.shape[0]
+        scores = np.empty(n_rows, dtype=np.float32)
+        block = 65536
+        for start in range(0, n_rows, block):
+            scores[start:start + block] = (
+                matrix[start:start + block].astype(np.float32) @ query_vec
+            )
+
+        return self._hydrate_sidecar_topk(scores, all_ids, k)
+
+    def _open_sidecar(self) -> tuple:
+        """Memmap the sidecar matrix and load its row ids
+
+        Returns (matrix, ids); matrix is None for an empty sidecar.
+        """
+        if self.vector_store_type != "chroma" or self.vectorstore is None:
+            raise ValueError("Sidecar search requires an initialised Chroma store.")
+        vec_path, ids_path = self._sidecar_paths()
+        if not os.path.exists(vec_path):
+            raise ValueError(
+                "Embedding sidecar not found; ingest with "
+                "chroma_sidecar_enabled to build it."
+            )
+
+        dims = self._probe_dimensions()
+        row_bytes = dims * np.dtype(np.float16).itemsize
+        n_rows = os.path.getsize(vec_path) // row_bytes
+        matrix = (
+            np.memmap(vec_path, dtype=np.float16, mode="r", shape=(n_rows, dims))
+            if n_rows
+            else None
+        )
+        with open(ids_path) as ids_file:
+            all_ids = ids_file.read().splitlines()
+        return matrix, all_ids
+
+    def _embed_query_unit(self, query: str) -> np.ndarray:
+        """Embed a query and scale it to unit length"""
+        query_vec = np.asarray(
+            self.embedding_service.embed_text(query), dtype=np.float32
+        )
+        norm = float(np.linalg.norm(query_vec))
+        if norm:
+            query_vec /= norm
+        return query_vec
+
+    def _hydrate_sidecar_topk(
+        self, scores: np.ndarray, all_ids: List[str], k: int
+    ) -> List[Document]:
+        """Turn sidecar scores into Documents fetched from Chroma"""
+        k = min(k, scores.shape[0])
+        top = np.argpartition(scores, -k)[-k:]
+        top = top[np.argsort(scores[top])[::-1]]
+
+        # Sidecars written before rows were overwritten in place can
+        # hold the same id twice; keep the best-scoring occurrence
+        top_ids = list(
+            dict.fromkeys(all_ids[idx] for idx in top if idx < len(all_ids))
+        )
+        raw = self.vectorstore._collection.get(
+            ids=top_ids, include=["documents", "metadatas"]
+        )
+        by_id = {
+            chunk_id: (content, metadata)
+            for chunk_id, content, metadata in zip(
+                raw["ids"], raw["documents"], raw["metadatas"]
+            )
+        }
+        return [
+            Document(page_content=by_id[i][0], metadata=by_id[i][1] or {})
+            for i in top_ids
+            if i in by_id
+        ]
+
+    def similarity_search_numba(self, query: str, k: int = 5) -> List[Document]:
+        """Sidecar search scored by the JIT-compiled dot-product kernel
+
+        Same exact brute-force semantics as similarity_search_fast, but
+        the scoring loop runs through numba's parallel fastmath kernel
+        (FMA inner loop, rows split across threads). Falls back to the
+        BLAS path when numba isn't installed.
+
+        Args:
+            query: Search query
+            k: Number of results to return
+
+        Returns:
+            List of relevant documents, best first
+        """
+        if _numba_ip_scores is None:
+            return self.similarity_search_fast(query, k)
+
+        matrix, all_ids = self._open_sidecar()
+        if matrix is None:
+            return []
+        query_vec = self._embed_query_unit(query)
+
+        # numba has no float16 support, so blocks are widened to float32
+        # before entering the kernel, same as the BLAS path
+        n_rows = matrix.shape[0]
+        scores = np.empty(n_rows, dtype=np.float32)
+        block = 65536
+        for start in range(0, n_rows, block):
+            scores[start:start + block] = _numba_ip_scores(
+                matrix[start:start + block].astype(np.float32), query_vec
+            )
+
+        return self._hydrate_sidecar_topk(scores, all_ids, k)
+
+    def _update_centroid(self, vectors: np.ndarray) -> None:
+        """Fold newly inserted unit vectors into the running centroid
+
+        The raw sum and count are kept so the mean stays exact across
+        incremental inserts; the gate compares against the re-normalized
+        mean, per-query cost is a single dot product.
+        """
+        total = vectors.sum(axis=0)
+        if self._centroid_sum is None:
+            self._centroid_sum = total
+        else:
+            self._centroid_sum = self._centroid_sum + total
+        self._centroid_count += len(vectors)
+        mean = self._centroid_sum / self._centroid_count
+        norm = float(np.linalg.norm(mean))
+        self._centroid = mean / norm if norm else None
+
     def _add_to_azure_search(
         self,
         documents: List[Document],
@@ -337,37 +666,155 @@ class VectorStore:
     ) -> List[str]:
         if self.search_client is None:
             raise ValueError("Azure Search client not initialised.")
-        
+
         ids: List[str] = []
+        for idx, doc in enumerate(documents):
+            if document_ids and idx < len(document_ids):
+                ids.append(document_ids[idx])
+            else:
+                ids.append(doc.metadata.get("chunk_id") or str(uuid.uuid4()))
+
         embeddings = self.embedding_service.embed_documents(
             [doc.page_content for doc in documents]
         )
-        
-        search_docs = []
+        # One bulk ndarray→list conversion instead of a per-row .tolist()
+        # inside the hot loop
+        vectors = embeddings.tolist()
+
+        # Azure Search caps indexing requests at 1000 docs / 16 MB; build
+        # one 500-doc slice at a time so large ingests stay under the cap.
+        def build_batch(start: int) -> List[Dict[str, Any]]:
+            stop = start + self._SEARCH_UPLOAD_BATCH
+            return [
+                self._build_search_doc(doc, doc_id, vector)
+                for doc, doc_id, vector in zip(
+                    documents[start:stop], ids[start:stop], vectors[start:stop]
+                )
+            ]
+
+        starts = range(0, len(documents), self._SEARCH_UPLOAD_BATCH)
+        if len(starts) <= 1:
+            if len(starts) == 1:
+                self.search_client.upload_documents(build_batch(0))
+            return ids
+
+        # The SDK releases the GIL during HTTP I/O, so independent batch
+        # uploads overlap their round-trips on a small thread pool. The
+        # first failure propagates, matching the sequential semantics.
+        with ThreadPoolExecutor(
+            max_workers=settings.azure_upload_concurrency
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self.search_client.upload_documents, build_batch(start)
+                )
+                for start in starts
+            ]
+            for future in as_completed(futures):
+                future.result()
+        return ids
+    
+    async def aadd_documents(
+        self,
+        documents: List[Document],
+        document_ids: Optional[List[str]] = None,
+    ) -> List[str]:
+        """
+        Add documents to the vector store without blocking the event loop
+
+        Azure Search ingest runs as a pipelined producer/consumer; Chroma
+        has no async API, so it is offloaded to a worker thread.
+
+        Args:
+            documents: List of Document objects
+            document_ids: Optional list of document IDs
+
+        Returns:
+            List of document IDs
+        """
+        if self.vector_store_type == "azure_search":
+            return await self._aadd_to_azure_search(documents, document_ids)
+        return await anyio.to_thread.run_sync(
+            lambda: self.add_documents(documents, document_ids)
+        )
+
+    async def _aadd_to_azure_search(
+        self,
+        documents: List[Document],
+        document_ids: Optional[List[str]] = None,
+    ) -> List[str]:
+        """Pipelined Azure Search ingest
+
+        A producer embeds texts in batches while a consumer builds the
+        search documents and uploads the previous batch, so the embedding
+        API round-trip, the CPU-side dict construction, and the upload
+        round-trip overlap instead of running back to back.
+        """
+        if self.search_client is None:
+            raise ValueError("Azure Search client not initialised.")
+
+        ids: List[str] = []
         for idx, doc in enumerate(documents):
-            doc_id = None
             if document_ids and idx < len(document_ids):
-                doc_id = document_ids[idx]
+                ids.append(document_ids[idx])
             else:
-                doc_id = doc.metadata.get("chunk_id") or str(uuid.uuid4())
-            ids.append(doc_id)
-            
-            metadata_json = json.dumps(doc.metadata, default=str)
-            search_docs.append(
-                {
-                    "id": doc_id,
-                    "document_id": doc.metadata.get("document_id"),
-                    "content": doc.page_content,
-                    "chunk_index": doc.metadata.get("chunk_index", 0),
-                    "source": doc.metadata.get("source_file") or doc.metadata.get("document_name"),
-                    "metadata_json": metadata_json,
-                    "contentVector": embeddings[idx],
-                }
-            )
-        
-        self.search_client.upload_documents(search_docs)
+                ids.append(doc.metadata.get("chunk_id") or str(uuid.uuid4()))
+
+        texts = [doc.page_content for doc in documents]
+        batch_size = EmbeddingService.ASYNC_BATCH_SIZE
+        # maxsize bounds how many embedded-but-not-uploaded batches can
+        # pile up if uploads lag behind embedding
+        queue: "asyncio.Queue" = asyncio.Queue(maxsize=4)
+        async_client = azure_clients.search_client_async
+
+        async def produce() -> None:
+            for start in range(0, len(texts), batch_size):
+                vectors = await self.embedding_service.aembed_documents(
+                    texts[start : start + batch_size]
+                )
+                await queue.put((start, vectors))
+            await queue.put(None)
+
+        async def consume() -> None:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                start, vectors = item
+                search_docs = [
+                    self._build_search_doc(
+                        documents[start + offset],
+                        ids[start + offset],
+                        vector,
+                    )
+                    for offset, vector in enumerate(vectors)
+                ]
+                if async_client is not None:
+                    await async_client.upload_documents(search_docs)
+                else:
+                    await anyio.to_thread.run_sync(
+                        self.search_client.upload_documents, search_docs
+                    )
+
+        await asyncio.gather(produce(), consume())
         return ids
-    
+
+    @staticmethod
+    def _build_search_doc(
+        doc: Document, doc_id: str, vector: List[float]
+    ) -> Dict[str, Any]:
+        """Build one Azure Search index document"""
+        return {
+            "id": doc_id,
+            "document_id": doc.metadata.get("document_id"),
+            "content": doc.page_content,
+            "chunk_index": doc.metadata.get("chunk_index", 0),
+            "source": doc.metadata.get("source_file") or doc.metadata.get("document_name"),
+            "page": doc.metadata.get("page") or doc.metadata.get("page_number"),
+            "metadata_json": orjson.dumps(doc.metadata, default=str).decode(),
+            "contentVector": list(vector),
+        }
+
     def similarity_search(
         self,
         query: str,
@@ -385,20 +832,226 @@ class VectorStore:
         Returns:
             List of relevant documents
         """
+        # Semantic cache: queries phrased differently but embedding to
+        # nearly the same point reuse the cached result set. Filtered
+        # queries bypass it (the filter isn't part of the key).
+        use_cache = settings.semantic_query_cache_size and not filter
+        if use_cache:
+            query_vec = np.asarray(
+                self.embedding_service.embed_text(query), dtype=np.float32
+            )
+            # Unit length to match the stored vectors; the cosine probes
+            # below are scale-invariant either way
+            norm = float(np.linalg.norm(query_vec))
+            if norm:
+                query_vec /= norm
+            cached = self._probe_semantic_cache(query_vec, k)
+            if cached is not None:
+                return cached
+            # Centroid gate: a query this far from everything the
+            # collection holds can't produce relevant hits, so skip the
+            # HNSW sweep outright
+            if (
+                settings.centroid_gate_threshold
+                and self._centroid is not None
+                and float(query_vec @ self._centroid)
+                < settings.centroid_gate_threshold
+            ):
+                return []
+
         if self.vector_store_type == "chroma":
             if self.vectorstore is None:
                 raise ValueError("Vector store not initialized. Add documents first.")
-            with TelemetrySuppressor():
-                return self.vectorstore.similarity_search(
+            if use_cache:
+                # Reuse the embedding computed for the cache probe
+                results = self.vectorstore.similarity_search_by_vector(
+                    embedding=query_vec.tolist(), k=k, filter=filter
+                )
+            else:
+                results = self.vectorstore.similarity_search(
                     query=query,
                     k=k,
                     filter=filter,
                 )
         elif self.vector_store_type == "azure_search":
-            return self._search_azure(query, k, filter)
+            results = self._search_azure(
+                query,
+                k,
+                filter,
+                embedding=query_vec.tolist() if use_cache else None,
+            )
         else:
             raise NotImplementedError(f"Similarity search not implemented for {self.vector_store_type}")
+
+        if use_cache:
+            self._store_semantic(query, query_vec, k, results)
+        return results
+
+    @staticmethod
+    def _copy_documents(documents: List[Document]) -> List[Document]:
+        """Fresh Document copies for cache boundaries
+
+        Callers downstream mutate retrieved documents in place (context
+        sanitization rewrites page_content and metadata), so both the
+        in-process caches and their hits must hand out copies rather
+        than the shared live objects.
+        """
+        return [
+            Document(page_content=doc.page_content, metadata=dict(doc.metadata))
+            for doc in documents
+        ]
+
+    def _probe_semantic_cache(
+        self, query_vec: "np.ndarray", k: int
+    ) -> Optional[List[Document]]:
+        """Return a cached result set for a near-duplicate query, if any"""
+        with self._cache_lock:
+            candidates = [
+                (key, vec, results)
+                for key, (vec, entry_k, results) in self._semantic_cache.items()
+                if entry_k == k
+            ]
+        if not candidates:
+            return None
+        matrix = np.stack([vec for _, vec, _ in candidates])
+        scores = matrix @ query_vec
+        norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query_vec)
+        sims = scores / np.where(norms == 0.0, 1.0, norms)
+        best = int(np.argmax(sims))
+        if sims[best] < settings.semantic_query_cache_threshold:
+            return None
+        key = candidates[best][0]
+        with self._cache_lock:
+            # The entry can be gone by now if a write cleared the cache
+            # while we were scoring the snapshot
+            if key in self._semantic_cache:
+                self._semantic_cache.move_to_end(key)
+        return self._copy_documents(candidates[best][2])
+
+    def _store_semantic(
+        self,
+        query: str,
+        query_vec: "np.ndarray",
+        k: int,
+        results: List[Document],
+    ) -> None:
+        """Cache a result set keyed on the normalized query text"""
+        key = " ".join(query.lower().split())
+        entry = (query_vec, k, self._copy_documents(results))
+        with self._cache_lock:
+            self._semantic_cache[key] = entry
+            self._semantic_cache.move_to_end(key)
+            while len(self._semantic_cache) > settings.semantic_query_cache_size:
+                self._semantic_cache.popitem(last=False)
     
+    async def asimilarity_search(
+        self,
+        query: str,
+        k: int = 5,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> List[Document]:
+        """
+        Perform similarity search without blocking the event loop
+
+        Azure Search runs on the aio client; Chroma has no async API, so
+        it is offloaded to a worker thread.
+
+        Args:
+            query: Search query
+            k: Number of results to return
+            filter: Optional metadata filter
+
+        Returns:
+            List of relevant documents
+        """
+        if self.vector_store_type == "azure_search":
+            return await self._search_azure_async(query, k, filter)
+        return await anyio.to_thread.run_sync(
+            lambda: self.similarity_search(query=query, k=k, filter=filter)
+        )
+
+    def similarity_search_batch(
+        self,
+        queries: List[str],
+        k: int = 5,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Document]]:
+        """Run many similarity searches in one sweep
+
+        All queries are embedded in a single batched call, and on Chroma
+        the vectors go through one _collection.query, so N queries cost
+        one embeddings round-trip and one Python-to-C crossing instead
+        of N of each. Azure Search has no multi-vector query, so that
+        backend falls back to a per-query loop.
+
+        Args:
+            queries: Search queries
+            k: Number of results per query
+            filter: Optional metadata filter applied to every query
+
+        Returns:
+            One result list per query, in input order
+        """
+        if not queries:
+            return []
+        if self.vector_store_type != "chroma":
+            return [self.similarity_search(q, k=k, filter=filter) for q in queries]
+        if self.vectorstore is None:
+            raise ValueError("Vector store not initialized. Add documents first.")
+
+        embeddings = self.embedding_service.embed_documents(queries)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        np.divide(embeddings, norms, out=embeddings, where=norms > 0)
+
+        raw = self.vectorstore._collection.query(
+            query_embeddings=embeddings.tolist(),
+            n_results=k,
+            where=filter,
+            include=["documents", "metadatas"],
+        )
+        return [
+            [
+                Document(page_content=content, metadata=metadata or {})
+                for content, metadata in zip(contents, metadatas)
+            ]
+            for contents, metadatas in zip(raw["documents"], raw["metadatas"])
+        ]
+
+    def similarity_search_by_vector(
+        self,
+        embedding: List[float],
+        k: int = 5,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> List[Document]:
+        """
+        Perform similarity search with a precomputed query embedding
+
+        Lets callers that already hold (or cache) an embedding skip the
+        embed-the-query API round-trip.
+
+        Args:
+            embedding: Query embedding vector
+            k: Number of results to return
+            filter: Optional metadata filter
+
+        Returns:
+            List of relevant documents
+        """
+        if self.vector_store_type == "chroma":
+            if self.vectorstore is None:
+                raise ValueError("Vector store not initialized. Add documents first.")
+            return self.vectorstore.similarity_search_by_vector(
+                embedding=embedding,
+                k=k,
+                filter=filter,
+            )
+        elif self.vector_store_type == "azure_search":
+            return self._search_azure("", k, filter, embedding=embedding)
+        else:
+            raise NotImplementedError(
+                f"Similarity search by vector not implemented for {self.vector_store_type}"
+            )
+
     def similarity_search_with_score(
         self,
         query: str,
@@ -419,12 +1072,11 @@ class VectorStore:
         if self.vector_store_type == "chroma":
             if self.vectorstore is None:
                 raise ValueError("Vector store not initialized. Add documents first.")
-            with TelemetrySuppressor():
-                return self.vectorstore.similarity_search_with_score(
-                    query=query,
-                    k=k,
-                    filter=filter,
-                )
+            return self.vectorstore.similarity_search_with_score(
+                query=query,
+                k=k,
+                filter=filter,
+            )
         elif self.vector_store_type == "azure_search":
             docs = self._search_azure(query, k, filter)
             return [(doc, doc.metadata.get("score", 0.0)) for doc in docs]
@@ -449,11 +1101,10 @@ class VectorStore:
         if self.vector_store_type == "chroma":
             if self.vectorstore is None:
                 raise ValueError("Vector store not initialized. Add documents first.")
-            with TelemetrySuppressor():
-                return self.vectorstore.as_retriever(
-                    search_type=search_type,
-                    search_kwargs=search_kwargs or {},
-                )
+            return self.vectorstore.as_retriever(
+                search_type=search_type,
+                search_kwargs=search_kwargs or {},
+            )
         elif self.vector_store_type == "azure_search":
             kwargs = search_kwargs or {}
             return _AzureSearchRetriever(self, kwargs)
@@ -480,12 +1131,14 @@ class VectorStore:
         Returns:
             True if successful
         """
+        with self._cache_lock:
+            self._semantic_cache.clear()
+            self._hot.clear()
         if self.vector_store_type == "chroma":
             if self.vectorstore is None:
                 return False
-            with TelemetrySuppressor():
-                self.vectorstore.delete(ids=document_ids)
-                return True
+            self.vectorstore.delete(ids=document_ids)
+            return True
         elif self.vector_store_type == "azure_search":
             if self.search_client is None:
                 return False
@@ -495,74 +1148,274 @@ class VectorStore:
         else:
             raise NotImplementedError(f"Delete documents not implemented for {self.vector_store_type}")
     
-    def _search_azure(
+    def _iter_azure(
         self,
         query: str,
         k: int,
         filter: Optional[Dict[str, Any]] = None,
-    ) -> List[Document]:
+        embedding: Optional[List[float]] = None,
+    ) -> Iterator[Document]:
+        """Stream Azure Search results as they arrive
+
+        Documents are yielded one at a time, so early-stopping consumers
+        (MMR rerankers, prompt builders with a token budget) never pay
+        for results they don't read and the full list is never held
+        unless a caller materializes it.
+        """
+        for result in self._run_azure_search(
+            query, k, filter, embedding, self._SEARCH_SELECT_FIELDS
+        ):
+            yield self._document_from_result(result)
+
+    def _run_azure_search(
+        self,
+        query: str,
+        k: int,
+        filter: Optional[Dict[str, Any]],
+        embedding: Optional[List[float]],
+        select: List[str],
+    ):
+        """Issue one vector search and return the raw result iterator"""
         if self.search_client is None:
             raise ValueError("Azure Search client not initialised.")
         if self._azure_dimensions is None:
-            self._azure_dimensions = len(self.embedding_service.embed_text("dimension probe"))
-        
-        query_embedding = self.embedding_service.embed_text(query)
+            self._azure_dimensions = self._probe_dimensions()
+
+        query_embedding = embedding if embedding is not None else self.embedding_service.embed_text(query)
         vector_query = VectorizedQuery(
             vector=query_embedding,
             k_nearest_neighbors=k,
             fields="contentVector",
         )
-        
-        azure_filter = None
-        if filter:
-            parts = []
-            for key, value in filter.items():
-                if isinstance(value, str):
-                    parts.append(f"{key} eq '{value}'")
-                else:
-                    parts.append(f"{key} eq {value}")
-            if parts:
-                azure_filter = " and ".join(parts)
-        
-        results = self.search_client.search(
+        return self.search_client.search(
             search_text=None,
             vector_queries=[vector_query],
-            filter=azure_filter,
-            select=["id", "document_id", "content", "chunk_index", "source", "metadata_json"],
+            filter=self._build_azure_filter(filter),
+            select=select,
         )
-        
-        documents: List[Document] = []
-        for result in results:
-            metadata = {
-                "document_id": result.get("document_id"),
-                "chunk_index": result.get("chunk_index"),
-                "chunk_id": result.get("id"),
-                "source_file": result.get("source"),
-                "score": result.get("@search.score"),
-            }
-            metadata_json = result.get("metadata_json")
-            if metadata_json:
-                try:
-                    parsed_metadata = json.loads(metadata_json)
-                    if isinstance(parsed_metadata, dict):
-                        metadata.update(parsed_metadata)
-                except json.JSONDecodeError:
-                    pass
-
-            # Ensure document_id exists and is string-typed for downstream validation
-            document_id = metadata.get("document_id") or result.get("document_id")
-            if not document_id:
-                document_id = metadata.get("source_document_id") or metadata.get("chunk_id")
-            if document_id is not None:
-                metadata["document_id"] = str(document_id)
-
-            documents.append(
-                Document(
-                    page_content=result.get("content", ""),
-                    metadata=metadata,
+
+    def _probe_hot_tier(
+        self, query_embedding: "np.ndarray", k: int
+    ) -> Optional[List[Document]]:
+        """Serve the query from the in-memory hot tier if it can
+
+        Exact cosine over the hot vectors (one BLAS matvec); only answers
+        when k results all clear the threshold, otherwise falls through
+        to the service.
+        """
+        with self._cache_lock:
+            if len(self._hot) < k:
+                return None
+            entries = list(self._hot.values())
+        matrix = np.stack([
+            vector if scale is None else vector.astype(np.float32) * scale
+            for vector, scale, _ in entries
+        ])
+        order = _cosine_topk(matrix, query_embedding, k)
+        scores = matrix[order] @ query_embedding
+        norms = (
+            np.linalg.norm(matrix[order], axis=1)
+            * np.linalg.norm(query_embedding)
+        )
+        cosines = scores / np.where(norms == 0.0, 1.0, norms)
+        if cosines.min() < settings.vector_hot_tier_threshold:
+            return None
+        return self._copy_documents([entries[idx][2] for idx in order])
+
+    def _promote_hot(self, rows: List[Dict[str, Any]], documents: List[Document],
+                     query_embedding: "np.ndarray") -> None:
+        """Promote high-cosine results into the LRU hot tier"""
+        threshold = settings.vector_hot_tier_threshold
+        for row, doc in zip(rows, documents):
+            vector = row.get("contentVector")
+            if vector is None:
+                continue
+            vec = np.asarray(vector, dtype=np.float32)
+            denom = np.linalg.norm(vec) * np.linalg.norm(query_embedding)
+            if denom == 0.0 or float(vec @ query_embedding) / denom < threshold:
+                continue
+            chunk_id = row.get("id")
+            # Store a copy so downstream in-place sanitization of the
+            # returned documents can't rewrite the tier's entry
+            (doc_copy,) = self._copy_documents([doc])
+            if settings.vector_quantization == "int8":
+                quantized, scales = EmbeddingService.quantize_int8(vec[None, :])
+                entry = (quantized[0], float(scales[0]), doc_copy)
+            else:
+                entry = (vec, None, doc_copy)
+            with self._cache_lock:
+                self._hot[chunk_id] = entry
+                self._hot.move_to_end(chunk_id)
+        with self._cache_lock:
+            while len(self._hot) > settings.vector_hot_tier_size:
+                self._hot.popitem(last=False)
+
+    def _search_azure(
+        self,
+        query: str,
+        k: int,
+        filter: Optional[Dict[str, Any]] = None,
+        embedding: Optional[List[float]] = None,
+        rerank: bool = False,
+    ) -> List[Document]:
+        # Hot tier: skip the network entirely when the in-memory probe
+        # can satisfy the query. Disabled unless vector_hot_tier_size is
+        # set; filtered queries bypass it since the tier can't apply
+        # OData filters.
+        if not rerank and settings.vector_hot_tier_size and not filter:
+            query_embedding = (
+                embedding
+                if embedding is not None
+                else self.embedding_service.embed_text(query)
+            )
+            query_vec = np.asarray(query_embedding, dtype=np.float32)
+            hot = self._probe_hot_tier(query_vec, k)
+            if hot is not None:
+                return hot
+            rows = list(
+                self._run_azure_search(
+                    query,
+                    k,
+                    filter,
+                    query_embedding,
+                    self._SEARCH_SELECT_FIELDS + ["contentVector"],
                 )
             )
-        return documents
+            documents = [self._document_from_result(row) for row in rows]
+            self._promote_hot(rows, documents, query_vec)
+            return documents
+
+        if not rerank:
+            return list(self._iter_azure(query, k, filter, embedding))
+
+        # HNSW scores are approximate; the opt-in rerank over-fetches and
+        # re-orders by exact cosine computed client-side
+        query_embedding = embedding if embedding is not None else self.embedding_service.embed_text(query)
+        rows = list(
+            self._run_azure_search(
+                query,
+                k * 3,
+                filter,
+                query_embedding,
+                self._SEARCH_SELECT_FIELDS + ["contentVector"],
+            )
+        )
+        documents = [self._document_from_result(row) for row in rows]
+        if not rows:
+            return documents
+        matrix = np.asarray(
+            [row["contentVector"] for row in rows], dtype=np.float32
+        )
+        order = _cosine_topk(
+            matrix, np.asarray(query_embedding, dtype=np.float32), k
+        )
+        return [documents[idx] for idx in order]
+
+    async def _search_azure_async(
+        self,
+        query: str,
+        k: int,
+        filter: Optional[Dict[str, Any]] = None,
+        embedding: Optional[List[float]] = None,
+    ) -> List[Document]:
+        """Async variant of _search_azure on the aio SearchClient
+
+        Both the query embedding and the search round-trip become awaits,
+        so one worker can service many concurrent searches instead of
+        pinning a thread per request.
+        """
+        client = azure_clients.search_client_async
+        if client is None:
+            return await anyio.to_thread.run_sync(
+                lambda: self._search_azure(query, k, filter, embedding)
+            )
+        if self._azure_dimensions is None:
+            self._azure_dimensions = self._probe_dimensions()
+
+        query_embedding = (
+            embedding
+            if embedding is not None
+            else await self.embedding_service.aembed_text(query)
+        )
+        vector_query = VectorizedQuery(
+            vector=query_embedding,
+            k_nearest_neighbors=k,
+            fields="contentVector",
+        )
+        azure_filter = self._build_azure_filter(filter)
+
+        results = await client.search(
+            search_text=None,
+            vector_queries=[vector_query],
+            filter=azure_filter,
+            select=self._SEARCH_SELECT_FIELDS,
+        )
+
+        return [self._document_from_result(result) async for result in results]
+
+    @staticmethod
+    def _format_filter_clause(key: str, value: Any) -> str:
+        """Render one metadata filter entry as an OData clause
+
+        Strings have embedded quotes doubled (OData escaping) so values
+        can't break out of the literal; sequences become a single
+        search.in() predicate, which the service executes as one indexed
+        lookup instead of N or-terms.
+        """
+        if isinstance(value, str):
+            escaped = value.replace("'", "''")
+            return f"{key} eq '{escaped}'"
+        if isinstance(value, bool):
+            return f"{key} eq {str(value).lower()}"
+        if isinstance(value, (list, tuple, set)):
+            values = ",".join(
+                str(item).replace("'", "''") for item in value
+            )
+            return f"search.in({key},'{values}',',')"
+        return f"{key} eq {value}"
+
+    @classmethod
+    def _build_azure_filter(cls, filter: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Render a metadata filter dict as an OData filter expression"""
+        if not filter:
+            return None
+        return " and ".join(
+            cls._format_filter_clause(key, value) for key, value in filter.items()
+        )
+
+    @staticmethod
+    def _document_from_result(result: Dict[str, Any]) -> Document:
+        """Convert an Azure Search result row to a LangChain Document"""
+        metadata = {
+            "document_id": result.get("document_id"),
+            "chunk_index": result.get("chunk_index"),
+            "chunk_id": result.get("id"),
+            "source_file": result.get("source"),
+            "score": result.get("@search.score"),
+        }
+        page = result.get("page")
+        if page is not None:
+            metadata["page"] = page
+        metadata_json = result.get("metadata_json")
+        if metadata_json:
+            try:
+                parsed_metadata = orjson.loads(metadata_json)
+                if isinstance(parsed_metadata, dict):
+                    metadata.update(parsed_metadata)
+            except orjson.JSONDecodeError:
+                pass
+
+        # Ensure document_id exists and is string-typed for downstream validation
+        document_id = metadata.get("document_id") or result.get("document_id")
+        if not document_id:
+            document_id = metadata.get("source_document_id") or metadata.get("chunk_id")
+        if document_id is not None:
+            metadata["document_id"] = str(document_id)
+
+        return Document(
+            page_content=result.get("content", ""),
+            metadata=metadata,
+        )
 
 
 class _AzureSearchRetriever:
@@ -571,11 +1424,20 @@ class _AzureSearchRetriever:
     def __init__(self, store: VectorStore, search_kwargs: Dict[str, Any]):
         self.store = store
         self.search_kwargs = search_kwargs
+        # Resolve kwargs and the target callable once; invoke becomes a
+        # single bound call with no dict lookups or type dispatch on the
+        # hot path (search_kwargs are immutable after construction)
+        k = search_kwargs.get("k", 5)
+        filter = search_kwargs.get("filter")
+        if search_kwargs.get("stream") and store.vector_store_type == "azure_search":
+            # Lazy variant: results stream as the service returns them,
+            # so consumers can stop early
+            self._invoke = partial(store._iter_azure, k=k, filter=filter)
+        else:
+            self._invoke = partial(store.similarity_search, k=k, filter=filter)
 
     def invoke(self, query: str) -> List[Document]:
-        k = self.search_kwargs.get("k", 5)
-        filter = self.search_kwargs.get("filter")
-        return self.store.similarity_search(query=query, k=k, filter=filter)
+        return self._invoke(query)
     
     def is_initialized(self) -> bool:
         """Check if vector store is initialized"""
@@ -3,11 +3,33 @@ File handling utilities
 """
 import os
 import hashlib
+import mmap
+import stat
 from pathlib import Path
 from typing import Optional, Tuple
 import mimetypes
 
 
+# Chunk size for streaming file hashes; blake2b releases the GIL for
+# updates this large, so other threads keep running while we hash
+_HASH_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
+def _hash_file(file_path: str) -> str:
+    """Hash a file's contents without holding more than one chunk in memory"""
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for start in range(0, len(mm), _HASH_CHUNK_SIZE):
+                    hasher.update(mm[start:start + _HASH_CHUNK_SIZE])
+        except (ValueError, OSError):
+            # Empty or unmappable files: plain read loop
+            while chunk := f.read(_HASH_CHUNK_SIZE):
+                hasher.update(chunk)
+    return hasher.hexdigest()
+
+
 def get_file_extension(filename: str) -> str:
     """Get file extension in lowercase"""
     return os.path.splitext(filename)[1].lower()
@@ -25,11 +47,31 @@ def get_file_size(file_path: str) -> int:
     return os.path.getsize(file_path)
 
 
-def generate_document_id(file_path: str, content: Optional[bytes] = None) -> str:
-    """Generate unique document ID from file path or content"""
+def generate_document_id(
+    file_path: str,
+    content: Optional[bytes] = None,
+    digest: Optional[str] = None,
+) -> str:
+    """
+    Generate unique document ID from file path or content
+
+    Callers that hash the content incrementally (e.g. while streaming an
+    upload to disk) can pass the finished hex digest instead of the content.
+    Given only a path to an existing file, the file is mmapped and hashed
+    in 1 MiB chunks, so the ID reflects the content without ever loading
+    the whole file; only a nonexistent path falls back to hashing the
+    path string itself.
+
+    blake2b runs notably faster than md5 on large payloads while keeping
+    the same 32-hex-char ID shape at digest_size=16.
+    """
+    if digest:
+        return digest
     if content:
-        return hashlib.md5(content).hexdigest()
-    return hashlib.md5(file_path.encode()).hexdigest()[:16]
+        return hashlib.blake2b(content, digest_size=16).hexdigest()
+    if os.path.isfile(file_path):
+        return _hash_file(file_path)
+    return hashlib.blake2b(file_path.encode(), digest_size=16).hexdigest()[:16]
 
 
 def generate_chunk_id(document_id: str, chunk_index: int) -> str:
@@ -37,9 +79,30 @@ def generate_chunk_id(document_id: str, chunk_index: int) -> str:
     return f"{document_id}_chunk_{chunk_index}"
 
 
+def generate_chunk_content_hash(text: str) -> str:
+    """Hash chunk text for content-based deduplication"""
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+# MIME types for the extensions is_supported_file_type accepts; a dict
+# get here beats mimetypes.guess_type, which lazily parses the OS mime
+# tables and routes every call through urllib's URL splitter
+_MIME_TYPES = {
+    ".pdf": "application/pdf",
+    ".docx": "application/vnd.openxmlformats-officedocument"
+             ".wordprocessingml.document",
+    ".txt": "text/plain",
+    ".md": "text/markdown",
+}
+
+
 def get_mime_type(filename: str) -> str:
     """Get MIME type for file"""
-    mime_type, _ = mimetypes.guess_type(filename)
+    ext = get_file_extension(filename)
+    mime_type = _MIME_TYPES.get(ext)
+    if mime_type is None:
+        # Unsupported extensions still get a best-effort guess
+        mime_type, _ = mimetypes.guess_type(filename)
     return mime_type or "application/octet-stream"
 
 
@@ -47,28 +110,34 @@ def validate_file_path(file_path: str) -> Tuple[bool, Optional[str]]:
     """
     Validate file path exists and is readable
     Returns: (is_valid, error_message)
+
+    One os.stat answers both the existence and regular-file checks that
+    previously took separate syscalls; the access check stays because
+    permission semantics aren't derivable from the stat result alone.
     """
-    if not os.path.exists(file_path):
+    try:
+        st = os.stat(file_path)
+    except OSError:
         return False, f"File not found: {file_path}"
-    
-    if not os.path.isfile(file_path):
+
+    if not stat.S_ISREG(st.st_mode):
         return False, f"Path is not a file: {file_path}"
-    
+
     if not os.access(file_path, os.R_OK):
         return False, f"File is not readable: {file_path}"
-    
+
     return True, None
 
 
+# Translation table mapping filesystem-invalid characters to '_',
+# applied in a single C-level pass instead of one replace() per char
+_INVALID_FILENAME_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename for storage"""
-    # Remove path components
-    filename = os.path.basename(filename)
-    # Remove or replace invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
-    return filename
+    # Remove path components, then replace invalid characters
+    return os.path.basename(filename).translate(_INVALID_FILENAME_TABLE)
 
 
 def ensure_directory_exists(directory: str) -> None:
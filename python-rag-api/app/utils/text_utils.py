@@ -1,14 +1,43 @@
 """
 Text processing utilities
 """
+import os
 import re
+from collections import Counter
 from typing import List, Optional
 
+try:
+    # cl100k_base matches the OpenAI chat/embedding models this API
+    # targets; fall back to the character heuristic when unavailable
+    import tiktoken
+    _ENCODING = tiktoken.get_encoding("cl100k_base")
+except Exception:  # pragma: no cover - optional dependency
+    _ENCODING = None
+
+
+# Patterns compiled once at import; these run on every chunk during
+# ingest, so per-call re.compile cache lookups add up
+_WS_RE = re.compile(r'\s+')
+_SENT_RE = re.compile(r'[.!?]+\s+')
+_KEYWORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+_SPECIAL_KEEP_RE = re.compile(r'[^a-zA-Z0-9\s.,!?;:\-()\[\]{}"\']')
+_SPECIAL_STRIP_RE = re.compile(r'[^a-zA-Z0-9\s]')
+_PARA_RE = re.compile(r'\n\s*\n')
+
+# Common stop words excluded from keyword extraction (simplified list)
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
+    'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
+    'would', 'should', 'could', 'may', 'might', 'must', 'can', 'this',
+    'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they'
+})
+
 
 def clean_text(text: str) -> str:
     """Clean and normalize text"""
     # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WS_RE.sub(' ', text)
     # Remove leading/trailing whitespace
     text = text.strip()
     return text
@@ -24,48 +53,52 @@ def truncate_text(text: str, max_length: int = 200, suffix: str = "...") -> str:
 def extract_sentences(text: str) -> List[str]:
     """Extract sentences from text"""
     # Simple sentence splitting (can be improved with NLP libraries)
-    sentences = re.split(r'[.!?]+\s+', text)
+    sentences = _SENT_RE.split(text)
     return [s.strip() for s in sentences if s.strip()]
 
 
 def count_tokens_approx(text: str) -> int:
     """
-    Approximate token count (rough estimate: 1 token ≈ 4 characters)
-    For accurate counts, use tiktoken library
+    Token count via tiktoken when installed (encode_ordinary skips the
+    special-token regex), else a rough estimate of 1 token ≈ 4 characters
     """
+    if _ENCODING is not None:
+        return len(_ENCODING.encode_ordinary(text))
     return len(text) // 4
 
 
+def count_tokens_batch(texts: List[str]) -> List[int]:
+    """Token counts for many texts at once
+
+    tiktoken's batch encoder tokenizes across threads in Rust, so
+    counting a whole document's chunks costs about one chunk's worth of
+    Python overhead.
+    """
+    if _ENCODING is not None:
+        encoded = _ENCODING.encode_ordinary_batch(texts, num_threads=os.cpu_count() or 1)
+        return [len(tokens) for tokens in encoded]
+    return [len(text) // 4 for text in texts]
+
+
 def extract_keywords(text: str, max_keywords: int = 10) -> List[str]:
     """
     Extract keywords from text (simple implementation)
     For production, consider using NLP libraries like spaCy or NLTK
     """
-    # Remove common stop words (simplified list)
-    stop_words = {
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-        'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
-        'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-        'would', 'should', 'could', 'may', 'might', 'must', 'can', 'this',
-        'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they'
-    }
-    
-    # Extract words (alphanumeric, at least 3 characters)
-    words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
-    
-    # Filter stop words and get unique words
-    keywords = [w for w in words if w not in stop_words]
-    
-    # Count frequency and return top keywords
-    from collections import Counter
-    word_freq = Counter(keywords)
+    # Single pass: count matched words as they stream out of finditer,
+    # skipping stop words, without materialising intermediate lists
+    word_freq = Counter(
+        match.group()
+        for match in _KEYWORD_RE.finditer(text.lower())
+        if match.group() not in _STOP_WORDS
+    )
     return [word for word, _ in word_freq.most_common(max_keywords)]
 
 
 def normalize_whitespace(text: str) -> str:
     """Normalize whitespace characters"""
     # Replace various whitespace with single space
-    text = re.sub(r'\s+', ' ', text)
+    text = _WS_RE.sub(' ', text)
     # Remove leading/trailing whitespace
     return text.strip()
 
@@ -74,14 +107,18 @@ def remove_special_characters(text: str, keep_punctuation: bool = True) -> str:
     """Remove special characters, optionally keep punctuation"""
     if keep_punctuation:
         # Keep alphanumeric, spaces, and common punctuation
-        return re.sub(r'[^a-zA-Z0-9\s.,!?;:\-()\[\]{}"\']', '', text)
+        return _SPECIAL_KEEP_RE.sub('', text)
     else:
         # Keep only alphanumeric and spaces
-        return re.sub(r'[^a-zA-Z0-9\s]', '', text)
+        return _SPECIAL_STRIP_RE.sub('', text)
 
 
 def split_into_paragraphs(text: str) -> List[str]:
-    """Split text into paragraphs"""
-    paragraphs = text.split('\n\n')
-    return [p.strip() for p in paragraphs if p.strip()]
+    """Split text into paragraphs
+
+    One compiled-regex pass that also treats blank lines containing
+    whitespace (or \\r\\n pairs) as breaks, which a plain '\\n\\n' split
+    misses; each paragraph is stripped exactly once.
+    """
+    return [p for p in map(str.strip, _PARA_RE.split(text)) if p]
 
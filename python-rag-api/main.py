@@ -2,25 +2,45 @@
 FastAPI application entry point
 """
 import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from dotenv import load_dotenv
 
 from app.core.config import settings
 from app.core.logging_config import logger, LoggingRouteHandler
-from app.api.endpoints import health, documents, chat
 
-# Load environment variables
+# Load environment variables before anything touches settings
 load_dotenv()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Register the API routers at startup instead of import
+
+    The endpoint modules pull in LangChain, ChromaDB, and the Azure
+    SDKs; importing them here keeps `import main` lightweight and moves
+    the heavy imports off the cold-start critical path of anything that
+    only needs the app object.
+    """
+    # Single aggregated registration; see app/api/routes.py
+    from app.api.routes import api_router
+
+    app.include_router(api_router)
+    yield
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.api_title,
     version=settings.api_version,
     description=settings.api_description,
     debug=settings.debug,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Use custom route handler for logging
@@ -35,11 +55,6 @@ app.add_middleware(
     allow_headers=settings.cors_allow_headers,
 )
 
-# Include routers
-app.include_router(health.router)
-app.include_router(documents.router)
-app.include_router(chat.router)
-
 
 # Exception handlers for better error logging
 @app.exception_handler(RequestValidationError)
@@ -59,7 +74,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         f"Errors: {error_details}"
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": "Validation Error",
@@ -78,7 +93,7 @@ async def general_exception_handler(request: Request, exc: Exception):
         exc_info=True,
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": "Internal Server Error",